@@ -0,0 +1,244 @@
+import numpy as np
+import pandas as pd
+
+from indicator_engine import compute_indicator_series, TECH_THRESHOLDS
+
+# --- DRAGNET / SCOUT REPLAY ---
+# Walks stored daily bars date by date (all dates at once, as 2-D arrays) and
+# asks: which names would the dragnet have shortlisted that day, which would
+# the scout have approved, and what did they do next?
+# Mirrors classify_technicals, build_dragnet_output and score_candidate; the
+# earnings guard is not replayed (no point-in-time calendar history).
+
+CATEGORIES = ["trend_targets", "survivor_targets", "wheel_targets", "condor_targets", "short_targets"]
+HORIZONS = (1, 5, 20)
+TOP_N = 10
+
+# --years replays from a separate deep-history bar store, so the dragnet's
+# store (trimmed to bar_store.KEEP_DAYS on every write) is left alone
+DEEP_CACHE_DIR = "bar_cache_deep"
+WARMUP_DAYS = 300          # Calendar days covering the 200-bar SMA warm-up
+DEEP_FETCH_CHUNK = 50      # Symbols per request; multi-year histories are big
+DEEP_FETCH_WORKERS = 2
+
+# score_candidate's weighting: tech base plus one slot per source, a missing
+# source's weight goes to tech
+TECH_WEIGHT = 0.30
+SOURCE_WEIGHTS = {"tier1_news": 0.30, "tier2_news": 0.20, "tier3_news": 0.10, "social": 0.10}
+APPROVAL_THRESHOLD = 0.50
+
+# normalize_tech_score divisors per category
+TECH_SCALE = {"trend_targets": 100.0, "survivor_targets": 30.0, "wheel_targets": 10.0,
+              "condor_targets": 15.0, "short_targets": 100.0}
+
+
+def classify_panel(price, rsi, adx, sma200, th=TECH_THRESHOLDS):
+    """
+    classify_technicals over whole (dates x symbols) arrays.
+    Returns (category code array, -1 = unlisted; score array). Rule order is
+    preserved: a cell takes the first rule it matches.
+    """
+    with np.errstate(invalid="ignore"):
+        ok = ~(np.isnan(price) | np.isnan(rsi) | np.isnan(adx) | np.isnan(sma200))
+        above = price > sma200
+        rules = [
+            (above & (adx > th["trend_adx_min"]) & (rsi > th["trend_rsi_min"]) & (rsi < th["trend_rsi_max"]), adx),
+            (above & (rsi < th["survivor_rsi_max"]), 50 - rsi),
+            (above & (rsi >= th["wheel_rsi_min"]) & (rsi <= th["wheel_rsi_max"]), 50 - rsi),
+            ((adx < th["condor_adx_max"]) & (rsi > th["condor_rsi_min"]) & (rsi < th["condor_rsi_max"]), 20 - adx),
+            (price < sma200, adx),
+        ]
+    category = np.full(price.shape, -1, dtype=np.int8)
+    score = np.full(price.shape, np.nan)
+    free = ok
+    for code, (match, value) in enumerate(rules):
+        hit = free & match
+        category[hit] = code
+        score[hit] = value[hit]
+        free = free & ~hit
+    return category, score
+
+def top_picks(category, score, top_n=TOP_N):
+    """
+    build_dragnet_output for every date: the top `top_n` per list by score,
+    ties in symbol order. Returns flat arrays (date_idx, sym_idx, category, score).
+    """
+    out = []
+    for code in range(len(CATEGORIES)):
+        s = np.where(category == code, score, -np.inf)
+        idx = np.argsort(-s, axis=1, kind="stable")[:, :top_n]
+        picked = np.take_along_axis(s, idx, axis=1)
+        rows, cols = np.nonzero(picked > -np.inf)
+        out.append((rows, idx[rows, cols], np.full(len(rows), code, dtype=np.int8), picked[rows, cols]))
+    return tuple(np.concatenate(parts) for parts in zip(*out))
+
+def normalize_tech_scores(score, category):
+    """normalize_tech_score for arrays of picks."""
+    scale = np.array([TECH_SCALE[c] for c in CATEGORIES])[category]
+    return np.clip(score / scale, 0.0, 1.0)
+
+def score_confidence(tech_norm, verdicts=None):
+    """
+    score_candidate's weighted confidence. `verdicts` maps source type to an
+    array of LLM scores (NaN = no data for that source).
+    """
+    verdicts = verdicts or {}
+    tech_weight = np.full(tech_norm.shape, TECH_WEIGHT)
+    total = np.zeros(tech_norm.shape)
+    for source, weight in SOURCE_WEIGHTS.items():
+        v = verdicts.get(source)
+        if v is None:
+            tech_weight += weight
+            continue
+        present = ~np.isnan(v)
+        total += np.where(present, v * weight, 0.0)
+        tech_weight += np.where(present, 0.0, weight)
+    return total + tech_norm * tech_weight
+
+
+class MockVerdicts:
+    """
+    Stand-in for the news/Reddit LLM verdicts. Each source is present with
+    probability `coverage[source]`; `skill` blends uniform noise (0.0) with a
+    perfect-foresight verdict on the `horizon` forward return (1.0).
+    """
+
+    DEFAULT_COVERAGE = {"tier1_news": 0.3, "tier2_news": 0.6, "tier3_news": 0.2, "social": 0.4}
+
+    def __init__(self, coverage=None, skill=0.0, horizon=5, seed=0):
+        self.coverage = coverage if coverage is not None else dict(self.DEFAULT_COVERAGE)
+        self.skill = skill
+        self.horizon = horizon
+        self.seed = seed
+
+    def __call__(self, category, fwd):
+        """category: pick category codes; fwd: {h: forward returns of each pick}."""
+        rng = np.random.default_rng(self.seed)
+        short = category == CATEGORIES.index("short_targets")
+        with np.errstate(invalid="ignore"):
+            favorable = np.where(short, fwd[self.horizon] < 0, fwd[self.horizon] > 0).astype(float)
+        verdicts = {}
+        for source, p in self.coverage.items():
+            v = self.skill * favorable + (1 - self.skill) * rng.uniform(size=len(category))
+            v[rng.uniform(size=len(category)) >= p] = np.nan
+            verdicts[source] = v
+        return verdicts
+
+
+def liquid_mask(price, avg_volume, min_volume, min_price, max_price):
+    """is_liquid for every cell."""
+    with np.errstate(invalid="ignore"):
+        return (avg_volume > min_volume) & (price > min_price) & (price < max_price)
+
+def replay(data, symbols=None, horizons=HORIZONS, top_n=TOP_N, verdicts=None, start=None, end=None,
+           thresholds=TECH_THRESHOLDS, liquidity=None):
+    """
+    Runs the dragnet + scout over every date in `data` (yf.download-shaped panel).
+    verdicts: None for tech-only scoring, or callable(category, fwd) -> {source: scores}.
+    liquidity: optional (min_volume, min_price, max_price) applied before classification.
+    Returns (picks DataFrame, report DataFrame).
+    """
+    symbols = list(symbols) if symbols is not None else list(data.columns.get_level_values(0).unique())
+    syms, dates, series = compute_indicator_series(data, symbols, horizons=horizons)
+    if not syms:
+        return pd.DataFrame(), pd.DataFrame()
+    category, score = classify_panel(series["price"], series["rsi"], series["adx"], series["sma200"], thresholds)
+    if liquidity is not None:
+        category[~liquid_mask(series["price"], series["avg_volume"], *liquidity)] = -1
+
+    in_window = np.ones(len(dates), dtype=bool)
+    if start is not None: in_window &= dates >= pd.Timestamp(start)
+    if end is not None: in_window &= dates <= pd.Timestamp(end)
+    category[~in_window] = -1
+
+    d, j, cat, sc = top_picks(category, score, top_n)
+    fwd = {h: series[f"fwd_{h}"][d, j] for h in horizons}
+    tech_norm = normalize_tech_scores(sc, cat)
+    confidence = score_confidence(tech_norm, verdicts(cat, fwd) if verdicts else None)
+
+    picks = pd.DataFrame({
+        "date": dates[d], "symbol": np.asarray(syms, dtype=object)[j],
+        "category": np.asarray(CATEGORIES, dtype=object)[cat], "tech_score": sc,
+        "confidence": confidence, "approved": confidence > APPROVAL_THRESHOLD,
+        **{f"fwd_{h}": fwd[h] for h in horizons},
+    }).sort_values(["date", "category", "tech_score"], ascending=[True, True, False], kind="stable")
+
+    # Universe baseline: every valid cell in the window
+    baseline = {}
+    for h in horizons:
+        all_fwd = series[f"fwd_{h}"][in_window]
+        all_fwd = all_fwd[~np.isnan(all_fwd)]
+        baseline[h] = float(all_fwd.mean()) if len(all_fwd) else np.nan
+
+    return picks.reset_index(drop=True), report(picks, horizons, baseline)
+
+def report(picks, horizons=HORIZONS, baseline=None):
+    """Per category and horizon: pick count, mean forward return, directional hit rate, and the same for approved picks."""
+    rows = []
+    for name in CATEGORIES:
+        sub = picks[picks["category"] == name]
+        direction = -1.0 if name == "short_targets" else 1.0
+        for h in horizons:
+            r = sub[f"fwd_{h}"]
+            known = r.notna()
+            appr = known & sub["approved"]
+            rows.append({
+                "category": name, "horizon": h, "picks": int(known.sum()),
+                "mean_return": r[known].mean(),
+                "hit_rate": ((r[known] * direction) > 0).mean(),
+                "approved": int(appr.sum()),
+                "approved_mean_return": r[appr].mean(),
+                "approved_hit_rate": ((r[appr] * direction) > 0).mean(),
+                "universe_mean_return": (baseline or {}).get(h, np.nan),
+            })
+    return pd.DataFrame(rows)
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+    from bar_store import BarStore, HISTORY_DAYS
+    from market_scanner import MIN_VOLUME, MIN_PRICE, MAX_PRICE
+    parser = argparse.ArgumentParser(description="Replay the dragnet classifier and scout scoring over stored bars")
+    parser.add_argument("--start", help="First replay date (YYYY-MM-DD)")
+    parser.add_argument("--end", help="Last replay date (YYYY-MM-DD)")
+    parser.add_argument("--horizons", default=",".join(map(str, HORIZONS)), help="Forward return horizons in bars")
+    parser.add_argument("--top", type=int, default=TOP_N, help="Picks per list per day")
+    parser.add_argument("--skill", type=float, help="Mock LLM skill 0..1 (omit for tech-only scoring)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--picks-csv", help="Write every pick to this CSV")
+    parser.add_argument("--years", type=float,
+                        help=f"Replayable years; fetches deep history into {DEEP_CACHE_DIR}/ (default: the dragnet's store)")
+    parser.add_argument("--symbols", help="Comma separated symbols for --years (default: the dragnet's fully seeded names)")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    store = BarStore()
+    if args.symbols:
+        symbols = [s.strip().upper() for s in args.symbols.split(",") if s.strip()]
+    elif args.years:
+        # Only names the dragnet keeps a full history for, not every symbol it ever wrote
+        symbols = store.symbols(min_history_days=HISTORY_DAYS)
+    else:
+        symbols = store.symbols()
+    if args.years:
+        history_days = int(args.years * 365) + WARMUP_DAYS
+        store = BarStore(root=DEEP_CACHE_DIR, keep_days=history_days, chunk_size=DEEP_FETCH_CHUNK,
+                         workers=DEEP_FETCH_WORKERS)
+        print(f"   -> Deep history: {len(symbols)} symbols x {history_days} days into {DEEP_CACHE_DIR}/ ...")
+        stats = store.update(symbols, history_days=history_days,
+                             progress=lambda done, total: print(f"      {done}/{total}", end="\r", flush=True))
+        print(f"   -> Deep store: {stats['full']} full / {stats['delta']} delta symbols, {stats['bars']} bars fetched, "
+              f"{stats['failed_chunks']} failed chunks.")
+    data = store.panel(symbols)
+    horizons = tuple(int(h) for h in args.horizons.split(","))
+    verdicts = MockVerdicts(skill=args.skill, horizon=horizons[0], seed=args.seed) if args.skill is not None else None
+    # Same liquidity gate the dragnet applies before classifying, evaluated per day
+    picks, table = replay(data, symbols, horizons, args.top, verdicts, args.start, args.end,
+                          liquidity=(MIN_VOLUME, MIN_PRICE, MAX_PRICE))
+    print(f"--- 📼 REPLAY: {len(symbols)} symbols, {picks['date'].nunique() if len(picks) else 0} days, "
+          f"{len(picks)} picks in {time.perf_counter() - t0:.1f}s ---")
+    with pd.option_context("display.width", 160, "display.float_format", "{:.4f}".format):
+        print(table.to_string(index=False))
+    if args.picks_csv:
+        picks.to_csv(args.picks_csv, index=False)
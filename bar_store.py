@@ -0,0 +1,246 @@
+import os
+import json
+import datetime
+import numpy as np
+import pandas as pd
+from chunk_pipeline import run_chunked
+
+# --- CONFIGURATION ---
+BAR_CACHE_DIR = "bar_cache"
+INDEX_FILE = "index.json"
+HISTORY_DAYS = 730       # ~2y of daily bars (matches the old period="2y")
+KEEP_DAYS = 800          # Trim anything older than this on write
+FETCH_CHUNK = 200
+FETCH_WORKERS = 4        # Chunk downloads in flight (chunk_pipeline.run_chunked)
+RESCALE_TOLERANCE = 1e-3 # Relative Open mismatch on the overlap bar that means Yahoo re-adjusted history
+
+FIELDS = ("Open", "High", "Low", "Close", "Volume")
+BAR_DTYPE = np.dtype([
+    ("date", "M8[D]"),
+    ("Open", "f8"), ("High", "f8"), ("Low", "f8"), ("Close", "f8"), ("Volume", "f8"),
+])
+
+
+# --- FETCHERS ---
+def split_download(df, symbols):
+    """
+    Splits a yf.download(group_by='ticker') frame into {symbol: DataFrame}.
+    Handles both the MultiIndex shape and the flat single-ticker shape.
+    """
+    out = {}
+    if df is None or df.empty:
+        return out
+    if isinstance(df.columns, pd.MultiIndex):
+        level0 = set(df.columns.get_level_values(0))
+        for sym in symbols:
+            if sym not in level0: continue
+            sub = df[sym].dropna(how='all')
+            if not sub.empty:
+                out[sym] = sub
+    elif len(symbols) == 1:
+        sub = df.dropna(how='all')
+        if not sub.empty:
+            out[symbols[0]] = sub
+    return out
+
+def yfinance_fetcher(symbols, start):
+    """Default fetcher: daily bars from Yahoo for `symbols` since `start` (inclusive)."""
+    import yfinance as yf
+    df = yf.download(symbols, start=start.isoformat(), interval="1d", group_by='ticker',
+                     progress=False, threads=True)
+    return split_download(df, symbols)
+
+
+def _to_records(df):
+    """DataFrame (DatetimeIndex, OHLCV columns) -> BAR_DTYPE array sorted by date."""
+    idx = pd.DatetimeIndex(df.index)
+    if idx.tz is not None:
+        idx = idx.tz_localize(None)
+    rec = np.empty(len(df), dtype=BAR_DTYPE)
+    rec["date"] = idx.normalize().values.astype("M8[D]")
+    for field in FIELDS:
+        rec[field] = df[field].to_numpy(dtype="f8") if field in df.columns else np.nan
+    rec = rec[~np.isnan(rec["Close"])]
+    rec = np.sort(rec, order="date")
+    # Keep the last row for any duplicated date
+    keep = np.append(rec["date"][1:] != rec["date"][:-1], True)
+    return rec[keep]
+
+
+# --- STORE ---
+class BarStore:
+    """
+    Persistent daily OHLCV cache: one memory-mapped .npy file per symbol.
+    Each update() only asks the fetcher for bars from the last stored date onward.
+    The last stored bar is always re-fetched because intraday runs store a partial bar.
+    That overlap bar also catches split/dividend re-adjustment (yfinance's
+    auto_adjust rescales the whole history): a symbol whose overlap bar moved
+    is listed in `rescaled`, loses its stored history and is fully re-fetched.
+    """
+
+    def __init__(self, root=BAR_CACHE_DIR, fetcher=None, keep_days=KEEP_DAYS, chunk_size=FETCH_CHUNK,
+                 workers=FETCH_WORKERS):
+        self.root = root
+        self.fetcher = fetcher or yfinance_fetcher
+        self.keep_days = keep_days
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.rescaled = set()    # Symbols whose stored history was dropped as mis-scaled
+        os.makedirs(self.root, exist_ok=True)
+        self._index = self._load_index()
+
+    # --- Index (history depth per symbol) ---
+    def _index_path(self):
+        return os.path.join(self.root, INDEX_FILE)
+
+    def _load_index(self):
+        try:
+            with open(self._index_path(), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self):
+        tmp = self._index_path() + ".tmp"
+        with open(tmp, 'w') as f:
+            json.dump(self._index, f)
+        os.replace(tmp, self._index_path())
+
+    def symbols(self, min_history_days=None):
+        """Every symbol with stored history (at least `min_history_days` deep, if given)."""
+        if min_history_days is None:
+            return sorted(self._index)
+        return sorted(sym for sym, depth in self._index.items() if depth >= min_history_days)
+
+    # --- Per-symbol files ---
+    def path(self, symbol):
+        return os.path.join(self.root, f"{symbol}.npy")
+
+    def load(self, symbol, mmap=True):
+        """Returns the stored BAR_DTYPE array (memory-mapped by default) or None."""
+        p = self.path(symbol)
+        if not os.path.exists(p):
+            return None
+        try:
+            return np.load(p, mmap_mode='r' if mmap else None)
+        except (OSError, ValueError):
+            return None
+
+    def last_date(self, symbol):
+        rec = self.load(symbol)
+        if rec is None or len(rec) == 0:
+            return None
+        return rec["date"][-1].astype(datetime.date)
+
+    def frame(self, symbol):
+        """Stored bars as a DataFrame shaped like yfinance output (or None)."""
+        rec = self.load(symbol)
+        if rec is None or len(rec) == 0:
+            return None
+        df = pd.DataFrame({field: np.array(rec[field]) for field in FIELDS},
+                          index=pd.DatetimeIndex(np.array(rec["date"]).astype("M8[ns]"), name="Date"))
+        del rec  # release the mapping (Windows can't replace a mapped file)
+        return df
+
+    def write(self, symbol, df):
+        """Merges fetched bars into the store, replacing any overlapping dates."""
+        new = _to_records(df)
+        if len(new) == 0:
+            return 0
+        old = self.load(symbol, mmap=False)
+        if old is not None and len(old) and self._is_rescaled(old, new):
+            # Stored bars are at the pre-split/dividend scale; keep only the new ones
+            # and drop the depth so update() re-fetches the full history
+            self.rescaled.add(symbol)
+            self._index.pop(symbol, None)
+            old = None
+        if old is not None and len(old):
+            old = old[old["date"] < new["date"][0]]
+            merged = np.concatenate([old, new])
+        else:
+            merged = new
+        cutoff = merged["date"][-1] - np.timedelta64(self.keep_days, "D")
+        merged = merged[merged["date"] >= cutoff]
+        tmp = self.path(symbol) + ".tmp.npy"
+        np.save(tmp, merged)
+        os.replace(tmp, self.path(symbol))
+        return len(new)
+
+    @staticmethod
+    def _is_rescaled(old, new):
+        """
+        Compares the re-fetched copy of the last stored bar with the stored one.
+        Uses Open, which a partial intraday bar already has final, so a moving
+        Close doesn't look like an adjustment.
+        """
+        hit = np.nonzero(new["date"] == old["date"][-1])[0]
+        if not len(hit):
+            return False
+        field = "Open" if not (np.isnan(old["Open"][-1]) or np.isnan(new["Open"][hit[0]])) else "Close"
+        stored, fresh = old[field][-1], new[field][hit[0]]
+        if not stored:
+            return False
+        return abs(fresh - stored) / abs(stored) > RESCALE_TOLERANCE
+
+    # --- Refresh ---
+    def plan(self, symbols, history_days=HISTORY_DAYS, today=None):
+        """
+        Groups symbols by (start date, is_full) so each group is one fetch.
+        Symbols with no (or too shallow) history get a full fetch; the rest get a delta.
+        """
+        today = today or datetime.date.today()
+        full_start = today - datetime.timedelta(days=history_days)
+        groups = {}
+        for sym in symbols:
+            last = self.last_date(sym)
+            if last is None or self._index.get(sym, 0) < history_days:
+                key = (full_start, True)
+            else:
+                key = (last, False)
+            groups.setdefault(key, []).append(sym)
+        return groups
+
+    def update(self, symbols, history_days=HISTORY_DAYS, today=None, progress=None):
+        """
+        Fetches only the missing bars for `symbols`. Returns a stats dict;
+        stats["rescaled"] lists symbols re-seeded after a split/dividend
+        re-adjustment (callers holding derived state should rebuild those).
+        progress(done, total) is passed to run_chunked for each fetch group.
+        """
+        stats = {"symbols": len(symbols), "requests": 0, "bars": 0, "full": 0, "delta": 0,
+                 "failed_chunks": 0, "no_data": 0, "rescaled": []}
+        self.rescaled = set()
+        self._fetch(self.plan(symbols, history_days, today), history_days, stats, progress)
+        if self.rescaled:
+            # Same run, so nothing downstream sees the truncated history
+            stats["rescaled"] = sorted(self.rescaled)
+            self._fetch(self.plan(stats["rescaled"], history_days, today), history_days, stats, progress)
+        self._save_index()
+        return stats
+
+    def _fetch(self, groups, history_days, stats, progress=None):
+        for (start, is_full), group in sorted(groups.items()):
+
+            def store_chunk(chunk, fetched):
+                for sym, df in fetched.items():
+                    stats["bars"] += self.write(sym, df)
+                    if is_full:
+                        self._index[sym] = max(self._index.get(sym, 0), history_days)
+
+            result = run_chunked(group, lambda chunk: self.fetcher(chunk, start), store_chunk,
+                                 chunk_size=self.chunk_size, workers=self.workers, progress=progress)
+            stats["requests"] += result.chunks
+            stats["failed_chunks"] += result.failed_chunks
+            stats["no_data"] += len(result.failed_symbols)
+            stats["full" if is_full else "delta"] += len(group)
+
+    def panel(self, symbols):
+        """MultiIndex (symbol, field) frame for `symbols`, same shape as yf.download(group_by='ticker')."""
+        frames = {}
+        for sym in symbols:
+            df = self.frame(sym)
+            if df is not None:
+                frames[sym] = df
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, axis=1)
@@ -0,0 +1,95 @@
+import os
+import json
+import time
+import datetime
+import numpy as np
+import pandas as pd
+
+# --- RECORDED FIXTURES ---
+# Payloads in fixtures/ were captured once and templated: "{ticker}" and
+# "{ticker_lower}" are filled in per symbol, and timestamps are shifted so the
+# newest item is as old now as it was at `recorded_at` (the 7-day news window
+# keeps seeing the same items no matter when the suite runs).
+# OHLCV is generated from a fixed seed instead of stored; at 1000 symbols x
+# 2 years a recording would be tens of megabytes for no extra realism.
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+OHLCV_SEED = 20240603
+
+_cache = {}
+
+def _raw(name):
+    if name not in _cache:
+        with open(os.path.join(FIXTURE_DIR, name), 'r', encoding='utf-8') as f:
+            _cache[name] = f.read()
+    return _cache[name]
+
+def load(name, ticker=None):
+    """Parsed fixture, with the ticker placeholders filled in."""
+    text = _raw(name)
+    if ticker is not None:
+        text = text.replace("{ticker_lower}", ticker.lower()).replace("{ticker}", ticker)
+    return json.loads(text)
+
+
+def news_payload(ticker, shape="old", now=None):
+    """yfinance `Ticker.news` list in the old (flat) or new ("content") shape."""
+    fixture = load(f"news_{shape}.json", ticker)
+    shift = (now or time.time()) - fixture["recorded_at"]
+    items = fixture["items"]
+    for item in items:
+        if "providerPublishTime" in item:
+            item["providerPublishTime"] = int(item["providerPublishTime"] + shift)
+        info = item.get("content")
+        if info and info.get("pubDate"):
+            dt = datetime.datetime.strptime(info["pubDate"], "%Y-%m-%dT%H:%M:%SZ")
+            dt = dt.replace(tzinfo=datetime.timezone.utc) + datetime.timedelta(seconds=shift)
+            info["pubDate"] = dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    return items
+
+def reddit_listing(ticker):
+    return load("reddit_search.json", ticker)
+
+def ollama_responses():
+    return load("ollama_responses.json")
+
+
+class FakeTicker:
+    """Stand-in for yf.Ticker serving fixture news; alternates shapes by symbol."""
+
+    def __init__(self, symbol):
+        self.ticker = symbol
+
+    @property
+    def news(self):
+        shape = "content" if sum(map(ord, self.ticker)) % 2 else "old"
+        return news_payload(self.ticker, shape)
+
+
+def make_ohlcv(n_symbols, days=500, seed=OHLCV_SEED, start="2023-06-01"):
+    """Multi-symbol frame shaped like yf.download(group_by='ticker'), deterministic per seed."""
+    rng = np.random.default_rng(seed)
+    idx = pd.bdate_range(start, periods=days, name="Date")
+    frames = {}
+    for k in range(n_symbols):
+        drift = rng.normal(0.0003, 0.0006)
+        vol = rng.uniform(0.01, 0.035)
+        close = rng.uniform(15, 300) * np.exp(np.cumsum(rng.normal(drift, vol, days)))
+        spread = rng.uniform(0, vol, (2, days))
+        frames[f"S{k:04d}"] = pd.DataFrame({
+            "Open": close * (1 + rng.normal(0, vol / 3, days)),
+            "High": close * (1 + spread[0]),
+            "Low": close * (1 - spread[1]),
+            "Close": close,
+            "Volume": rng.lognormal(14.5, 0.8, days).round(),
+        }, index=idx)
+    return pd.concat(frames, axis=1)
+
+def make_candidates(n_tickers):
+    """dragnet_candidates.json-shaped dict spreading n tickers over the five lists."""
+    categories = ["trend_targets", "survivor_targets", "wheel_targets", "condor_targets", "short_targets"]
+    out = {c: [] for c in categories}
+    for i in range(n_tickers):
+        cat = categories[i % len(categories)]
+        out[cat].append({"symbol": f"B{i:04d}", "tech_score": round(5 + (i * 7.3) % 40, 2)})
+    return out
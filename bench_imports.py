@@ -0,0 +1,67 @@
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+# --- COLD-START BENCHMARK ---
+# Times each entry point in a fresh interpreter, from the first import up to
+# the point where it can decide there is nothing to do: the dragnet's
+# gatekeeper and the scout's get_candidates() staleness check. The "eager"
+# rows import the heavy modules first, which is what both entry points did
+# before lazy_imports, so the difference is the start-up the lazy path saves.
+#
+#   python bench_imports.py [--repeat 5]
+
+HEAVY = ("pandas", "numpy", "yfinance", "alpaca", "requests", "config")
+
+ENTRY_POINTS = {
+    "market_scanner": "import market_scanner\nmarket_scanner.is_mission_time()",
+    "sector_scout_3": "import sector_scout_3\nsector_scout_3.get_candidates()",
+}
+
+EAGER_PRELOAD = {
+    "market_scanner": "import pandas, numpy, yfinance, alpaca.trading.client, requests",
+    "sector_scout_3": "import yfinance, requests, config",
+}
+
+_PROBE = """
+import io, sys, json, time, contextlib
+t0 = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+{body}
+elapsed = time.perf_counter() - t0
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def probe(code):
+    """Runs `code` in a new interpreter; returns {"seconds", "loaded"}."""
+    body = "\n".join("    " + line for line in code.splitlines())
+    script = _PROBE.format(body=body, heavy=HEAVY)
+    out = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+def bench_entry(name, repeat=5, eager=False):
+    code = ENTRY_POINTS[name]
+    if eager:
+        code = EAGER_PRELOAD[name] + "\n" + code
+    runs = [probe(code) for _ in range(repeat)]
+    return {"seconds": statistics.median(r["seconds"] for r in runs), "loaded": runs[-1]["loaded"]}
+
+def run_bench(repeat=5, out=sys.stdout):
+    print(f"{'entry point':<16} {'mode':<6} {'median ms':>10}  heavy modules loaded", file=out)
+    results = {}
+    for name in ENTRY_POINTS:
+        for eager in (True, False):
+            mode = "eager" if eager else "lazy"
+            r = results[(name, mode)] = bench_entry(name, repeat, eager)
+            print(f"{name:<16} {mode:<6} {r['seconds'] * 1000:>10.1f}  {', '.join(r['loaded']) or '-'}", file=out)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cold-start time of the dragnet and scout entry points")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per row (median reported)")
+    args = parser.parse_args()
+    run_bench(args.repeat)
@@ -0,0 +1,50 @@
+import time
+import argparse
+import sector_scout_3
+from ollama_stub import OllamaStub
+
+# --- BENCHMARK: single vs batch LLM scoring ---
+# Runs the same synthetic tier snippets through ask_llama (one call per tier)
+# and ask_llama_batch (one call per group of tickers) against the local stub.
+
+def make_jobs(n_tickers):
+    jobs = []
+    for i in range(n_tickers):
+        sym = f"T{i:03d}"
+        for tier in ("tier1_news", "tier2_news", "tier3_news", "social"):
+            jobs.append({"symbol": sym, "tier": tier,
+                         "content": f"- [Reuters] {sym} beats estimates, raises guidance ({tier})"})
+    return jobs
+
+def bench(n_tickers, batch_size, call_latency, item_latency):
+    jobs = make_jobs(n_tickers)
+    rows = []
+    with OllamaStub(call_latency=call_latency, item_latency=item_latency) as stub:
+        sector_scout_3.OLLAMA_URL = stub.url
+
+        t0 = time.perf_counter()
+        for job in jobs:
+            sector_scout_3.ask_llama(job['symbol'], "trend_targets", job['content'], job['tier'])
+        rows.append(("single", time.perf_counter() - t0, stub.calls))
+
+        stub.calls = 0
+        per_call = batch_size * 4
+        t0 = time.perf_counter()
+        for i in range(0, len(jobs), per_call):
+            sector_scout_3.ask_llama_batch(jobs[i:i + per_call], "trend_targets")
+        rows.append((f"batch x{batch_size}", time.perf_counter() - t0, stub.calls))
+
+    print(f"\n{n_tickers} tickers x 4 tiers | call latency {call_latency}s | item latency {item_latency}s")
+    print(f"{'Mode':<12} | {'Wall (s)':>9} | {'Calls':>5}")
+    print("-" * 32)
+    for mode, wall, calls in rows:
+        print(f"{mode:<12} | {wall:>9.2f} | {calls:>5}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tickers", type=int, default=20)
+    parser.add_argument("--batch-size", type=int, default=sector_scout_3.LLM_BATCH_SIZE)
+    parser.add_argument("--call-latency", type=float, default=0.2)
+    parser.add_argument("--item-latency", type=float, default=0.02)
+    args = parser.parse_args()
+    bench(args.tickers, args.batch_size, args.call_latency, args.item_latency)
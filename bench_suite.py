@@ -0,0 +1,154 @@
+import io
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import contextlib
+from unittest.mock import patch
+
+import bench_fixtures
+import market_scanner
+import sector_scout_3
+from market_scanner import TechnicalMath
+from indicator_engine import compute_indicators
+from indicator_state import IndicatorState
+from bar_store import BarStore, split_download
+from rate_limiter import TokenBucket
+from ollama_stub import OllamaStub, canned_responder
+from reddit_stub import RedditStub
+
+# --- OFFLINE BENCHMARK SUITE ---
+# Times the scanner and scout hot paths at several ticker counts against
+# recorded fixtures (bench_fixtures.py) and local stand-in servers, so runs
+# are reproducible and need no network. Yahoo is replaced at the yf.Ticker /
+# yf.download boundary; Reddit and Ollama are real HTTP servers on localhost.
+
+SCALES = (10, 100, 1000)
+BENCH_OUTPUT = "bench_output.txt"
+OHLCV_DAYS = 500
+
+
+@contextlib.contextmanager
+def quiet():
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+def timed(fn, repeat=1):
+    """Best wall time of `repeat` runs."""
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+# --- SCANNER ---
+def bench_technical_math(data, symbols):
+    """The original per-symbol TechnicalMath loop from analyze_technicals."""
+    def run():
+        for sym in symbols:
+            df = data[sym].dropna()
+            if len(df) < 205: continue
+            TechnicalMath.get_sma(df['Close'], 200).iloc[-1]
+            TechnicalMath.get_rsi(df['Close']).iloc[-1]
+            TechnicalMath.get_adx(df['High'], df['Low'], df['Close']).iloc[-1]
+    return timed(run)
+
+def bench_indicator_engine(data, symbols):
+    return timed(lambda: compute_indicators(data, symbols), repeat=3)
+
+def bench_analyze_download(data, symbols):
+    with patch.object(market_scanner.yf, "download", return_value=data), quiet():
+        return timed(lambda: market_scanner.analyze_technicals(symbols))
+
+def bench_analyze_cached(data, symbols):
+    """Warm bar cache + indicator state: the steady-state daily run."""
+    root = tempfile.mkdtemp(prefix="bench_bars_")
+    try:
+        frames = split_download(data, symbols)
+        def fetcher(chunk, start):
+            return {s: frames[s][frames[s].index >= str(start)] for s in chunk if s in frames}
+        store = BarStore(root, fetcher=fetcher)
+        store.update(symbols, today=data.index[-1].date())
+        state = IndicatorState(None)
+        with quiet():
+            market_scanner.analyze_technicals(symbols, store=store, state=state)   # Cold: builds state
+            return timed(lambda: market_scanner.analyze_technicals(symbols, store=store, state=state))
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+# --- SCOUT ---
+def bench_news_parsing(tickers):
+    with patch.object(sector_scout_3.yf, "Ticker", bench_fixtures.FakeTicker):
+        return timed(lambda: [sector_scout_3.get_tiered_news(t) for t in tickers])
+
+def bench_run_scout(n_tickers, call_latency=0.0, item_latency=0.0):
+    candidates = bench_fixtures.make_candidates(n_tickers)
+    canned = bench_fixtures.ollama_responses()
+    tmp = tempfile.mkdtemp(prefix="bench_scout_")
+    try:
+        with OllamaStub(call_latency=call_latency, item_latency=item_latency,
+                        responder=canned_responder(canned["single"], canned["batch_reason"])) as ollama, \
+             RedditStub() as reddit, \
+             patch.object(sector_scout_3, "OLLAMA_URL", ollama.url), \
+             patch.object(sector_scout_3, "REDDIT_BASE", reddit.url), \
+             patch.object(sector_scout_3, "REDDIT_LIMITER", TokenBucket(rate=1000, max_rate=1000, name="Reddit")), \
+             patch.object(sector_scout_3, "OUTPUT_FILE", os.path.join(tmp, "active_targets.json")), \
+             patch.object(sector_scout_3, "RUN_METRICS_FILE", None), \
+             patch.object(sector_scout_3, "WEBHOOK_OVERSEER", None), \
+             patch.object(sector_scout_3, "USE_VERDICT_CACHE", False), \
+             patch.object(sector_scout_3, "get_candidates", return_value=candidates), \
+             patch.object(sector_scout_3, "DELIVERY_MODE", "scp"), \
+             patch.object(sector_scout_3, "beam_to_beelink", return_value=True), \
+             patch.object(sector_scout_3.yf, "Ticker", bench_fixtures.FakeTicker), quiet():
+            wall = timed(sector_scout_3.run_scout)
+            return wall, ollama.calls, reddit.requests
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def run_suite(scales=SCALES, scout=True, call_latency=0.0, item_latency=0.0, out=sys.stdout):
+    rows = []
+    for n in scales:
+        data = bench_fixtures.make_ohlcv(n, OHLCV_DAYS)
+        symbols = list(data.columns.get_level_values(0).unique())
+        rows.append((n, "TechnicalMath loop", bench_technical_math(data, symbols), ""))
+        rows.append((n, "indicator_engine", bench_indicator_engine(data, symbols), ""))
+        rows.append((n, "analyze_technicals (download)", bench_analyze_download(data, symbols), ""))
+        rows.append((n, "analyze_technicals (warm cache)", bench_analyze_cached(data, symbols), ""))
+        tickers = [c["symbol"] for v in bench_fixtures.make_candidates(n).values() for c in v]
+        rows.append((n, "get_tiered_news parse", bench_news_parsing(tickers), ""))
+        if scout:
+            wall, calls, reqs = bench_run_scout(n, call_latency, item_latency)
+            rows.append((n, f"run_scout ({sector_scout_3.SCORING_MODE})", wall,
+                         f"{calls} LLM calls, {reqs} Reddit requests"))
+
+    print(f"{'Tickers':>7} | {'Benchmark':<32} | {'Wall (s)':>9} | {'Per ticker (ms)':>15} | Notes", file=out)
+    print("-" * 100, file=out)
+    for n, name, wall, notes in rows:
+        print(f"{n:>7} | {name:<32} | {wall:>9.3f} | {wall / n * 1000:>15.2f} | {notes}", file=out)
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Offline benchmarks for scanner and scout hot paths")
+    parser.add_argument("--scales", default=",".join(map(str, SCALES)), help="Ticker counts, comma separated")
+    parser.add_argument("--no-scout", action="store_true", help="Skip the full run_scout benchmark")
+    parser.add_argument("--call-latency", type=float, default=0.0, help="Ollama stub seconds per call")
+    parser.add_argument("--item-latency", type=float, default=0.0, help="Ollama stub seconds per scored item")
+    parser.add_argument("--out", default=BENCH_OUTPUT, help="Also append the table to this file")
+    args = parser.parse_args()
+
+    buf = io.StringIO()
+    scales = tuple(int(s) for s in args.scales.split(","))
+    run_suite(scales, not args.no_scout, args.call_latency, args.item_latency, out=buf)
+    report = f"=== bench_suite {time.strftime('%Y-%m-%d %H:%M:%S')} ===\n{buf.getvalue()}"
+    print(report)
+    if args.out:
+        with open(args.out, 'a', encoding='utf-8') as f:
+            f.write(report + "\n")
@@ -0,0 +1,83 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# --- CHUNKED DOWNLOAD PIPELINE ---
+# Producer/consumer over symbol chunks: up to `workers` downloads are in flight
+# while finished chunks are handed to the caller. A chunk that raises is split
+# in half and retried, so one bad symbol only costs itself instead of silently
+# dropping the other 199. A chunk that comes back empty is "no data" (delisted,
+# or Yahoo throttling) and isn't split: bisecting a throttled 200-symbol chunk
+# turns one request into ~400 and makes the throttling worse. For the same
+# reason splitting stops once most chunks in the run are failing.
+
+THROTTLE_MIN_CHUNKS = 8    # Chunks evaluated before the failure ratio is trusted
+THROTTLE_RATIO = 0.5       # Above this share of failed/empty chunks, stop bisecting
+
+
+class ChunkStats:
+    def __init__(self):
+        self.chunks = 0
+        self.failed_chunks = 0
+        self.bisections = 0
+        self.failed_symbols = []
+        self.latencies = []
+
+    def summary(self):
+        lat = sorted(self.latencies)
+        if lat:
+            p95 = lat[min(len(lat) - 1, int(len(lat) * 0.95))]
+            timing = f"latency avg {sum(lat)/len(lat):.2f}s / p95 {p95:.2f}s / max {lat[-1]:.2f}s"
+        else:
+            timing = "no requests"
+        return (f"{self.chunks} chunks, {self.failed_chunks} failed, {self.bisections} bisections, "
+                f"{len(self.failed_symbols)} symbols without data; {timing}")
+
+
+def _timed(fetch, chunk):
+    t0 = time.perf_counter()
+    try:
+        return fetch(chunk), time.perf_counter() - t0, None
+    except Exception as e:
+        return None, time.perf_counter() - t0, e
+
+
+def run_chunked(symbols, fetch, on_result, chunk_size=200, workers=4, progress=None):
+    """
+    fetch(chunk) -> {symbol: data}; runs on worker threads.
+    on_result(chunk, result) runs on the calling thread as chunks complete.
+    progress(done_symbols, total) is called after each evaluated chunk.
+    Returns ChunkStats.
+    """
+    stats = ChunkStats()
+    total = len(symbols)
+    done_symbols = 0
+    chunks = [symbols[i:i + chunk_size] for i in range(0, total, chunk_size)]
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        pending = {pool.submit(_timed, fetch, c): c for c in chunks}
+        while pending:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                chunk = pending.pop(future)
+                result, latency, error = future.result()
+                stats.chunks += 1
+                stats.latencies.append(latency)
+                if error is None and result:
+                    on_result(chunk, result)
+                    done_symbols += len(chunk)
+                    if progress: progress(done_symbols, total)
+                    continue
+
+                stats.failed_chunks += 1
+                throttled = (stats.chunks >= THROTTLE_MIN_CHUNKS
+                             and stats.failed_chunks > THROTTLE_RATIO * stats.chunks)
+                if error is not None and len(chunk) > 1 and not throttled:
+                    # Bisect: isolate whatever broke this chunk
+                    stats.bisections += 1
+                    mid = len(chunk) // 2
+                    for half in (chunk[:mid], chunk[mid:]):
+                        pending[pool.submit(_timed, fetch, half)] = half
+                else:
+                    stats.failed_symbols.extend(chunk)
+                    done_symbols += len(chunk)
+                    if progress: progress(done_symbols, total)
+    return stats
@@ -0,0 +1,242 @@
+import os
+import json
+import time
+import queue
+import shutil
+import hashlib
+import tempfile
+import threading
+import subprocess
+
+# --- TARGET DELIVERY ---
+# active_targets.json is written atomically (temp file + rename) so the bots
+# never read half a file, and its sha256 decides whether a push is needed at
+# all: an unchanged file is skipped once the remote copy is known to match.
+# Pushes run on a background worker, so the scout doesn't wait on the link.
+# Transports: LocalDirTransport (tests, shared mounts) and SshTransport,
+# which keeps one multiplexed ssh connection open (ControlMaster) instead
+# of a fresh handshake per scp where OpenSSH supports it (not on Windows).
+
+PUSH_RETRIES = 3
+PUSH_BACKOFF = 5          # Seconds, doubled per retry
+SSH_TIMEOUT = 30
+SSH_CONTROL_PERSIST = "10m"
+
+
+def sha256_bytes(raw):
+    return hashlib.sha256(raw).hexdigest()
+
+def sha256_file(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            h.update(block)
+    return h.hexdigest()
+
+def atomic_write(path, raw):
+    """Writes bytes via a temp file in the same directory and os.replace. Returns the sha256."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return sha256_bytes(raw)
+
+def atomic_write_json(path, data, indent=4):
+    return atomic_write(path, json.dumps(data, indent=indent).encode("utf-8"))
+
+
+class LocalDirTransport:
+    """Delivers into a directory on this machine (or a mounted share)."""
+
+    def __init__(self, dest_dir):
+        self.dest_dir = dest_dir
+
+    def describe(self):
+        return self.dest_dir
+
+    def remote_hash(self, name):
+        path = os.path.join(self.dest_dir, name)
+        return sha256_file(path) if os.path.exists(path) else None
+
+    def push(self, local_path, name):
+        os.makedirs(self.dest_dir, exist_ok=True)
+        dest = os.path.join(self.dest_dir, name)
+        tmp = dest + ".part"
+        shutil.copyfile(local_path, tmp)
+        os.replace(tmp, dest)
+
+
+class SshTransport:
+    """
+    scp/ssh over one persistent multiplexed connection.
+    The file lands as <remote_path>.part and is mv'd into place, so the
+    remote side swaps atomically too. `run` is subprocess.run (injectable).
+    Windows' OpenSSH can't multiplex, so there (multiplex=False) every
+    command is a cold handshake: the remote-hash check is skipped and the
+    file is scp'd straight into place, one connection per push.
+    """
+
+    def __init__(self, user, host, remote_path, control_dir=None, persist=SSH_CONTROL_PERSIST,
+                 timeout=SSH_TIMEOUT, run=subprocess.run, multiplex=None):
+        self.target = f"{user}@{host}"
+        self.remote_path = remote_path
+        self.multiplex = (os.name != "nt") if multiplex is None else multiplex
+        self.options = ["-o", "BatchMode=yes", "-o", f"ConnectTimeout={timeout}"]
+        if self.multiplex:
+            control_dir = control_dir or tempfile.gettempdir()
+            self.options += [
+                "-o", "ControlMaster=auto",
+                "-o", f"ControlPath={os.path.join(control_dir, 'scout-ssh-%r@%h-%p')}",
+                "-o", f"ControlPersist={persist}",
+            ]
+        self.timeout = timeout
+        self.run = run
+
+    def describe(self):
+        return f"{self.target}:{self.remote_path}"
+
+    def _ssh(self, command):
+        return self.run(["ssh", *self.options, self.target, command], check=True, timeout=self.timeout,
+                        stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    def remote_hash(self, name):
+        # `name` is implied by remote_path; a missing file prints nothing
+        if not self.multiplex:
+            return None   # Not worth a second handshake; the push itself is one
+        result = self._ssh(f"sha256sum {self.remote_path} 2>/dev/null || true")
+        out = result.stdout.decode("utf-8", "replace") if isinstance(result.stdout, bytes) else (result.stdout or "")
+        digest = out.split()[0] if out.split() else ""
+        return digest if len(digest) == 64 else None
+
+    def push(self, local_path, name):
+        if not self.multiplex:
+            self.run(["scp", "-q", *self.options, local_path, f"{self.target}:{self.remote_path}"], check=True,
+                     timeout=self.timeout, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            return
+        part = self.remote_path + ".part"
+        self.run(["scp", "-q", *self.options, local_path, f"{self.target}:{part}"], check=True,
+                 timeout=self.timeout, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        self._ssh(f"mv -f {part} {self.remote_path}")
+
+
+class Deliverer:
+    """
+    Background pusher. submit() returns at once; only the newest pending
+    file per name is kept (an older queued version is superseded).
+    A push is skipped when the last hash pushed, or failing that the
+    remote's current hash, equals the new one. Callbacks run on the worker:
+    `on_failure(name, error)` once a push has used up its retries, and
+    `on_complete(name, result)` after every delivery with its ok / bytes_out /
+    retries / start / end (perf_counter), for callers that record telemetry.
+    """
+
+    def __init__(self, transport, retries=PUSH_RETRIES, backoff=PUSH_BACKOFF, sleep=time.sleep, on_failure=None,
+                 on_complete=None):
+        self.transport = transport
+        self.retries = retries
+        self.backoff = backoff
+        self.sleep = sleep
+        self.on_failure = on_failure
+        self.on_complete = on_complete
+        self.pushed = 0
+        self.skipped = 0
+        self.failed = 0
+        self.retried = 0       # Failed attempts, including the last one of a give-up
+        self.bytes_out = 0
+        self.last_error = None
+        self._known = {}       # name -> hash the remote is known to hold
+        self._pending = {}     # name -> local_path
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._busy = 0
+        self._thread = threading.Thread(target=self._work, name="delivery", daemon=True)
+        self._thread.start()
+
+    def submit(self, local_path, name=None):
+        name = name or os.path.basename(local_path)
+        with self._lock:
+            fresh = name not in self._pending
+            self._pending[name] = local_path
+            if fresh:
+                self._busy += 1
+                self._queue.put(name)
+
+    def _work(self):
+        while True:
+            name = self._queue.get()
+            with self._lock:
+                local_path = self._pending.pop(name)
+            try:
+                before = (self.bytes_out, self.retried)
+                start = time.perf_counter()
+                ok = self._deliver(name, local_path)
+                self._callback(self.on_complete, name, {
+                    "ok": ok, "bytes_out": self.bytes_out - before[0], "retries": self.retried - before[1],
+                    "start": start, "end": time.perf_counter(),
+                })
+            finally:
+                with self._lock:
+                    self._busy -= 1
+                    self._idle.notify_all()
+
+    def _deliver(self, name, local_path):
+        for attempt in range(self.retries):
+            try:
+                # Hashed now, not at submit: the file may have been replaced since
+                digest = sha256_file(local_path)
+                known = self._known.get(name)
+                if known is None:
+                    known = self._known[name] = self.transport.remote_hash(name)
+                if known == digest:
+                    self.skipped += 1
+                    return True
+                self.transport.push(local_path, name)
+                self._known[name] = digest
+                self.pushed += 1
+                self.bytes_out += os.path.getsize(local_path)
+                self.last_error = None
+                return True
+            except Exception as e:
+                self._known.pop(name, None)   # Unknown again after a failed push
+                self.retried += 1
+                self.last_error = f"{type(e).__name__}: {e}"
+                print(f"   ⚠️ Delivery to {self.transport.describe()} failed (Attempt {attempt+1}): {self.last_error}")
+                if attempt + 1 < self.retries:
+                    self.sleep(self.backoff * 2 ** attempt)
+        self.failed += 1
+        self._callback(self.on_failure, name, self.last_error)
+        return False
+
+    def _callback(self, fn, *args):
+        if fn is None:
+            return
+        try:
+            fn(*args)
+        except Exception as e:   # Never let a handler kill the worker
+            print(f"   ⚠️ Delivery callback raised: {type(e).__name__}: {e}")
+
+    def wait(self, timeout=None):
+        """Blocks until nothing is queued or in flight. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+        return True
+
+    def summary(self):
+        text = f"{self.pushed} pushed, {self.skipped} unchanged, {self.failed} failed"
+        if self.last_error:
+            text += f" (last error: {self.last_error})"
+        return text
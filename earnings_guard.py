@@ -0,0 +1,153 @@
+import os
+import io
+import json
+import time
+import datetime
+import contextlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# --- CONFIGURATION ---
+EARNINGS_CACHE_FILE = "earnings_cache.json"
+REFRESH_HOURS = 72        # Calendars barely move within a week
+ERROR_REFRESH_HOURS = 6   # Retry failed lookups sooner
+WORKERS = 8
+
+
+def extract_next_earnings(calendar):
+    """
+    Pulls the next earnings date out of whatever shape yfinance's `.calendar`
+    returned (DataFrame or dict). Returns a date/datetime or None.
+    """
+    # If calendar is None or empty, assume safe (ETF or no data)
+    if calendar is None:
+        return None
+
+    # Handle different calendar formats yfinance returns
+    if hasattr(calendar, 'empty') and calendar.empty:
+        return None
+
+    if isinstance(calendar, dict) and not calendar:
+        return None
+
+    # --- Earning Date Extraction ---
+    if hasattr(calendar, 'iloc'):
+        next_earnings = calendar.iloc[0][0]
+    elif isinstance(calendar, dict):
+        earnings_dates = calendar.get('Earnings Date', [])
+        if not earnings_dates:
+            return None
+        next_earnings = earnings_dates[0]
+    else:
+        return None
+
+    if not isinstance(next_earnings, (datetime.date, datetime.datetime)):
+        return None
+    if hasattr(next_earnings, 'to_pydatetime'):
+        next_earnings = next_earnings.to_pydatetime()
+    if isinstance(next_earnings, datetime.datetime) and next_earnings.tzinfo:
+        next_earnings = next_earnings.replace(tzinfo=None)
+    return next_earnings
+
+def yfinance_calendar_fetcher(symbol):
+    """Default fetcher: next earnings date for `symbol` from Yahoo, or None."""
+    import yfinance as yf
+    ticker = yf.Ticker(symbol)
+    # Suppress 404s - ETFs and some stocks simply don't have calendars
+    with contextlib.redirect_stderr(io.StringIO()):
+        calendar = ticker.calendar
+    return extract_next_earnings(calendar)
+
+def days_until(next_earnings, now=None):
+    now = now or datetime.datetime.now()
+    if isinstance(next_earnings, datetime.datetime):
+        return (next_earnings - now).days
+    # Date-only calendars: compare calendar days so "today" counts as 0
+    return (next_earnings - now.date()).days
+
+
+class EarningsCalendar:
+    """
+    Local earnings-date store for the dragnet's safety guard.
+    refresh() fetches only stale symbols, concurrently; is_safe() is a dict lookup.
+    Missing or failed data is always treated as SAFE, as before.
+    """
+
+    def __init__(self, path=EARNINGS_CACHE_FILE, fetcher=None, skip=None,
+                 refresh_hours=REFRESH_HOURS, max_workers=WORKERS):
+        self.path = path
+        self.fetcher = fetcher or yfinance_calendar_fetcher
+        self.skip = skip or (lambda symbol: False)
+        self.refresh_s = refresh_hours * 3600
+        self.error_refresh_s = min(ERROR_REFRESH_HOURS * 3600, self.refresh_s)
+        self.max_workers = max_workers
+        self._entries = {}   # symbol -> {"date": iso or None, "fetched": ts, "error": bool}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r') as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def save(self):
+        if not self.path:
+            return
+        tmp = self.path + ".tmp"
+        with open(tmp, 'w') as f:
+            json.dump(self._entries, f, indent=1)
+        os.replace(tmp, self.path)
+
+    def is_stale(self, symbol, now=None):
+        entry = self._entries.get(symbol)
+        if entry is None:
+            return True
+        age = (now or time.time()) - entry["fetched"]
+        return age >= (self.error_refresh_s if entry.get("error") else self.refresh_s)
+
+    def _fetch_one(self, symbol):
+        try:
+            date = self.fetcher(symbol)
+            entry = {"date": date.isoformat() if date else None, "fetched": time.time(), "error": False}
+        except Exception:
+            # 404s, missing data, ETFs all land here
+            entry = {"date": None, "fetched": time.time(), "error": True}
+        with self._lock:
+            self._entries[symbol] = entry
+        return entry
+
+    def refresh(self, symbols):
+        """Fetches calendars for stale symbols with a bounded worker pool. Returns stats."""
+        stale = [s for s in dict.fromkeys(symbols) if not self.skip(s) and self.is_stale(s)]
+        errors = 0
+        if stale:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                for entry in pool.map(self._fetch_one, stale):
+                    errors += entry["error"]
+        return {"symbols": len(symbols), "fetched": len(stale), "errors": errors}
+
+    def next_earnings(self, symbol):
+        entry = self._entries.get(symbol)
+        if not entry or not entry.get("date"):
+            return None
+        iso = entry["date"]
+        if len(iso) == 10:
+            return datetime.date.fromisoformat(iso)
+        return datetime.datetime.fromisoformat(iso)
+
+    def is_safe(self, symbol, days=2, now=None):
+        """True if no earnings within `days` days. Unknown symbols default to SAFE."""
+        if self.skip(symbol):
+            return True
+        next_earnings = self.next_earnings(symbol)
+        if next_earnings is None:
+            return True
+        until = days_until(next_earnings, now)
+        if 0 <= until <= days:
+            print(f"   [!] {symbol} has earnings in {until} days. Skipping.")
+            return False
+        return True
@@ -0,0 +1,132 @@
+import threading
+from urllib.parse import urlsplit
+from lazy_imports import lazy_import
+
+requests = lazy_import("requests")   # Loaded by the first session, not at import
+
+# --- HOST POLICIES ---
+# pool: max keep-alive connections to the host
+# retries/backoff/status: urllib3 retry policy (connection errors + listed statuses)
+# methods: verbs that may be retried
+# timeout: (connect, read) seconds when the caller doesn't pass one
+DEFAULT_POLICY = {
+    "pool": 4, "retries": 2, "backoff": 0.5, "status": (500, 502, 503, 504),
+    "methods": ("GET",), "timeout": (5, 15),
+}
+
+HOST_POLICIES = {
+    # Ollama: never replay a generate call, fail fast if the box is down
+    "localhost:11434": {"pool": 4, "retries": 0, "timeout": (3, 30), "methods": ()},
+    # Reddit: 429s are handled by the caller, only retry transport failures / 5xx
+    "www.reddit.com": {"pool": 4, "retries": 2, "backoff": 1.0, "timeout": (5, 10)},
+    # Discord webhooks: POST is safe to retry, Retry-After is honoured on 429
+    "discord.com": {"pool": 2, "retries": 3, "backoff": 1.0, "status": (429, 500, 502, 503, 504),
+                    "methods": ("POST",), "timeout": (5, 10)},
+}
+
+
+def host_key(url):
+    parts = urlsplit(url)
+    port = parts.port
+    return f"{parts.hostname}:{port}" if port else parts.hostname
+
+
+class HttpClient:
+    """
+    Shared keep-alive HTTP layer: one pooled requests.Session per host, each with
+    its own pool size, retry/backoff policy and default timeout.
+    Tracks requests, new vs reused connections, bytes and retries per host.
+    """
+
+    def __init__(self, policies=None, default=None):
+        self.policies = dict(HOST_POLICIES if policies is None else policies)
+        self.default = dict(DEFAULT_POLICY, **(default or {}))
+        self._sessions = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def policy(self, host):
+        return dict(self.default, **self.policies.get(host, {}))
+
+    def _session(self, host):
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                policy = self.policy(host)
+                retry = Retry(
+                    total=policy["retries"], connect=policy["retries"], read=policy["retries"],
+                    backoff_factor=policy["backoff"], status_forcelist=policy["status"],
+                    allowed_methods=frozenset(policy["methods"]), respect_retry_after_header=True,
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=policy["pool"], max_retries=retry)
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[host] = session
+                self._stats[host] = {"requests": 0, "errors": 0, "retries": 0, "bytes_out": 0, "bytes_in": 0}
+            return session
+
+    def request(self, method, url, **kwargs):
+        host = host_key(url)
+        session = self._session(host)
+        kwargs.setdefault("timeout", self.policy(host)["timeout"])
+        stats = self._stats[host]
+        try:
+            resp = session.request(method, url, **kwargs)
+        except requests.RequestException:
+            with self._lock:
+                stats["requests"] += 1
+                stats["errors"] += 1
+            raise
+        retries = getattr(resp.raw, "retries", None)
+        with self._lock:
+            stats["requests"] += 1
+            stats["retries"] += len(retries.history) if retries is not None else 0
+            stats["bytes_out"] += len(resp.request.body or b"")
+            if not kwargs.get("stream"):
+                stats["bytes_in"] += len(resp.content)
+        return resp
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def stats(self):
+        """Per-host counters plus urllib3's own connection counts (new vs reused)."""
+        out = {}
+        with self._lock:
+            for host, session in self._sessions.items():
+                row = dict(self._stats[host])
+                connections = 0
+                pooled_requests = 0
+                for adapter in set(session.adapters.values()):
+                    pools = adapter.poolmanager.pools
+                    for key in list(pools.keys()):
+                        pool = pools.get(key)
+                        if pool is None: continue
+                        connections += pool.num_connections
+                        pooled_requests += pool.num_requests
+                row["connections"] = connections
+                row["reused"] = max(pooled_requests - connections, 0)
+                out[host] = row
+        return out
+
+    def summary(self):
+        rows = self.stats().values()
+        reqs = sum(r["requests"] for r in rows)
+        conns = sum(r["connections"] for r in rows)
+        reused = sum(r["reused"] for r in rows)
+        total = reused + conns
+        rate = reused / total if total else 0
+        return f"{reqs} requests over {conns} connections ({rate*100:.0f}% reused)"
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
@@ -0,0 +1,209 @@
+import numpy as np
+import pandas as pd
+
+# --- CONFIGURATION ---
+RSI_WINDOW = 14
+ADX_WINDOW = 14
+SMA_WINDOW = 200
+MIN_BARS = 205           # Same history floor analyze_technicals always used
+LIQUIDITY_BARS = 3       # is_liquid averages the last 3 sessions' volume
+
+# --- CLASSIFICATION THRESHOLDS (classify_technicals; swept by param_sweep.py) ---
+TECH_THRESHOLDS = {
+    "trend_adx_min": 25,      # Trend: strong trend...
+    "trend_rsi_min": 55,      # ...with RSI in the momentum band
+    "trend_rsi_max": 75,
+    "survivor_rsi_max": 40,   # Survivor: oversold in an uptrend
+    "wheel_rsi_min": 40,      # Wheel: healthy RSI in an uptrend
+    "wheel_rsi_max": 55,
+    "condor_adx_max": 20,     # Condor: no trend, RSI mid-range
+    "condor_rsi_min": 40,
+    "condor_rsi_max": 60,
+}
+
+
+# --- PANEL BUILDING ---
+def build_panel(data, symbols):
+    """
+    Turns a yf.download(group_by='ticker') frame into 2-D (dates x symbols) arrays.
+
+    Each column is that symbol's dropna()'d history, right-aligned so the last row
+    is its latest complete bar and any padding is leading NaN. This reproduces the
+    per-symbol `df.dropna()` the old loop did, without the loop.
+    Returns (symbols, {field: 2-D array}).
+    """
+    if not isinstance(data.columns, pd.MultiIndex):
+        data = pd.concat({symbols[0]: data}, axis=1)
+    present = set(data.columns.get_level_values(0))
+    syms = [s for s in symbols if s in present]
+    if not syms:
+        return [], {}
+    fields = list(data.columns.get_level_values(1).unique())
+    cube = np.stack([
+        data.xs(f, axis=1, level=1).reindex(columns=syms).to_numpy(dtype="f8") for f in fields
+    ], axis=2)
+
+    cube, _, _ = _right_align(cube)
+    return syms, {f: cube[:, :, i] for i, f in enumerate(fields)}
+
+def _right_align(cube):
+    """Returns (aligned cube, row order, validity mask) for a (dates x symbols x fields) cube."""
+    # Stable sort on the validity mask pushes invalid rows to the top, keeping order
+    valid = ~np.isnan(cube).any(axis=2)
+    order = np.argsort(valid, axis=0, kind="stable")
+    cube = np.take_along_axis(cube, order[:, :, None], axis=0)
+    n_invalid = (~valid).sum(axis=0)
+    pad = np.arange(cube.shape[0])[:, None] < n_invalid[None, :]
+    cube[pad] = np.nan
+    return cube, order, valid
+
+def _date_align(x, order, valid):
+    """Inverse of _right_align for one 2-D field: puts values back on their dates."""
+    out = np.empty_like(x)
+    np.put_along_axis(out, order, x, axis=0)
+    out[~valid] = np.nan
+    return out
+
+
+# --- RECURRENCES ---
+def wilder_ewm(x, window=14):
+    """
+    Wilder smoothing along axis 0, matching pandas `ewm(alpha=1/window, adjust=False).mean()`
+    step for step, including how it carries values across interior NaNs.
+    """
+    alpha = 1.0 / window
+    out = np.full(x.shape, np.nan)
+    weighted = np.full(x.shape[1:], np.nan)
+    old_wt = np.ones(x.shape[1:])
+    with np.errstate(invalid="ignore"):
+        for t in range(x.shape[0]):
+            cur = x[t]
+            obs = ~np.isnan(cur)
+            started = ~np.isnan(weighted)
+            # Once started, every step (observed or not) decays the old weight
+            old_wt = np.where(started, old_wt * (1.0 - alpha), old_wt)
+            blended = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+            blended = np.where(weighted == cur, weighted, blended)
+            upd = started & obs
+            weighted = np.where(upd, blended, weighted)
+            old_wt = np.where(upd, 1.0, old_wt)
+            weighted = np.where(~started & obs, cur, weighted)
+            out[t] = weighted
+    return out
+
+def _shift(x):
+    out = np.full(x.shape, np.nan)
+    out[1:] = x[:-1]
+    return out
+
+
+# --- INDICATORS (2-D in, 2-D out) ---
+def sma(close, window=SMA_WINDOW):
+    if close.shape[0] < window:
+        return np.full(close.shape, np.nan)
+    filled = np.where(np.isnan(close), 0.0, close)
+    count = np.cumsum(~np.isnan(close), axis=0)
+    total = np.cumsum(filled, axis=0)
+    out = np.full(close.shape, np.nan)
+    out[window - 1] = total[window - 1]
+    out[window:] = total[window:] - total[:-window]
+    n = count.copy()
+    n[window:] = count[window:] - count[:-window]
+    full = n == window
+    out[~full] = np.nan
+    return out / window
+
+def rsi(close, window=RSI_WINDOW):
+    delta = close - _shift(close)
+    valid = ~np.isnan(close)
+    # delta.where(delta > 0, 0) turns the first (NaN) diff into 0, so mirror that
+    gain = np.where(valid, np.where(delta > 0, delta, 0.0), np.nan)
+    loss = np.where(valid, np.where(delta < 0, -delta, 0.0), np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = wilder_ewm(gain, window) / wilder_ewm(loss, window)
+        return 100 - (100 / (1 + rs))
+
+def atr(high, low, close, window=ADX_WINDOW):
+    prev = _shift(close)
+    tr = np.fmax(np.fmax(high - low, np.abs(high - prev)), np.abs(low - prev))
+    return wilder_ewm(tr, window)
+
+def adx(high, low, close, window=ADX_WINDOW):
+    plus_dm = high - _shift(high)
+    minus_dm = low - _shift(low)
+    plus_dm = np.where(plus_dm < 0, 0.0, plus_dm)
+    minus_dm = np.where(minus_dm > 0, 0.0, minus_dm)
+    tr = atr(high, low, close, window)
+    tr = np.where(tr == 0, np.nan, tr)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        plus_di = 100 * (wilder_ewm(plus_dm, window) / tr)
+        minus_di = 100 * (wilder_ewm(np.abs(minus_dm), window) / tr)
+        dx = (np.abs(plus_di - minus_di) / (plus_di + minus_di)) * 100
+    return wilder_ewm(dx, window)
+
+
+def compute_indicators(data, symbols):
+    """
+    Latest RSI / ADX / ATR / SMA200 for every symbol in one set of array passes.
+    Returns a DataFrame indexed by symbol with columns price, rsi, adx, atr, sma200.
+    """
+    cols = ["price", "rsi", "adx", "atr", "sma200"]
+    if data is None or data.empty or len(data) < MIN_BARS:
+        return pd.DataFrame(columns=cols)
+    syms, panel = build_panel(data, symbols)
+    if not syms:
+        return pd.DataFrame(columns=cols)
+    high, low, close = panel["High"], panel["Low"], panel["Close"]
+    return pd.DataFrame({
+        "price": close[-1],
+        "rsi": rsi(close)[-1],
+        "adx": adx(high, low, close)[-1],
+        "atr": atr(high, low, close)[-1],
+        "sma200": sma(close)[-1],
+    }, index=pd.Index(syms, name="symbol"))
+
+
+def compute_indicator_series(data, symbols, horizons=()):
+    """
+    Full indicator history on the date grid (for replays), computed per symbol
+    over its dropna()'d bars exactly like compute_indicators.
+    Returns (symbols, dates, {field: 2-D dates x symbols}); `horizons` adds
+    forward close-to-close returns as "fwd_<h>" (h bars ahead, NaN past the end),
+    and a Volume field adds "avg_volume" for the liquidity filter.
+    """
+    if not isinstance(data.columns, pd.MultiIndex):
+        data = pd.concat({symbols[0]: data}, axis=1)
+    present = set(data.columns.get_level_values(0))
+    syms = [s for s in symbols if s in present]
+    if not syms:
+        return [], data.index, {}
+    fields = ["High", "Low", "Close"]
+    cube = np.stack([
+        data.xs(f, axis=1, level=1).reindex(columns=syms).to_numpy(dtype="f8") for f in fields
+    ], axis=2)
+    # Rows the live path would drop (any missing field) are dropped here too
+    others = [f for f in data.columns.get_level_values(1).unique() if f not in fields]
+    if others:
+        extra = np.stack([data.xs(f, axis=1, level=1).reindex(columns=syms).to_numpy(dtype="f8")
+                          for f in others], axis=2)
+        cube[np.isnan(extra).any(axis=2)] = np.nan
+    if "Volume" in others:
+        cube = np.concatenate([cube, extra[:, :, [others.index("Volume")]]], axis=2)
+    cube, order, valid = _right_align(cube)
+    high, low, close = cube[:, :, 0], cube[:, :, 1], cube[:, :, 2]
+    series = {
+        "price": close,
+        "rsi": rsi(close),
+        "adx": adx(high, low, close),
+        "atr": atr(high, low, close),
+        "sma200": sma(close),
+    }
+    if cube.shape[2] > 3:
+        # Trailing mean volume as is_liquid sees it
+        series["avg_volume"] = pd.DataFrame(cube[:, :, 3]).rolling(LIQUIDITY_BARS, min_periods=1).mean().to_numpy()
+    for h in horizons:
+        fwd = np.full(close.shape, np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fwd[:-h] = close[h:] / close[:-h] - 1
+        series[f"fwd_{h}"] = fwd
+    return syms, data.index, {k: _date_align(v, order, valid) for k, v in series.items()}
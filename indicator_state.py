@@ -0,0 +1,272 @@
+import os
+import json
+import math
+import datetime
+import numpy as np
+import pandas as pd
+
+from indicator_engine import RSI_WINDOW, ADX_WINDOW, SMA_WINDOW
+
+# --- CONFIGURATION ---
+INDICATOR_STATE_FILE = "indicator_state.json"
+MARKET_CLOSE_HOUR = 16   # New York time; bars dated today are partial before this
+NAN = float("nan")
+
+# --- INCREMENTAL INDICATOR STATE ---
+# RSI, ATR and ADX are Wilder EWM recurrences, so yesterday's smoothed values
+# plus one new bar are enough to produce today's. Each symbol keeps just that
+# carry (plus a 200-close ring buffer for the SMA) and a new bar costs O(1).
+# Only completed bars are committed; the live partial bar is previewed on a copy.
+
+
+def _ewm_step(carry, x, alpha):
+    """
+    One step of pandas `ewm(alpha, adjust=False).mean()` (ignore_na=False).
+    `carry` is [weighted, old_wt]; returns the new carry. Mirrors wilder_ewm.
+    """
+    weighted, old_wt = carry
+    if math.isnan(weighted):
+        return [x, 1.0] if not math.isnan(x) else [NAN, 1.0]
+    old_wt *= (1.0 - alpha)
+    if math.isnan(x):
+        return [weighted, old_wt]
+    if weighted != x:
+        weighted = (old_wt * weighted + alpha * x) / (old_wt + alpha)
+    return [weighted, 1.0]
+
+def _div(a, b):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return float(np.float64(a) / np.float64(b))
+
+
+class SymbolState:
+    """Carry for one symbol's RSI / ATR / ADX / SMA200 recurrences."""
+
+    def __init__(self):
+        self.last_date = None
+        self.last_high = NAN
+        self.last_low = NAN
+        self.last_close = NAN
+        self.bars = 0
+        self.gain = [NAN, 1.0]
+        self.loss = [NAN, 1.0]
+        self.tr = [NAN, 1.0]
+        self.plus_dm = [NAN, 1.0]
+        self.minus_dm = [NAN, 1.0]
+        self.dx = [NAN, 1.0]
+        self.ring = []          # Last SMA_WINDOW closes, oldest at ring_pos once full
+        self.ring_pos = 0
+        self.ring_sum = 0.0
+
+    def update(self, date, high, low, close):
+        """Commits one completed bar."""
+        a_rsi, a_adx = 1.0 / RSI_WINDOW, 1.0 / ADX_WINDOW
+        first = self.bars == 0
+
+        # RSI: the first diff is NaN, which delta.where(...) turns into 0
+        delta = NAN if first else close - self.last_close
+        self.gain = _ewm_step(self.gain, delta if delta > 0 else 0.0, a_rsi)
+        self.loss = _ewm_step(self.loss, -delta if delta < 0 else 0.0, a_rsi)
+
+        # ATR: pandas' row max skips the NaN previous-close terms on the first bar
+        if first:
+            tr = high - low
+        else:
+            tr = max(high - low, abs(high - self.last_close), abs(low - self.last_close))
+        self.tr = _ewm_step(self.tr, tr, a_adx)
+
+        # ADX: directional movement is NaN on the first bar
+        if first:
+            plus_dm = minus_dm = NAN
+        else:
+            plus_dm = max(high - self.last_high, 0.0)
+            minus_dm = abs(min(low - self.last_low, 0.0))
+        self.plus_dm = _ewm_step(self.plus_dm, plus_dm, a_adx)
+        self.minus_dm = _ewm_step(self.minus_dm, minus_dm, a_adx)
+        self.dx = _ewm_step(self.dx, self._dx(), a_adx)
+
+        # SMA: ring buffer with a running sum, re-summed exactly once per lap
+        if len(self.ring) < SMA_WINDOW:
+            self.ring.append(close)
+            self.ring_sum += close
+        else:
+            self.ring_sum += close - self.ring[self.ring_pos]
+            self.ring[self.ring_pos] = close
+            self.ring_pos = (self.ring_pos + 1) % SMA_WINDOW
+            if self.ring_pos == 0:
+                self.ring_sum = math.fsum(self.ring)
+
+        self.last_date = date
+        self.last_high, self.last_low, self.last_close = high, low, close
+        self.bars += 1
+
+    def _dx(self):
+        atr = self.tr[0]
+        if atr == 0:
+            atr = NAN
+        plus_di = 100 * _div(self.plus_dm[0], atr)
+        minus_di = 100 * _div(self.minus_dm[0], atr)
+        return _div(abs(plus_di - minus_di), plus_di + minus_di) * 100
+
+    def values(self):
+        """Latest price / rsi / adx / atr / sma200, same meaning as compute_indicators."""
+        rs = _div(self.gain[0], self.loss[0])
+        full = len(self.ring) == SMA_WINDOW
+        return {
+            "price": self.last_close,
+            "rsi": 100 - _div(100, 1 + rs),
+            "adx": self.dx[0],
+            "atr": self.tr[0],
+            "sma200": self.ring_sum / SMA_WINDOW if full else NAN,
+        }
+
+    def preview(self, date, high, low, close):
+        """Indicator values if the (partial) bar closed now, without committing it."""
+        trial = SymbolState.from_dict(self.to_dict())
+        trial.update(date, high, low, close)
+        return trial.values()
+
+    # --- Persistence ---
+    def to_dict(self):
+        d = dict(self.__dict__)
+        d["ring"] = list(self.ring)
+        for k in ("gain", "loss", "tr", "plus_dm", "minus_dm", "dx"):
+            d[k] = list(d[k])
+        return d
+
+    @classmethod
+    def from_dict(cls, d):
+        state = cls()
+        state.__dict__.update(d)
+        return state
+
+    @classmethod
+    def rebuild(cls, frame):
+        """Fresh state from a full bar history (the parity path)."""
+        state = cls()
+        for date, high, low, close in _rows(frame):
+            state.update(date, high, low, close)
+        return state
+
+
+def _rows(frame):
+    """(iso date, high, low, close) for every complete row, like the engine's dropna()."""
+    frame = frame.dropna()
+    dates = [d.strftime("%Y-%m-%d") for d in pd.DatetimeIndex(frame.index)]
+    return zip(dates, frame["High"].astype(float), frame["Low"].astype(float),
+               frame["Close"].astype(float))
+
+def completed_through(now=None):
+    """Latest bar date that is final: today after the close, otherwise yesterday."""
+    if now is None:
+        try:
+            from zoneinfo import ZoneInfo
+            now = datetime.datetime.now(ZoneInfo("America/New_York"))
+        except Exception:
+            now = datetime.datetime.now()
+    today = now.date()
+    if now.hour >= MARKET_CLOSE_HOUR:
+        return today.isoformat()
+    return (today - datetime.timedelta(days=1)).isoformat()
+
+
+class IndicatorState:
+    """
+    Persisted per-symbol indicator carries.
+    sync() applies only the bars each symbol hasn't seen; indicators() is a lookup.
+    """
+
+    def __init__(self, path=INDICATOR_STATE_FILE):
+        self.path = path
+        self.states = {}
+        self._preview = {}   # symbol -> values including the live partial bar
+        self.load()
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r') as f:
+                raw = json.load(f)
+            self.states = {sym: SymbolState.from_dict(d) for sym, d in raw.items()}
+        except (OSError, ValueError, TypeError):
+            self.states = {}
+
+    def save(self):
+        if not self.path:
+            return
+        tmp = self.path + ".tmp"
+        with open(tmp, 'w') as f:
+            json.dump({sym: s.to_dict() for sym, s in self.states.items()}, f)
+        os.replace(tmp, self.path)
+
+    def apply(self, symbol, frame, through=None):
+        """
+        Commits rows of `frame` newer than the symbol's state and dated <= `through`
+        (ISO date, default: everything). A later partial row is only previewed.
+        Returns the number of bars committed.
+        """
+        state = self.states.get(symbol)
+        if state is None:
+            state = self.states[symbol] = SymbolState()
+        self._preview.pop(symbol, None)
+        if state.last_date is not None:
+            frame = frame[frame.index > pd.Timestamp(state.last_date)]   # Skip what's already folded in
+        committed = 0
+        for date, high, low, close in _rows(frame):
+            if state.last_date is not None and date <= state.last_date:
+                continue
+            if through is not None and date > through:
+                self._preview[symbol] = state.preview(date, high, low, close)
+                break
+            state.update(date, high, low, close)
+            committed += 1
+        return committed
+
+    def rebuild(self, symbol, frame, through=None):
+        self.states.pop(symbol, None)
+        return self.apply(symbol, frame, through)
+
+    def _rewritten(self, symbol, frame):
+        """True when the frame's close on the state's last date isn't the one folded in."""
+        state = self.states.get(symbol)
+        if state is None or state.last_date is None:
+            return False
+        stamp = pd.Timestamp(state.last_date)
+        if stamp not in frame.index:
+            return False
+        close = float(frame.loc[stamp, "Close"])
+        return not math.isclose(close, state.last_close, rel_tol=1e-9)
+
+    def sync(self, store, symbols, through=None):
+        """Brings every symbol up to date from a BarStore. Returns stats."""
+        through = through or completed_through()
+        stats = {"symbols": 0, "bars": 0, "previewed": 0, "rebuilt": 0}
+        for sym in symbols:
+            frame = store.frame(sym)
+            if frame is None:
+                continue
+            stats["symbols"] += 1
+            if self._rewritten(sym, frame):
+                # History changed under the carries (split/dividend re-adjustment, refetch)
+                stats["rebuilt"] += 1
+                stats["bars"] += self.rebuild(sym, frame, through)
+            else:
+                stats["bars"] += self.apply(sym, frame, through)
+            stats["previewed"] += sym in self._preview
+        return stats
+
+    def indicators(self, symbols):
+        """Same frame compute_indicators returns, served from the carries."""
+        cols = ["price", "rsi", "adx", "atr", "sma200"]
+        rows, index = [], []
+        for sym in symbols:
+            if sym in self._preview:
+                values = self._preview[sym]
+            elif sym in self.states and self.states[sym].bars:
+                values = self.states[sym].values()
+            else:
+                continue
+            rows.append(values)
+            index.append(sym)
+        return pd.DataFrame(rows, index=pd.Index(index, name="symbol"), columns=cols)
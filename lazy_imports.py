@@ -0,0 +1,57 @@
+import sys
+import types
+import importlib
+import threading
+
+# --- LAZY IMPORTS ---
+# pandas, yfinance and alpaca cost the entry points most of a second before
+# the first line of real work, and a gatekeeper abort or a cached run may
+# never touch them. lazy_import() hands back a stand-in that performs the
+# real import on first attribute access. Attribute writes and deletes go to
+# the real module, so patch.object(module.yf, "Ticker", ...) keeps working.
+
+
+class LazyModule(types.ModuleType):
+    """Proxy for a module that isn't imported until something is looked up on it."""
+
+    def __init__(self, name):
+        super().__init__(name)
+        object.__setattr__(self, "_lazy_target", None)
+        object.__setattr__(self, "_lazy_lock", threading.Lock())
+
+    def _load(self):
+        target = object.__getattribute__(self, "_lazy_target")
+        if target is None:
+            with object.__getattribute__(self, "_lazy_lock"):   # Pool threads may race to the first use
+                target = object.__getattribute__(self, "_lazy_target")
+                if target is None:
+                    target = importlib.import_module(self.__name__)
+                    object.__setattr__(self, "_lazy_target", target)
+        return target
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __delattr__(self, attr):
+        delattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if object.__getattribute__(self, "_lazy_target") is not None else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name):
+    """The module itself if it's already imported, otherwise a LazyModule for it."""
+    module = sys.modules.get(name)
+    if module is not None and not isinstance(module, LazyModule):
+        return module
+    return LazyModule(name)
+
+def is_loaded(name):
+    return name in sys.modules
@@ -0,0 +1,239 @@
+import os
+import json
+import time
+import queue
+import threading
+import datetime
+
+import market_scanner
+from market_scanner import classify_technicals, build_dragnet_output, OUTPUT_FILE
+from indicator_state import IndicatorState, completed_through
+
+# --- LIVE DRAGNET ---
+# Long-running intraday mode: minute bars from a pluggable source are folded
+# into each symbol's session (daily) bar, indicators are previewed from the
+# persisted carries in O(1), and only symbols whose inputs moved are
+# reclassified. dragnet_candidates.json is rewritten only when a category's
+# membership changes, so the scout isn't re-triggered by score jitter.
+
+POLL_SECONDS = 1.0
+
+
+def _bar_date(ts):
+    """ISO session date for a bar timestamp (datetime, pandas Timestamp or ISO string)."""
+    if isinstance(ts, str):
+        ts = datetime.datetime.fromisoformat(ts.replace("Z", "+00:00"))
+    if getattr(ts, "tzinfo", None) is not None:
+        try:
+            from zoneinfo import ZoneInfo
+            ts = ts.astimezone(ZoneInfo("America/New_York"))
+        except Exception:
+            pass
+    return ts.strftime("%Y-%m-%d")
+
+
+# --- BAR SOURCES ---
+# A source is any iterable of dicts: {"symbol", "t", "o", "h", "l", "c", "v"}.
+
+class ReplaySource:
+    """Replays bars from a JSON-lines file (one bar per line), optionally paced."""
+
+    def __init__(self, path, delay=0.0):
+        self.path = path
+        self.delay = delay
+
+    def __iter__(self):
+        with open(self.path, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                yield json.loads(line)
+                if self.delay:
+                    time.sleep(self.delay)
+
+
+class AlpacaBarSource:
+    """
+    Minute bars from Alpaca's market-data websocket. The stream runs on its
+    own thread and hands bars over through a queue.
+    """
+
+    def __init__(self, api_key, secret_key, symbols, feed="iex"):
+        from alpaca.data.live import StockDataStream
+        from alpaca.data.enums import DataFeed
+        self.symbols = list(symbols)
+        self.stream = StockDataStream(api_key, secret_key, feed=DataFeed(feed))
+        self._queue = queue.Queue()
+        self._thread = None
+
+    async def _on_bar(self, bar):
+        self._queue.put({"symbol": bar.symbol, "t": bar.timestamp, "o": bar.open,
+                         "h": bar.high, "l": bar.low, "c": bar.close, "v": bar.volume})
+
+    def __iter__(self):
+        self.stream.subscribe_bars(self._on_bar, *self.symbols)
+        self._thread = threading.Thread(target=self.stream.run, daemon=True)
+        self._thread.start()
+        while self._thread.is_alive() or not self._queue.empty():
+            try:
+                yield self._queue.get(timeout=POLL_SECONDS)
+            except queue.Empty:
+                yield None   # Heartbeat so the caller can check its stop condition
+
+    def close(self):
+        self.stream.stop()
+
+
+class LiveScanner:
+    def __init__(self, state, symbols, is_safe=None, output_file=OUTPUT_FILE):
+        self.state = state
+        self.symbols = [s for s in symbols if s in state.states and state.states[s].bars]
+        self.is_safe = is_safe or (lambda symbol: True)
+        self._safe = {}       # Earnings guard verdicts, checked once per symbol per session
+        self.output_file = output_file
+        self.session = {}     # symbol -> [date, high, low, close] for the open session
+        self.inputs = {}      # symbol -> (price, rsi, adx, sma200) last classified
+        self.items = {}       # symbol -> classify_technicals result (or None)
+        self.membership = None
+        self.stats = {"bars": 0, "reclassified": 0, "committed": 0, "writes": 0}
+
+    def seed(self, store, through=None):
+        """Starts each session from the stored partial bar (yfinance's intraday daily bar), if any."""
+        through = through or completed_through()
+        for sym in self.symbols:
+            frame = store.frame(sym)
+            if frame is None or frame.empty:
+                continue
+            row = frame.dropna().iloc[-1:]
+            if row.empty:
+                continue
+            date = row.index[0].strftime("%Y-%m-%d")
+            if date > through and date > self.state.states[sym].last_date:
+                self.session[sym] = [date, float(row["High"].iloc[0]), float(row["Low"].iloc[0]),
+                                     float(row["Close"].iloc[0])]
+        for sym in self.symbols:
+            self._reclassify(sym)
+        self.membership = self._membership(self.output())
+
+    def on_bar(self, bar):
+        """Folds one bar into its session. Returns True if the symbol's classification inputs changed."""
+        sym = bar["symbol"]
+        if sym not in self.state.states or sym not in self.inputs:
+            return False
+        self.stats["bars"] += 1
+        date = _bar_date(bar["t"])
+        sess = self.session.get(sym)
+        if sess is not None and date < sess[0]:
+            return False  # Late bar from a session already closed
+        if sess is not None and date > sess[0]:
+            # New session: the previous one is final now
+            self.state.states[sym].update(*sess)
+            self.stats["committed"] += 1
+            sess = None
+        if sess is None:
+            if self.state.states[sym].last_date and date <= self.state.states[sym].last_date:
+                return False
+            sess = self.session[sym] = [date, float(bar["h"]), float(bar["l"]), float(bar["c"])]
+        else:
+            sess[1] = max(sess[1], float(bar["h"]))
+            sess[2] = min(sess[2], float(bar["l"]))
+            sess[3] = float(bar["c"])
+        return self._reclassify(sym)
+
+    def _reclassify(self, sym):
+        st = self.state.states[sym]
+        values = st.preview(*self.session[sym]) if sym in self.session else st.values()
+        inputs = (values["price"], values["rsi"], values["adx"], values["sma200"])
+        if self.inputs.get(sym) == inputs:
+            return False
+        self.inputs[sym] = inputs
+        self.items[sym] = classify_technicals(sym, *inputs)
+        self.stats["reclassified"] += 1
+        return True
+
+    def output(self):
+        results = [item for sym, item in self.items.items() if item and self._is_safe(sym)]
+        return build_dragnet_output(results)
+
+    def _is_safe(self, sym):
+        if sym not in self._safe:
+            self._safe[sym] = self.is_safe(sym)
+        return self._safe[sym]
+
+    @staticmethod
+    def _membership(output):
+        return {category: frozenset(e["symbol"] for e in entries) for category, entries in output.items()}
+
+    def emit(self, force=False):
+        """Rewrites the candidates file if any list gained or lost a symbol. Returns True if written."""
+        output = self.output()
+        membership = self._membership(output)
+        if not force and membership == self.membership:
+            return False
+        self.membership = membership
+        tmp = self.output_file + ".tmp"
+        with open(tmp, 'w') as f:
+            json.dump(output, f, indent=4)
+        os.replace(tmp, self.output_file)  # The scout may be reading it
+        self.stats["writes"] += 1
+        counts = ", ".join(f"{c.split('_')[0]} {len(v)}" for c, v in output.items())
+        print(f"   [{datetime.datetime.now():%H:%M:%S}] Membership changed -> {self.output_file} ({counts})")
+        return True
+
+    def run(self, source, stop=None):
+        """Consumes `source` until it ends or stop() returns True. Returns stats."""
+        for bar in source:
+            if stop and stop():
+                break
+            if bar is not None and self.on_bar(bar):
+                self.emit()
+        return self.stats
+
+
+def run_live(replay=None, delay=0.0):
+    """Dragnet setup as in run_dragnet, then stay resident re-scanning on live bars."""
+    if not replay and not market_scanner.is_mission_time():
+        return
+    client = market_scanner.get_alpaca_client()
+    if not client: return
+    store = market_scanner.BarStore()
+    all_tickers = market_scanner.get_market_universe(client)
+    liquid = market_scanner.filter_by_volume(all_tickers, store=store)
+    state = IndicatorState()
+    market_scanner.analyze_technicals(liquid, store=store, state=state)
+    state.save()
+
+    calendar = market_scanner.EarningsCalendar(skip=market_scanner.is_etf)
+    calendar.refresh(liquid)
+    scanner = LiveScanner(state, liquid, is_safe=calendar.is_safe)
+    scanner.seed(store)
+    scanner.emit(force=True)
+    print(f"--- 📡 LIVE DRAGNET: watching {len(scanner.symbols)} symbols ---")
+
+    if replay:
+        source = ReplaySource(replay, delay)
+        stop = None
+    else:
+        with open(market_scanner.KEYS_FILE, 'r') as f:
+            keys = json.load(f)
+        source = AlpacaBarSource(keys['APCA_API_KEY_ID'], keys['APCA_API_SECRET_KEY'], scanner.symbols)
+        stop = lambda: not market_scanner.is_mission_time()
+    try:
+        # Sessions committed from minute bars stay in memory only; the next
+        # dragnet run commits the official daily bars from the store.
+        stats = scanner.run(source, stop=stop)
+    finally:
+        if hasattr(source, "close"):
+            source.close()
+    print(f"   -> {stats['bars']} bars, {stats['reclassified']} reclassifications, "
+          f"{stats['writes']} writes.")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Intraday dragnet re-scan on streaming bars")
+    parser.add_argument("--replay", help="JSON-lines bar file instead of the Alpaca stream")
+    parser.add_argument("--delay", type=float, default=0.0, help="Seconds between replayed bars")
+    args = parser.parse_args()
+    run_live(args.replay, args.delay)
@@ -0,0 +1,106 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+
+# --- CONFIGURATION ---
+VERDICT_CACHE_FILE = "llm_verdict_cache.json"
+TTL_HOURS = 48           # Morning run -> afternoon run -> next morning
+MAX_ENTRIES = 5000
+
+
+def normalize_content(content_text):
+    """Whitespace/case-insensitive form of the prompt data so trivial diffs still hit."""
+    return " ".join(str(content_text).split()).casefold()
+
+def verdict_key(model, strategy, source_type, content_text):
+    raw = "\x1f".join([model, strategy, source_type, normalize_content(content_text)])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class VerdictCache:
+    """
+    Persistent (score, reason) cache in front of ask_llama.
+    Content-addressed by verdict_key(), entries expire after `ttl_hours`,
+    and the least recently used entries are evicted beyond `max_entries`.
+    """
+
+    def __init__(self, path=VERDICT_CACHE_FILE, ttl_hours=TTL_HOURS, max_entries=MAX_ENTRIES):
+        self.path = path
+        self.ttl = ttl_hours * 3600
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> [score, reason, created_ts], LRU order
+        self._lock = threading.Lock()
+        self.load()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r') as f:
+                rows = json.load(f).get("entries", [])
+            rows = list(rows)
+        except (OSError, ValueError, AttributeError, TypeError):
+            print(f"   [!] Verdict cache unreadable, starting fresh: {self.path}")
+            return
+        now = time.time()
+        skipped = 0
+        for row in rows:
+            try:
+                key, score, reason, created = row
+                score, created = float(score), float(created)
+            except (TypeError, ValueError):
+                skipped += 1   # Hand edit or an older format; drop just this row
+                continue
+            if now - created < self.ttl:
+                self._entries[key] = [score, reason, created]
+        if skipped:
+            print(f"   [!] Verdict cache: skipped {skipped} malformed entries in {self.path}")
+        self._evict()
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            rows = [[k] + v for k, v in self._entries.items()]
+        tmp = self.path + ".tmp"
+        with open(tmp, 'w') as f:
+            json.dump({"version": 1, "entries": rows}, f)
+        os.replace(tmp, self.path)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.time() - entry[2] >= self.ttl:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0], entry[1]
+
+    def put(self, key, score, reason):
+        with self._lock:
+            self._entries[key] = [score, reason, time.time()]
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def summary(self):
+        lookups = self.hits + self.misses
+        rate = self.hits / lookups if lookups else 0
+        return f"{self.hits} hits / {self.misses} misses ({rate*100:.0f}%), {len(self)} stored"
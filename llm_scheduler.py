@@ -0,0 +1,114 @@
+import os
+import time
+import heapq
+import itertools
+import threading
+from concurrent.futures import Future
+
+# --- LLM REQUEST SCHEDULER ---
+# Ollama works through requests in arrival order, so a condor ETF's Reddit
+# chatter can hold the GPU while a trend target's Reuters headline waits.
+# LlmScheduler sits in front of ask_llama: jobs carry a weight (how much the
+# verdict moves a final confidence) and the heaviest queued job always goes
+# next. Parallelism should match the server's OLLAMA_NUM_PARALLEL. Past the
+# deadline, jobs below `skip_below` are not sent at all and resolve to None.
+
+OLLAMA_NUM_PARALLEL = int(os.environ.get("OLLAMA_NUM_PARALLEL", "1"))
+
+# How much a category's picks matter to the bots (1.0 = most)
+CATEGORY_WEIGHTS = {
+    "trend_targets": 1.0,
+    "short_targets": 0.9,
+    "survivor_targets": 0.8,
+    "wheel_targets": 0.6,
+    "condor_targets": 0.5,
+}
+# Share of final confidence each source carries in score_candidate
+TIER_WEIGHTS = {
+    "tier1_news": 0.30,
+    "tier2_news": 0.20,
+    "tier3_news": 0.10,
+    "social": 0.10,
+}
+SKIP_BELOW = 0.08   # Past the deadline only jobs at least this heavy still run
+
+def job_weight(category, source_type):
+    return CATEGORY_WEIGHTS.get(category, 0.5) * TIER_WEIGHTS.get(source_type, 0.10)
+
+
+class LlmScheduler:
+    """
+    Priority queue of LLM calls served by `parallel` worker threads.
+    submit() returns a Future; skipped jobs resolve to None.
+    """
+
+    def __init__(self, parallel=OLLAMA_NUM_PARALLEL, deadline=None, skip_below=SKIP_BELOW):
+        self.parallel = max(1, int(parallel))
+        self.deadline = time.monotonic() + deadline if deadline else None
+        self.skip_below = skip_below
+        self.ran = 0
+        self.skipped = 0
+        self.skipped_weight = 0.0
+        self._heap = []
+        self._seq = itertools.count()   # FIFO among equal weights
+        self._cond = threading.Condition()
+        self._closed = False
+        self._workers = [
+            threading.Thread(target=self._work, name=f"llm-sched-{i}", daemon=True)
+            for i in range(self.parallel)
+        ]
+        for t in self._workers:
+            t.start()
+
+    def submit(self, weight, fn, *args, **kwargs):
+        future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("LlmScheduler is shut down")
+            heapq.heappush(self._heap, (-weight, next(self._seq), future, fn, args, kwargs))
+            self._cond.notify()
+        return future
+
+    def past_deadline(self):
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while not self._heap and not self._closed:
+                    self._cond.wait()
+                if not self._heap:
+                    return
+                neg_weight, _, future, fn, args, kwargs = heapq.heappop(self._heap)
+                skip = self.past_deadline() and -neg_weight < self.skip_below
+                if skip:
+                    self.skipped += 1
+                    self.skipped_weight += -neg_weight
+                else:
+                    self.ran += 1
+            if not future.set_running_or_notify_cancel():
+                continue
+            if skip:
+                future.set_result(None)
+                continue
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        with self._cond:
+            self._closed = True
+            if cancel_futures:
+                while self._heap:
+                    heapq.heappop(self._heap)[2].cancel()
+            self._cond.notify_all()
+        if wait:
+            for t in self._workers:
+                t.join()
+
+    def summary(self):
+        text = f"{self.ran} LLM calls at parallel {self.parallel}"
+        if self.skipped:
+            text += f", {self.skipped} skipped past deadline (weight {self.skipped_weight:.2f} moved to tech)"
+        return text
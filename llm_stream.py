@@ -0,0 +1,146 @@
+import json
+import time
+import threading
+
+# --- STREAMING OLLAMA CLIENT ---
+# With "stream": true Ollama sends one NDJSON line per token. JsonObjectScanner
+# watches the text as it grows and reports the moment the first top-level
+# {...} closes, so the request can be dropped right there instead of waiting
+# for the model to finish whatever chatter follows. Dropping the response
+# closes that connection, which is also how Ollama learns to stop generating.
+
+
+class JsonObjectScanner:
+    """
+    Incremental brace matcher: feed() text chunks, get back the first complete
+    top-level JSON object as a string (or None while it's still open).
+    Braces inside JSON strings and escaped quotes are handled.
+    """
+
+    def __init__(self):
+        self.buf = []
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.result = None
+
+    def feed(self, chunk):
+        if self.result is not None:
+            return self.result
+        for ch in chunk:
+            if self.depth == 0:
+                if ch == "{":               # Anything before the object is chatter
+                    self.buf.append(ch)
+                    self.depth = 1
+                continue
+            self.buf.append(ch)
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == "\\":
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                self.in_string = True
+            elif ch == "{":
+                self.depth += 1
+            elif ch == "}":
+                self.depth -= 1
+                if self.depth == 0:
+                    self.result = "".join(self.buf)
+                    return self.result
+        return None
+
+def first_json_object(text):
+    """The first balanced {...} in `text`, or None (non-greedy replacement for r'\\{.*\\}')."""
+    return JsonObjectScanner().feed(text)
+
+
+class StreamMeter:
+    """Per-call stream timings, shared across LLM worker threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.early_stops = 0
+        self.budget_stops = 0
+        self.tokens = 0
+        self.ttft = []
+        self.gen_s = 0.0
+
+    def record(self, stats):
+        with self._lock:
+            self.calls += 1
+            self.early_stops += stats["early_stop"]
+            self.budget_stops += stats["budget_stop"]
+            self.tokens += stats["tokens"]
+            if stats["ttft_s"] is not None:
+                self.ttft.append(stats["ttft_s"])
+            self.gen_s += stats["gen_s"]
+
+    def summary(self):
+        with self._lock:
+            if not self.calls:
+                return "no streamed calls"
+            ttft = sorted(self.ttft)
+            avg = sum(ttft) / len(ttft) if ttft else 0.0
+            p95 = ttft[min(len(ttft) - 1, int(len(ttft) * 0.95))] if ttft else 0.0
+            rate = self.tokens / self.gen_s if self.gen_s > 0 else 0.0
+            return (f"{self.calls} streamed calls, TTFT avg {avg:.2f}s / p95 {p95:.2f}s, "
+                    f"{rate:.1f} tok/s, {self.early_stops} early stops, {self.budget_stops} hit token budget")
+
+
+def stream_generate(http, url, payload, token_budget=None, timeout=30):
+    """
+    POSTs `payload` with streaming on and reads tokens until the first JSON
+    object closes, the model finishes, or `token_budget` tokens have arrived.
+    Returns (text, stats) where text is the closed object if one was seen,
+    otherwise everything received. stats: ttft_s, tokens, tokens_per_s,
+    gen_s, total_s, early_stop, budget_stop.
+    """
+    payload = dict(payload, stream=True)
+    if token_budget:
+        payload["options"] = dict(payload.get("options") or {}, num_predict=token_budget)
+
+    t0 = time.perf_counter()
+    ttft = None
+    tokens = 0
+    parts = []
+    scanner = JsonObjectScanner()
+    early_stop = budget_stop = False
+    resp = http.post(url, json=payload, timeout=timeout, stream=True)
+    try:
+        resp.raise_for_status()
+        for line in resp.iter_lines():
+            if not line:
+                continue
+            chunk = json.loads(line)
+            if chunk.get("error"):
+                raise RuntimeError(chunk["error"])
+            token = chunk.get("response", "")
+            if token:
+                if ttft is None:
+                    ttft = time.perf_counter() - t0
+                tokens += 1
+                parts.append(token)
+                if scanner.feed(token) is not None:
+                    early_stop = not chunk.get("done")
+                    break
+            if chunk.get("done"):
+                break
+            if token_budget and tokens >= token_budget:
+                budget_stop = True
+                break
+    finally:
+        resp.close()
+
+    total = time.perf_counter() - t0
+    gen = total - (ttft or 0.0)
+    stats = {
+        "ttft_s": ttft, "tokens": tokens, "gen_s": gen, "total_s": total,
+        "tokens_per_s": (tokens - 1) / gen if tokens > 1 and gen > 0 else 0.0,
+        "early_stop": early_stop, "budget_stop": budget_stop,
+    }
+    text = scanner.result if scanner.result is not None else "".join(parts)
+    return text, stats
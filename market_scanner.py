@@ -1,14 +1,36 @@
 import json
 import time
 import datetime
-import pandas as pd
-import numpy as np
-import yfinance as yf
 import os
 import sys
-from alpaca.trading.client import TradingClient
-from alpaca.trading.requests import GetAssetsRequest
-from alpaca.trading.enums import AssetClass, AssetStatus
+from chunk_pipeline import run_chunked
+import telemetry
+from telemetry import instrument
+from earnings_guard import EarningsCalendar, yfinance_calendar_fetcher, days_until
+from lazy_imports import lazy_import
+
+# Heavy modules load on first use, so a gatekeeper abort never pays for them
+# (alpaca is imported inside the two functions that need it)
+pd = lazy_import("pandas")
+np = lazy_import("numpy")
+yf = lazy_import("yfinance")
+bar_store = lazy_import("bar_store")
+indicator_engine = lazy_import("indicator_engine")
+indicator_state = lazy_import("indicator_state")
+universe_snapshot = lazy_import("universe_snapshot")
+
+# Names other modules import from here, resolved through the lazy modules above
+_LAZY_EXPORTS = {
+    "BarStore": "bar_store", "split_download": "bar_store",
+    "compute_indicators": "indicator_engine", "TECH_THRESHOLDS": "indicator_engine",
+    "IndicatorState": "indicator_state",
+    "UniverseSnapshot": "universe_snapshot", "UNIVERSE_FILE": "universe_snapshot",
+}
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        return getattr(globals()[_LAZY_EXPORTS[name]], name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # --- CONFIGURATION ---
 MIN_VOLUME = 1_500_000   # Liquidity Check
@@ -16,6 +38,12 @@ MIN_PRICE = 15.00        # No Penny Stocks
 MAX_PRICE = 500.00
 OUTPUT_FILE = "dragnet_candidates.json"
 KEYS_FILE = "keys.json"
+USE_BAR_CACHE = True       # Persistent OHLCV cache (bar_store.py), delta fetch only
+USE_INDICATOR_STATE = True # O(1)-per-bar indicator carries (indicator_state.py); needs the bar cache
+VOLUME_HISTORY_DAYS = 7    # Calendar days needed by the liquidity filter (~5 sessions)
+VOLUME_WORKERS = 4         # Concurrent chunk downloads in the liquidity filter
+RUN_METRICS_FILE = telemetry.METRICS_FILE   # Per-run stage metrics (telemetry.py)
+UNIVERSE_MAX_AGE_HOURS = 20  # Re-pull the Alpaca asset list once per trading day
 
 # --- GATEKEEPER (CST EDITION) ---
 def is_mission_time():
@@ -49,6 +77,7 @@ def get_alpaca_client():
     try:
         with open(KEYS_FILE, 'r') as f:
             keys = json.load(f)
+        from alpaca.trading.client import TradingClient
         return TradingClient(keys['APCA_API_KEY_ID'], keys['APCA_API_SECRET_KEY'], paper=True)
     except Exception as e:
         print(f"[!] Error loading keys.json: {e}")
@@ -91,111 +120,160 @@ class TechnicalMath:
 
 # --- LOGIC ---
 
-def get_market_universe(client):
+def fetch_assets(client):
+    from alpaca.trading.requests import GetAssetsRequest
+    from alpaca.trading.enums import AssetClass, AssetStatus
+    req = GetAssetsRequest(status=AssetStatus.ACTIVE, asset_class=AssetClass.US_EQUITY)
+    return client.get_all_assets(req)
+
+@instrument()
+def get_market_universe(client, profile="dragnet", snapshot_file=None):
     print("--- 🕸️ DEPLOYING DRAGNET (Universe Scan) ---")
-    print("1. Fetching asset list from Alpaca...")
-    max_retries = 3
-    for attempt in range(max_retries):
-        try:
-            req = GetAssetsRequest(status=AssetStatus.ACTIVE, asset_class=AssetClass.US_EQUITY)
-            assets = client.get_all_assets(req)
-            clean_list = [
-                a.symbol for a in assets 
-                if a.tradable and a.marginable and a.shortable and "." not in a.symbol
-            ]
-            print(f"   -> Found {len(clean_list)} tradeable assets.")
-            return clean_list
-        except Exception as e:
-            print(f"   [!] Alpaca Error (Attempt {attempt+1}/{max_retries}): {e}")
-            time.sleep(2 * (attempt + 1))
-    
-    print("   [!] Failed to fetch assets after retries.")
-    return []
+    snapshot_file = snapshot_file or universe_snapshot.UNIVERSE_FILE
+    snapshot = universe_snapshot.UniverseSnapshot.load(snapshot_file)
+    if snapshot is not None and not snapshot.is_stale(UNIVERSE_MAX_AGE_HOURS):
+        print(f"1. Using asset snapshot ({snapshot.age_hours():.1f}h old, {len(snapshot)} assets)...")
+    else:
+        print("1. Fetching asset list from Alpaca...")
+        max_retries = 3
+        for attempt in range(max_retries):
+            try:
+                fresh = universe_snapshot.UniverseSnapshot.from_assets(fetch_assets(client))
+                if snapshot is not None:
+                    added, removed, changed = fresh.diff(snapshot)
+                    print(f"   -> Universe delta: +{len(added)} / -{len(removed)} / ~{len(changed)} changed.")
+                try:
+                    fresh.save(snapshot_file)
+                except OSError as e:
+                    print(f"   [!] Could not save universe snapshot: {e}")
+                snapshot = fresh
+                break
+            except Exception as e:
+                print(f"   [!] Alpaca Error (Attempt {attempt+1}/{max_retries}): {e}")
+                time.sleep(2 * (attempt + 1))
+        else:
+            if snapshot is None:
+                print("   [!] Failed to fetch assets after retries.")
+                return []
+            print(f"   [!] Failed to fetch assets after retries. Using stale snapshot ({snapshot.age_hours():.1f}h old).")
+
+    clean_list = snapshot.profile(profile)
+    print(f"   -> Found {len(clean_list)} tradeable assets.")
+    return clean_list
+
+def is_liquid(data):
+    avg_vol = data['Volume'].tail(3).mean()
+    curr_price = data['Close'].iloc[-1]
+    return avg_vol > MIN_VOLUME and MIN_PRICE < curr_price < MAX_PRICE
 
-def filter_by_volume(tickers, chunk_size=200):
+def download_recent(chunk):
+    """Last 5 sessions for a chunk of symbols -> {symbol: DataFrame}."""
+    df = yf.download(chunk, period="5d", interval="1d", group_by='ticker', progress=False, threads=True)
+    return bar_store.split_download(df, chunk)
+
+@instrument()
+def filter_by_volume(tickers, chunk_size=200, store=None, download_fn=None):
     print(f"2. Filtering for Liquidity (Vol > {MIN_VOLUME/1_000_000:.1f}M)...")
     liquid_tickers = []
-    total = len(tickers)
-    for i in range(0, total, chunk_size):
-        chunk = tickers[i:i+chunk_size]
-        try:
-            df = yf.download(chunk, period="5d", interval="1d", group_by='ticker', progress=False, threads=True)
-            if len(chunk) > 1:
-                for sym in chunk:
-                    try:
-                        if sym not in df.columns.levels[0]: continue
-                        data = df[sym]
-                        if data.empty: continue
-                        avg_vol = data['Volume'].tail(3).mean()
-                        curr_price = data['Close'].iloc[-1]
-                        if avg_vol > MIN_VOLUME and MIN_PRICE < curr_price < MAX_PRICE:
-                            liquid_tickers.append(sym)
-                    except: continue
-            else:
-                avg_vol = df['Volume'].tail(3).mean()
-                curr_price = df['Close'].iloc[-1]
-                if avg_vol > MIN_VOLUME and MIN_PRICE < curr_price < MAX_PRICE:
-                    liquid_tickers.append(tickers[0])
-            print(f"   -> Batch {i}/{total}: Found {len(liquid_tickers)} candidates...", end='\r')
-        except: pass
-    print(f"\n   -> Final Liquid List: {len(liquid_tickers)} stocks.")
+    if store is not None:
+        # Delta top-up from the bar cache instead of a fresh 5d download
+        stats = store.update(tickers, history_days=VOLUME_HISTORY_DAYS)
+        print(f"   -> Bar cache: {stats['delta']} delta / {stats['full']} new symbols in {stats['requests']} requests.")
+        for sym in tickers:
+            try:
+                data = store.frame(sym)
+                if data is None or data.empty: continue
+                if is_liquid(data):
+                    liquid_tickers.append(sym)
+            except: continue
+        print(f"   -> Final Liquid List: {len(liquid_tickers)} stocks.")
+        return liquid_tickers
+    # Pipelined download: VOLUME_WORKERS chunks in flight, failed chunks bisected
+    position = {sym: n for n, sym in enumerate(tickers)}
+
+    def evaluate(chunk, frames):
+        for sym, data in frames.items():
+            try:
+                if data.empty: continue
+                if is_liquid(data):
+                    liquid_tickers.append(sym)
+            except: continue
+
+    def progress(done, total):
+        print(f"   -> Batch {done}/{total}: Found {len(liquid_tickers)} candidates...", end='\r')
+
+    stats = run_chunked(tickers, download_fn or download_recent, evaluate,
+                        chunk_size=chunk_size, workers=VOLUME_WORKERS, progress=progress)
+    liquid_tickers.sort(key=position.get)
+    telemetry.count("filter_by_volume", retries=stats.bisections, errors=len(stats.failed_symbols))
+    print(f"\n   -> Download stats: {stats.summary()}")
+    print(f"   -> Final Liquid List: {len(liquid_tickers)} stocks.")
     return liquid_tickers
 
-def analyze_technicals(tickers):
+def classify_technicals(sym, price, rsi, adx, sma200, th=None):
+    """Assigns a symbol to exactly one dragnet list. Returns the candidate dict or None."""
+    th = th or indicator_engine.TECH_THRESHOLDS
+    if pd.isna(rsi) or pd.isna(adx) or pd.isna(sma200): return None
+
+    # --- EXCLUSIVE LIST LOGIC ---
+    # We use if/elif to ensure a ticker only ends up in ONE list.
+
+    # 1. TREND TARGETS (Momentum)
+    # Buying Strength: Price > SMA200, Strong Trend (ADX > 25), RSI > 55 (But not insane)
+    if price > sma200 and adx > th['trend_adx_min'] and th['trend_rsi_min'] < rsi < th['trend_rsi_max']:
+        return {"symbol": sym, "type": "trend_targets", "score": adx}
+
+    # 2. SURVIVOR TARGETS (Dip Buyers)
+    # Buying Weakness in Uptrend: Price > SMA200, RSI < 40 (Oversold)
+    elif price > sma200 and rsi < th['survivor_rsi_max']:
+        return {"symbol": sym, "type": "survivor_targets", "score": (50-rsi)}
+
+    # 3. WHEEL TARGETS (Stable/Neutral Bull)
+    # Price > SMA200, RSI Healthy (40-55), lower ADX preferred for range
+    elif price > sma200 and th['wheel_rsi_min'] <= rsi <= th['wheel_rsi_max']:
+        return {"symbol": sym, "type": "wheel_targets", "score": (50-rsi)}
+
+    # 4. CONDOR TARGETS (Chop/Sideways)
+    # No Trend (ADX < 20), RSI Middle
+    elif adx < th['condor_adx_max'] and th['condor_rsi_min'] < rsi < th['condor_rsi_max']:
+        return {"symbol": sym, "type": "condor_targets", "score": (20-adx)}
+
+    # 5. SHORT TARGETS (Bearish)
+    # Price < SMA200 (Downtrend)
+    elif price < sma200:
+        # Score based on how "bad" it is (Lower RSI = crash mode, Higher RSI = rip sell)
+        return {"symbol": sym, "type": "short_targets", "score": adx}
+
+    return None
+
+@instrument()
+def analyze_technicals(tickers, store=None, state=None):
     print(f"3. Analyzing Technicals (Segregated Lists) for {len(tickers)} stocks...")
     candidates = []
     if not tickers: return []
     try:
-        data = yf.download(tickers, period="2y", interval="1d", group_by='ticker', progress=False, threads=True)
-        for sym in tickers:
+        if store is not None:
+            stats = store.update(tickers)
+            print(f"   -> Bar cache: {stats['delta']} delta / {stats['full']} full symbols, {stats['bars']} bars fetched.")
+            if stats.get('rescaled'):
+                print(f"   -> Re-seeded {len(stats['rescaled'])} split/dividend-adjusted symbols: {', '.join(stats['rescaled'][:10])}")
+        if store is not None and state is not None:
+            # Only bars each symbol hasn't seen yet; today's partial bar is previewed
+            synced = state.sync(store, tickers)
+            print(f"   -> Indicator state: {synced['bars']} new bars applied, {synced['previewed']} live previews.")
+            indicators = state.indicators(tickers)
+        else:
+            if store is not None:
+                data = store.panel(tickers)
+            else:
+                data = yf.download(tickers, period="2y", interval="1d", group_by='ticker', progress=False, threads=True)
+            # One batched pass over the whole universe (indicator_engine.py)
+            indicators = indicator_engine.compute_indicators(data, tickers)
+        for sym, row in indicators.iterrows():
             try:
-                if len(tickers) > 1:
-                    if sym not in data.columns.levels[0]: continue
-                    df = data[sym].copy()
-                else: df = data.copy()
-                if len(df) < 205: continue 
-                df = df.dropna()
-                
-                df['rsi'] = TechnicalMath.get_rsi(df['Close'])
-                df['adx'] = TechnicalMath.get_adx(df['High'], df['Low'], df['Close'])
-                df['sma200'] = TechnicalMath.get_sma(df['Close'], 200)
-                
-                current = df.iloc[-1]
-                rsi = float(current['rsi'])
-                adx = float(current['adx'])
-                sma200 = float(current['sma200'])
-                price = float(current['Close'])
-                if pd.isna(rsi) or pd.isna(adx) or pd.isna(sma200): continue
-
-                # --- EXCLUSIVE LIST LOGIC ---
-                # We use if/elif to ensure a ticker only ends up in ONE list.
-
-                # 1. TREND TARGETS (Momentum)
-                # Buying Strength: Price > SMA200, Strong Trend (ADX > 25), RSI > 55 (But not insane)
-                if price > sma200 and adx > 25 and 55 < rsi < 75:
-                    candidates.append({"symbol": sym, "type": "trend_targets", "score": adx})
-                
-                # 2. SURVIVOR TARGETS (Dip Buyers)
-                # Buying Weakness in Uptrend: Price > SMA200, RSI < 40 (Oversold)
-                elif price > sma200 and rsi < 40:
-                    candidates.append({"symbol": sym, "type": "survivor_targets", "score": (50-rsi)})
-
-                # 3. WHEEL TARGETS (Stable/Neutral Bull)
-                # Price > SMA200, RSI Healthy (40-55), lower ADX preferred for range
-                elif price > sma200 and 40 <= rsi <= 55:
-                    candidates.append({"symbol": sym, "type": "wheel_targets", "score": (50-rsi)})
-                
-                # 4. CONDOR TARGETS (Chop/Sideways)
-                # No Trend (ADX < 20), RSI Middle
-                elif adx < 20 and 40 < rsi < 60:
-                    candidates.append({"symbol": sym, "type": "condor_targets", "score": (20-adx)})
-                
-                # 5. SHORT TARGETS (Bearish)
-                # Price < SMA200 (Downtrend)
-                elif price < sma200:
-                    # Score based on how "bad" it is (Lower RSI = crash mode, Higher RSI = rip sell)
-                    candidates.append({"symbol": sym, "type": "short_targets", "score": adx})
-
+                item = classify_technicals(sym, float(row['price']), float(row['rsi']),
+                                           float(row['adx']), float(row['sma200']))
+                if item: candidates.append(item)
             except: continue
     except Exception as e:
         print(f"   [!] Tech Analysis Error: {e}")
@@ -225,57 +303,19 @@ def get_earnings_date(ticker_symbol):
     Checks if earnings are within the next 2 days.
     Returns: True if SAFE (No earnings soon), False if DANGER.
     Skips ETFs gracefully.
+    Single live lookup; the dragnet itself goes through EarningsCalendar.
     """
     # Quick ETF Check
     if is_etf(ticker_symbol):
         return True
 
     try:
-        ticker = yf.Ticker(ticker_symbol)
-        
-        # Suppress 404s - ETFs and some stocks simply don't have calendars
-        import contextlib
-        import io
-        
-        with contextlib.redirect_stderr(io.StringIO()):
-            calendar = ticker.calendar
-            
-        # If calendar is None or empty, assume safe (ETF or no data)
-        if calendar is None:
-            return True
-            
-        # Handle different calendar formats yfinance returns
-        if hasattr(calendar, 'empty') and calendar.empty:
-            return True
-            
-        if isinstance(calendar, dict) and not calendar:
-            return True
-
-        # --- Earning Date Extraction ---
-        if hasattr(calendar, 'iloc'):
-            next_earnings = calendar.iloc[0][0]
-        elif isinstance(calendar, dict):
-            earnings_dates = calendar.get('Earnings Date', [])
-            if not earnings_dates:
-                return True
-            next_earnings = earnings_dates[0]
-        else:
-            return True
-
-        if isinstance(next_earnings, (datetime.date, datetime.datetime)):
-            if isinstance(next_earnings, pd.Timestamp):
-                next_earnings = next_earnings.to_pydatetime()
-            
-            if next_earnings.tzinfo:
-                next_earnings = next_earnings.replace(tzinfo=None)
-
-            now = datetime.datetime.now()
-            days_until = (next_earnings - now).days
-            
-            if 0 <= days_until <= 2:
-                print(f"   [!] {ticker_symbol} has earnings in {days_until} days. Skipping.")
+        next_earnings = yfinance_calendar_fetcher(ticker_symbol)
+        if next_earnings is not None:
+            until = days_until(next_earnings)
+            if 0 <= until <= 2:
+                print(f"   [!] {ticker_symbol} has earnings in {until} days. Skipping.")
                 return False
-                
     except Exception:
         # Silently pass - 404s, missing data, ETFs all land here
         # Default to SAFE so we don't block valid tickers
@@ -283,18 +323,8 @@ def get_earnings_date(ticker_symbol):
         
     return True
 
-def run_dragnet():
-    # --- GATEKEEPER CHECK ---
-    if not is_mission_time():
-        sys.exit(0) # Exit cleanly
-    # ------------------------
-
-    client = get_alpaca_client()
-    if not client: return
-    all_tickers = get_market_universe(client)
-    liquid_tickers = filter_by_volume(all_tickers)
-    results = analyze_technicals(liquid_tickers)
-    
+def build_dragnet_output(results, per_category=10):
+    """Top `per_category` candidates per list, highest score first (dragnet_candidates.json shape)."""
     final_output = {
         "trend_targets": [], 
         "survivor_targets": [],
@@ -302,19 +332,9 @@ def run_dragnet():
         "condor_targets": [],
         "short_targets": []
     }
-    
-    results.sort(key=lambda x: x['score'], reverse=True)
-    
-    # [FILTER] Earnings Guard
-    safe_results = []
-    print("\n4. Checking Earnings Calendar (Safety Guard)...")
-    for item in results:
-        if get_earnings_date(item['symbol']):
-            safe_results.append(item)
-    
-    for item in safe_results:
+    for item in sorted(results, key=lambda x: x['score'], reverse=True):
         category = item['type']
-        if len(final_output[category]) < 10: 
+        if len(final_output[category]) < per_category: 
             # [MODIFIED] Store Object instead of String
             # Old: final_output[category].append(item['symbol'])
             # New:
@@ -322,12 +342,60 @@ def run_dragnet():
                 "symbol": item['symbol'],
                 "tech_score": round(item['score'], 2)
             })
-            
+    return final_output
+
+def run_dragnet(client=None, store=None, state=None, calendar=None):
+    """
+    One full scan. The optional arguments let a resident process (scout_daemon.py)
+    pass in its already-loaded Alpaca client, bar store, indicator state and
+    earnings calendar instead of rebuilding them from disk.
+    Returns False when the gatekeeper says it isn't mission time.
+    """
+    # --- GATEKEEPER CHECK ---
+    if not is_mission_time():
+        return False
+    # ------------------------
+
+    telemetry.start_run("dragnet")
+    client = client or get_alpaca_client()
+    if not client:
+        telemetry.finish_run(RUN_METRICS_FILE, error="no client")   # A failed login is worth a row too
+        return
+    if store is None and USE_BAR_CACHE:
+        store = bar_store.BarStore()
+    all_tickers = get_market_universe(client)
+    liquid_tickers = filter_by_volume(all_tickers, store=store)
+    if state is None and store is not None and USE_INDICATOR_STATE:
+        state = indicator_state.IndicatorState()
+    results = analyze_technicals(liquid_tickers, store=store, state=state)
+    if state is not None:
+        state.save()
+
+    results.sort(key=lambda x: x['score'], reverse=True)
+    
+    # [FILTER] Earnings Guard
+    print("\n4. Checking Earnings Calendar (Safety Guard)...")
+    with telemetry.stage("earnings_guard"):
+        calendar = calendar or EarningsCalendar(skip=is_etf)
+        stats = calendar.refresh([item['symbol'] for item in results])
+        print(f"   -> Refreshed {stats['fetched']}/{stats['symbols']} calendars ({stats['errors']} unavailable).")
+        safe_results = [item for item in results if calendar.is_safe(item['symbol'])]
+    telemetry.count("earnings_guard", cache_hits=stats['symbols'] - stats['fetched'], errors=stats['errors'])
+    try:
+        calendar.save()
+    except OSError as e:
+        print(f"   [!] Could not save earnings cache: {e}")
+
+    final_output = build_dragnet_output(safe_results)
+
     print("\n--- 🎯 DRAGNET RESULTS ---")
     print(json.dumps(final_output, indent=4))
     with open(OUTPUT_FILE, 'w') as f:
         json.dump(final_output, f, indent=4)
         print(f"   ✅ Saved to {OUTPUT_FILE}")
+    telemetry.finish_run(RUN_METRICS_FILE, liquid=len(liquid_tickers), classified=len(results),
+                         candidates=sum(len(v) for v in final_output.values()))
 
 if __name__ == "__main__":
-    run_dragnet()
+    if run_dragnet() is False:
+        sys.exit(0) # Exit cleanly
@@ -0,0 +1,94 @@
+import re
+import hashlib
+import threading
+import unicodedata
+from functools import lru_cache
+
+# --- NEWS CLASSIFICATION + DEDUP ---
+# PublisherTiers compiles each tier's source names (plus aliases) into one
+# regex and memoizes per publisher string, replacing the per-item
+# any(src in publisher ...) scans. HeadlineIndex recognises syndicated copies
+# of a headline by a hash of its normalized title.
+
+# Spellings Yahoo's providers use that the tier lists don't contain as a substring
+PUBLISHER_ALIASES = {
+    "Wall Street Journal": "WSJ",
+    "Motley Fool": "The Motley Fool",
+    "Barrons": "Barron's",
+    "Investors Business Daily": "Investor's Business Daily",
+    "Investor’s Business Daily": "Investor's Business Daily",
+    "FT.com": "Financial Times",
+}
+
+# " - Reuters", " | Bloomberg" style source tags syndicators append to titles
+_TITLE_SUFFIX = re.compile(r"\s+[-|–—]\s+[^-|–—]{2,40}$")
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+class PublisherTiers:
+    """
+    tier_of(publisher) -> index of the first tier with a name (or alias)
+    occurring in `publisher`, else len(tiers). Same substring semantics and
+    tier precedence as checking each tier's list in order.
+    """
+
+    def __init__(self, tiers, aliases=PUBLISHER_ALIASES):
+        self.patterns = []
+        for names in tiers:
+            names = set(names)
+            names.update(alias for alias, canonical in aliases.items() if canonical in names)
+            alternation = "|".join(re.escape(n) for n in sorted(names, key=len, reverse=True))
+            self.patterns.append(re.compile(alternation))
+        self.tier_of = lru_cache(maxsize=4096)(self._tier_of)
+
+    def _tier_of(self, publisher):
+        for i, pattern in enumerate(self.patterns):
+            if pattern.search(publisher):
+                return i
+        return len(self.patterns)
+
+
+def normalize_title(title):
+    """Lowercase alphanumerics only, accents and a trailing source tag stripped."""
+    title = title or ""
+    if not title.isascii():
+        title = unicodedata.normalize("NFKD", title).encode("ascii", "ignore").decode("ascii")
+    title = _TITLE_SUFFIX.sub("", title.strip())
+    return _NON_WORD.sub(" ", title.lower()).strip()
+
+def title_key(title):
+    """Hash of the normalized title, or None when nothing is left to compare."""
+    norm = normalize_title(title)
+    if not norm:
+        return None
+    return hashlib.blake2b(norm.encode("utf-8"), digest_size=12).hexdigest()
+
+
+class HeadlineIndex:
+    """
+    Run-wide map of headline key -> first news item text seen for it.
+    canonical() hands every later copy the first one's text, so syndicated
+    stories produce identical prompts (and verdict-cache keys) across tickers.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.first = {}
+        self.rewritten = 0
+        self.dropped = 0   # Duplicates removed within one ticker's news
+
+    def canonical(self, key, item):
+        with self._lock:
+            seen = self.first.setdefault(key, item)
+            if seen != item:
+                self.rewritten += 1
+            return seen
+
+    def count_dropped(self, n):
+        if n:
+            with self._lock:
+                self.dropped += n
+
+    def summary(self):
+        return (f"{len(self.first)} unique headlines, {self.dropped} duplicates dropped, "
+                f"{self.rewritten} syndicated copies unified")
@@ -0,0 +1,189 @@
+import time
+import datetime
+import threading
+from urllib.parse import urlsplit, urlunsplit
+from concurrent.futures import ThreadPoolExecutor
+
+# --- RUN-LEVEL NEWS STORE ---
+# Candidates in the same sector pull the same macro and sector stories. The
+# store fetches each ticker's Yahoo feed once (concurrently) and keys
+# articles by UUID, or canonical URL when there isn't one. Each unique
+# article is parsed once, and every ticker whose feed or relatedTickers
+# names it points at the same record. Identical articles give identical
+# prompt text, so their LLM verdicts come back from the verdict cache.
+
+NEWS_MAX_AGE_HOURS = 168   # Same 7-day window get_tiered_news always applied
+NEWS_FETCH_WORKERS = 8
+
+
+def _pub_time(info):
+    pub_time = info.get('providerPublishTime', 0)
+    if not pub_time and 'pubDate' in info:
+        try:
+            # Parse ISO: 2026-02-18T14:43:06Z
+            dt = datetime.datetime.strptime(info['pubDate'], "%Y-%m-%dT%H:%M:%SZ")
+            pub_time = dt.replace(tzinfo=datetime.timezone.utc).timestamp()
+        except Exception:
+            pass
+    return pub_time or 0
+
+def canonical_url(url):
+    """Scheme/host lowercased, query and fragment dropped, no trailing slash."""
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), "", ""))
+
+def parse_news_item(n, now=None, max_age_hours=NEWS_MAX_AGE_HOURS):
+    """
+    One raw yfinance news entry (old flat shape or new {"content": ...} shape)
+    -> {"id", "title", "publisher", "link", "pub_time", "tickers"}, or None if
+    it's empty or older than the window.
+    """
+    if not n: return None
+    # Handle new vs old structure
+    info = n.get('content', n)
+    if not info: return None
+
+    pub_time = _pub_time(info)
+    now = time.time() if now is None else now
+    if (now - pub_time) > (max_age_hours * 3600): return None
+
+    publisher = info.get('publisher', '')
+    if not publisher:
+        provider = info.get('provider') or {}
+        publisher = provider.get('displayName', 'Unknown')
+
+    title = info.get('title', '')
+    link = info.get('link', '')
+    if not link:
+        ctu = info.get('clickThroughUrl') or {}
+        link = ctu.get('url', '')
+    canonical = (info.get('canonicalUrl') or {}).get('url') or link
+
+    tickers = list(info.get('relatedTickers') or [])
+    for st in (info.get('finance') or {}).get('stockTickers') or []:
+        if isinstance(st, dict) and st.get('symbol'):
+            tickers.append(st['symbol'])
+
+    article_id = n.get('uuid') or n.get('id') or info.get('id') or canonical_url(canonical) \
+        or f"{publisher}|{title}"
+    return {
+        "id": article_id, "title": title, "publisher": publisher, "link": link,
+        "pub_time": pub_time, "tickers": [t.upper() for t in dict.fromkeys(tickers)],
+    }
+
+
+class NewsStore:
+    """
+    Articles keyed by id, plus which tickers' feeds carried each one and
+    which tickers it mentions. Thread safe; evicts past `max_age_hours`.
+    """
+
+    def __init__(self, max_age_hours=NEWS_MAX_AGE_HOURS, ticker_factory=None):
+        self.max_age_hours = max_age_hours
+        self.ticker_factory = ticker_factory   # yf.Ticker; injected so callers' patches apply
+        self.articles = {}    # id -> parsed article
+        self.feeds = {}       # ticker -> [article id, ...] in feed order
+        self.mentions = {}    # ticker -> {article id, ...} via relatedTickers
+        self.fetched_at = {}  # ticker -> time.time() of its feed fetch
+        self.parsed = 0
+        self.reused = 0
+        self._lock = threading.Lock()
+
+    def ingest(self, ticker, raw_items, now=None):
+        """Files one ticker's raw feed. Articles already in the store aren't re-parsed."""
+        now = time.time() if now is None else now
+        ids = []
+        for n in raw_items or []:
+            if not n: continue
+            raw_id = n.get('uuid') or n.get('id')
+            with self._lock:
+                if raw_id and raw_id in self.articles:
+                    self.reused += 1
+                    ids.append(raw_id)
+                    continue
+            article = parse_news_item(n, now, self.max_age_hours)
+            if article is None: continue
+            with self._lock:
+                if article["id"] in self.articles:
+                    self.reused += 1
+                else:
+                    self.articles[article["id"]] = article
+                    self.parsed += 1
+                    for sym in article["tickers"]:
+                        self.mentions.setdefault(sym, set()).add(article["id"])
+            ids.append(article["id"])
+        with self._lock:
+            self.feeds[ticker] = list(dict.fromkeys(ids))
+            self.fetched_at[ticker] = now
+        return len(ids)
+
+    def fetch_one(self, ticker):
+        """Fetches and files one ticker's feed; returns False on a fetch error."""
+        try:
+            news = self.ticker_factory(ticker).news
+        except Exception as e:
+            print(f"   [!] Error getting news for {ticker}: {e}")
+            return False
+        self.ingest(ticker, news)
+        return True
+
+    def fetch(self, tickers, workers=NEWS_FETCH_WORKERS):
+        """Concurrent fetch of every ticker not already in the store. Returns the count fetched."""
+        todo = [t for t in dict.fromkeys(tickers) if t not in self.feeds]
+        if todo:
+            with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="news") as pool:
+                list(pool.map(self.fetch_one, todo))
+        self.evict()
+        return len(todo)
+
+    def has(self, ticker):
+        with self._lock:
+            return ticker in self.feeds
+
+    def articles_for(self, ticker, include_mentions=False, now=None):
+        """
+        The ticker's feed as parsed articles, newest window only. With
+        include_mentions, articles from other feeds that list it in
+        relatedTickers are appended (newest first).
+        """
+        now = time.time() if now is None else now
+        cutoff = now - self.max_age_hours * 3600
+        with self._lock:
+            ids = list(self.feeds.get(ticker, ()))
+            if include_mentions:
+                extra = self.mentions.get(ticker.upper(), set()).difference(ids)
+                ids += sorted(extra, key=lambda i: -self.articles[i]["pub_time"])
+            return [self.articles[i] for i in ids if i in self.articles and self.articles[i]["pub_time"] >= cutoff]
+
+    def shared(self):
+        """Articles carried by more than one ticker's feed."""
+        with self._lock:
+            counts = {}
+            for ids in self.feeds.values():
+                for i in ids:
+                    counts[i] = counts.get(i, 0) + 1
+        return sum(1 for c in counts.values() if c > 1)
+
+    def evict(self, now=None):
+        """Drops articles older than the window (and their references). Returns the count."""
+        now = time.time() if now is None else now
+        cutoff = now - self.max_age_hours * 3600
+        with self._lock:
+            stale = {i for i, a in self.articles.items() if a["pub_time"] < cutoff}
+            if not stale:
+                return 0
+            for i in stale:
+                del self.articles[i]
+            for ticker, ids in self.feeds.items():
+                self.feeds[ticker] = [i for i in ids if i not in stale]
+            for sym in list(self.mentions):
+                self.mentions[sym] -= stale
+                if not self.mentions[sym]:
+                    del self.mentions[sym]
+        return len(stale)
+
+    def summary(self):
+        return (f"{len(self.articles)} articles for {len(self.feeds)} tickers, "
+                f"{self.shared()} shared, {self.reused} re-parses avoided")
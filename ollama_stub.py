@@ -0,0 +1,206 @@
+import re
+import json
+import time
+import zlib
+import contextlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# --- OLLAMA STAND-IN ---
+# Local fake of Ollama's /api/generate for offline tests and benchmarks.
+# Latency model: a fixed cost per call (prompt load/eval) plus a cost per
+# scored item, which is roughly how a single-GPU Ollama behaves.
+# With "stream": true the reply goes out as NDJSON token chunks, paced by
+# token_latency and cut off at options.num_predict, like the real server.
+
+ITEM_RE = re.compile(r"^\[(\d+)\] SYMBOL: (\S+) \| TIER: (\S+)", re.MULTILINE)
+TICKER_RE = re.compile(r"^TICKER: (\S+)", re.MULTILINE)
+SECTION_RE = re.compile(r"^### (\S+)$", re.MULTILINE)
+TOKEN_CHARS = 4   # Characters per fake token when streaming
+STUB_REASON = "Stub verdict: headlines are mixed but lean constructive for the stated strategy."
+
+def stub_score(text):
+    """Deterministic 0-1 score derived from the prompt text."""
+    return (zlib.crc32(text.encode("utf-8")) % 100) / 100.0
+
+def sections_reply(prompt, reason=STUB_REASON):
+    """Consolidated (one ticker, several ### SECTIONS) reply, or None for other prompts."""
+    ticker = TICKER_RE.search(prompt)
+    sections = SECTION_RE.findall(prompt)
+    if not ticker or not sections:
+        return None
+    return json.dumps({"sections": {
+        sec.lower(): {"score": stub_score(ticker.group(1) + sec.lower()), "reason": reason}
+        for sec in sections
+    }}), len(sections)
+
+def default_responder(prompt):
+    """Returns (response_text, item_count) for a prompt."""
+    consolidated = sections_reply(prompt)
+    if consolidated:
+        return consolidated
+    items = ITEM_RE.findall(prompt)
+    if items:
+        results = [
+            {"symbol": sym, "tier": tier, "score": stub_score(sym + tier), "reason": STUB_REASON}
+            for _, sym, tier in items
+        ]
+        return json.dumps({"results": results}), len(items)
+    return json.dumps({"score": stub_score(prompt), "reason": STUB_REASON}), 1
+
+def canned_responder(single, batch_reason=STUB_REASON):
+    """
+    Replays recorded single-item replies (clean, chatty, weak, broken...),
+    picked deterministically from the prompt; batch and consolidated prompts get
+    well-formed results.
+    """
+    def respond(prompt):
+        consolidated = sections_reply(prompt, batch_reason)
+        if consolidated:
+            return consolidated
+        items = ITEM_RE.findall(prompt)
+        if items:
+            results = [
+                {"symbol": sym, "tier": tier, "score": stub_score(sym + tier), "reason": batch_reason}
+                for _, sym, tier in items
+            ]
+            return json.dumps({"results": results}), len(items)
+        return single[zlib.crc32(prompt.encode("utf-8")) % len(single)], 1
+    return respond
+
+
+class OllamaStub:
+    """
+    Threaded HTTP server answering POST /api/generate.
+    `responder(prompt)` -> (response_text, item_count) can be swapped per test.
+    """
+
+    def __init__(self, port=0, call_latency=0.0, item_latency=0.0, responder=None, serial=True,
+                 token_latency=0.0):
+        self.call_latency = call_latency
+        self.item_latency = item_latency
+        self.token_latency = token_latency
+        self.responder = responder or default_responder
+        self.calls = 0
+        self.items = 0
+        self.tokens_sent = 0
+        self.contexts_seen = 0   # Requests that carried a primed `context`
+        self.cancelled = 0   # Streams the client hung up on before "done"
+        self._gpu = threading.Lock() if serial else None  # Ollama default: one request at a time
+        self._stats_lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like the real server
+            disable_nagle_algorithm = True  # Headers and body go out as separate writes
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                if payload.get("stream"):
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/x-ndjson")
+                    self.send_header("Transfer-Encoding", "chunked")
+                    self.end_headers()
+                    chunks = stub.stream(payload)
+                    try:
+                        for chunk in chunks:
+                            line = json.dumps(chunk).encode("utf-8") + b"\n"
+                            self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+                            self.wfile.flush()
+                        self.wfile.write(b"0\r\n\r\n")
+                    except (BrokenPipeError, ConnectionResetError):
+                        with stub._stats_lock:
+                            stub.cancelled += 1
+                        self.close_connection = True
+                    finally:
+                        chunks.close()   # Frees the "GPU" straight away on hang-up
+                    return
+                body = stub.handle(payload)
+                raw = json.dumps(body).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/api/generate"
+
+    def handle(self, payload):
+        text, n_items = self.responder(payload.get("prompt", ""))
+        if self._gpu:
+            with self._gpu:
+                time.sleep(self.call_latency + self.item_latency * n_items)
+        else:
+            time.sleep(self.call_latency + self.item_latency * n_items)
+        with self._stats_lock:
+            self.calls += 1
+            self.items += n_items
+        with self._stats_lock:
+            self.contexts_seen += "context" in payload
+        # Real Ollama returns the evaluated tokens; any stable list works here
+        return {"model": payload.get("model"), "response": text, "done": True,
+                "context": [zlib.crc32(payload.get("prompt", "").encode("utf-8"))]}
+
+    def stream(self, payload):
+        """Yields NDJSON chunks: one per token, then a final done chunk with eval stats."""
+        text, n_items = self.responder(payload.get("prompt", ""))
+        budget = (payload.get("options") or {}).get("num_predict")
+        tokens = [text[i:i + TOKEN_CHARS] for i in range(0, len(text), TOKEN_CHARS)]
+        reason = "stop"
+        if budget and budget > 0 and len(tokens) > budget:
+            tokens, reason = tokens[:budget], "length"
+        model = payload.get("model")
+        with (self._gpu or contextlib.nullcontext()):
+            time.sleep(self.call_latency + self.item_latency * n_items)
+            with self._stats_lock:
+                self.calls += 1
+                self.items += n_items
+            for token in tokens:
+                yield {"model": model, "response": token, "done": False}
+                with self._stats_lock:
+                    self.tokens_sent += 1
+                if self.token_latency:
+                    time.sleep(self.token_latency)
+        yield {"model": model, "response": "", "done": True, "done_reason": reason, "eval_count": len(tokens)}
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Fake Ollama /api/generate server")
+    parser.add_argument("--port", type=int, default=11500)
+    parser.add_argument("--call-latency", type=float, default=0.4)
+    parser.add_argument("--item-latency", type=float, default=0.05)
+    parser.add_argument("--token-latency", type=float, default=0.02)
+    args = parser.parse_args()
+    stub = OllamaStub(args.port, args.call_latency, args.item_latency, token_latency=args.token_latency)
+    print(f"Ollama stub listening on {stub.url}")
+    try:
+        stub.server.serve_forever()
+    except KeyboardInterrupt:
+        stub.stop()
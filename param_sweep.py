@@ -0,0 +1,228 @@
+import os
+import csv
+import time
+import random
+import itertools
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from indicator_engine import compute_indicator_series, TECH_THRESHOLDS
+from backtest import CATEGORIES, TOP_N, classify_panel, top_picks, liquid_mask
+
+# --- THRESHOLD SWEEP ---
+# Indicators don't depend on the thresholds, so they are computed once in the
+# parent and published as one shared-memory block; every worker attaches to
+# it (no per-worker copy) and only re-runs the cheap classify/top-N/score step
+# for its batch of parameter sets.
+
+SWEEP_RESULTS_FILE = "sweep_results.csv"
+HORIZON = 5              # Forward return (bars) used to rank parameter sets
+MIN_PICKS = 200          # Parameter sets with fewer scored picks rank last
+BATCH_SIZE = 8           # Parameter sets per worker task
+FIELDS = ["price", "rsi", "adx", "sma200", "avg_volume", "fwd"]
+
+# Values tried per parameter; each list includes the current setting.
+# The bar store only holds names that passed the live liquidity filter, so a
+# looser min_volume / min_price / max_price can't admit anything new and would
+# just be survivorship-biased; those axes only go tighter than live
+# (tighten_liquidity() enforces it against the current settings).
+DEFAULT_GRID = {
+    "min_volume": [1_500_000, 3_000_000, 5_000_000],
+    "min_price": [15.0, 20.0, 30.0],
+    "max_price": [300.0, 500.0],
+    "trend_adx_min": [20, 25, 30],
+    "trend_rsi_min": [50, 55, 60],
+    "trend_rsi_max": [70, 75, 80],
+    "survivor_rsi_max": [30, 35, 40],
+    "wheel_rsi_min": [40],
+    "wheel_rsi_max": [50, 55],
+    "condor_adx_max": [15, 20],
+    "condor_rsi_min": [40, 45],
+    "condor_rsi_max": [55, 60],
+}
+
+
+def baseline_params():
+    """The live scanner's current settings."""
+    from market_scanner import MIN_VOLUME, MIN_PRICE, MAX_PRICE
+    return {"min_volume": MIN_VOLUME, "min_price": MIN_PRICE, "max_price": MAX_PRICE, **TECH_THRESHOLDS}
+
+def tighten_liquidity(grid, baseline):
+    """Drops liquidity values looser than the live filter the cached universe already passed."""
+    out = dict(grid)
+    out["min_volume"] = [v for v in grid["min_volume"] if v >= baseline["min_volume"]]
+    out["min_price"] = [v for v in grid["min_price"] if v >= baseline["min_price"]]
+    out["max_price"] = [v for v in grid["max_price"] if v <= baseline["max_price"]]
+    return out
+
+def is_valid(params):
+    return (params["min_price"] < params["max_price"]
+            and params["trend_rsi_min"] < params["trend_rsi_max"]
+            and params["wheel_rsi_min"] <= params["wheel_rsi_max"]
+            and params["condor_rsi_min"] < params["condor_rsi_max"])
+
+def grid_search(grid):
+    keys = list(grid)
+    for values in itertools.product(*(grid[k] for k in keys)):
+        params = dict(zip(keys, values))
+        if is_valid(params):
+            yield params
+
+def random_search(grid, n, seed=0):
+    rng = random.Random(seed)
+    seen = set()
+    space = 1
+    for values in grid.values():
+        space *= len(values)
+    attempts = 0
+    while len(seen) < n and attempts < max(n * 20, 1000) and len(seen) < space:
+        attempts += 1
+        params = {k: rng.choice(v) for k, v in grid.items()}
+        key = tuple(params.values())
+        if key in seen or not is_valid(params):
+            continue
+        seen.add(key)
+        yield params
+
+
+def evaluate(arrays, params, top_n=TOP_N):
+    """
+    One parameter set against the shared arrays. Returns a flat metrics dict:
+    scored picks, directional hit rate and mean directional return ("edge"),
+    overall and per list.
+    """
+    price, rsi, adx, sma200, avg_volume, fwd = arrays
+    category, score = classify_panel(price, rsi, adx, sma200, params)
+    liquid = liquid_mask(price, avg_volume, params["min_volume"], params["min_price"], params["max_price"])
+    category[~liquid] = -1
+    d, j, cat, _ = top_picks(category, score, top_n)
+    r = fwd[d, j]
+    known = ~np.isnan(r)
+    direction = np.where(cat == CATEGORIES.index("short_targets"), -1.0, 1.0)
+    edge = (r * direction)[known]
+    cat = cat[known]
+    out = {
+        "picks": int(known.sum()),
+        "hit_rate": float((edge > 0).mean()) if len(edge) else np.nan,
+        "edge": float(edge.mean()) if len(edge) else np.nan,
+    }
+    for code, name in enumerate(CATEGORIES):
+        sub = edge[cat == code]
+        short = name.split("_")[0]
+        out[f"{short}_picks"] = int(len(sub))
+        out[f"{short}_hit_rate"] = float((sub > 0).mean()) if len(sub) else np.nan
+        out[f"{short}_edge"] = float(sub.mean()) if len(sub) else np.nan
+    return out
+
+
+# --- SHARED MEMORY ---
+_worker = {}   # Per-process attachment: {"shm": SharedMemory, "arrays": [...]}
+
+def publish(series, horizon):
+    """Copies the sweep fields into one shared block. Returns (SharedMemory, shape)."""
+    stack = [series[f] for f in FIELDS[:-1]] + [series[f"fwd_{horizon}"]]
+    shape = (len(stack),) + stack[0].shape
+    shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)) * 8)
+    block = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+    for i, arr in enumerate(stack):
+        block[i] = arr
+    return shm, shape
+
+def _attach(name, shape):
+    shm = shared_memory.SharedMemory(name=name)
+    block = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+    _worker["shm"] = shm   # Keep the mapping alive for the life of the worker
+    _worker["arrays"] = [block[i] for i in range(shape[0])]
+
+def _evaluate_batch(batch, top_n):
+    return [(params, evaluate(_worker["arrays"], params, top_n)) for params in batch]
+
+
+def rank(results, min_picks=MIN_PICKS):
+    """Best first: enough picks, then edge, then hit rate."""
+    def key(item):
+        m = item[1]
+        edge = m["edge"] if not np.isnan(m["edge"]) else -np.inf
+        hit = m["hit_rate"] if not np.isnan(m["hit_rate"]) else -np.inf
+        return (m["picks"] >= min_picks, edge, hit)
+    return sorted(results, key=key, reverse=True)
+
+def write_results(ranked, path=SWEEP_RESULTS_FILE, baseline=None):
+    if not ranked:
+        return
+    param_keys = list(ranked[0][0])
+    metric_keys = list(ranked[0][1])
+    tmp = path + ".tmp"
+    with open(tmp, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["rank", "baseline"] + param_keys + metric_keys)
+        for i, (params, metrics) in enumerate(ranked, 1):
+            is_base = baseline is not None and all(params.get(k) == v for k, v in baseline.items())
+            writer.writerow([i, int(is_base)] + [params[k] for k in param_keys] +
+                            [round(metrics[k], 6) if isinstance(metrics[k], float) else metrics[k]
+                             for k in metric_keys])
+    os.replace(tmp, path)
+
+
+def sweep(data, param_sets, symbols=None, horizon=HORIZON, top_n=TOP_N, workers=None, batch_size=BATCH_SIZE):
+    """
+    Evaluates every parameter set over `data` (yf.download-shaped panel).
+    workers=1 runs in-process; otherwise a process pool shares one copy of the arrays.
+    Returns [(params, metrics)] in input order.
+    """
+    symbols = list(symbols) if symbols is not None else list(data.columns.get_level_values(0).unique())
+    _, _, series = compute_indicator_series(data, symbols, horizons=(horizon,))
+    param_sets = list(param_sets)
+    if not series or not param_sets:
+        return []
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        arrays = [series[f] for f in FIELDS[:-1]] + [series[f"fwd_{horizon}"]]
+        return [(p, evaluate(arrays, p, top_n)) for p in param_sets]
+
+    shm, shape = publish(series, horizon)
+    del series
+    try:
+        batches = [param_sets[i:i + batch_size] for i in range(0, len(param_sets), batch_size)]
+        results = []
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach,
+                                 initargs=(shm.name, shape)) as pool:
+            for chunk in pool.map(_evaluate_batch, batches, itertools.repeat(top_n)):
+                results.extend(chunk)
+        return results
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+if __name__ == "__main__":
+    import argparse
+    from bar_store import BarStore
+    parser = argparse.ArgumentParser(description="Sweep dragnet thresholds over cached bars")
+    parser.add_argument("--random", type=int, help="Random search with N samples instead of the full grid")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--horizon", type=int, default=HORIZON)
+    parser.add_argument("--top", type=int, default=TOP_N)
+    parser.add_argument("--out", default=SWEEP_RESULTS_FILE)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    store = BarStore()
+    symbols = store.symbols()
+    data = store.panel(symbols)
+    baseline = baseline_params()
+    grid = tighten_liquidity({k: sorted(set(v) | {baseline[k]}) for k, v in DEFAULT_GRID.items()}, baseline)
+    param_sets = list(random_search(grid, args.random, args.seed) if args.random else grid_search(grid))
+    if baseline not in param_sets:
+        param_sets.append(baseline)
+    print(f"--- 🧪 SWEEP: {len(param_sets)} parameter sets x {len(symbols)} symbols on {args.workers} workers ---")
+    results = sweep(data, param_sets, symbols, args.horizon, args.top, args.workers)
+    ranked = rank(results)
+    write_results(ranked, args.out, baseline)
+    elapsed = time.perf_counter() - t0
+    print(f"   -> {len(results)} sets in {elapsed:.1f}s. Ranked table: {args.out}")
+    for i, (params, m) in enumerate(ranked[:5], 1):
+        print(f"   #{i} edge {m['edge']:+.4f} hit {m['hit_rate']:.2%} picks {m['picks']} | {params}")
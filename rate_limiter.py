@@ -0,0 +1,99 @@
+import time
+import threading
+
+# --- TOKEN BUCKET WITH ADAPTIVE BACKOFF ---
+# Shared by every thread calling one API. The refill rate is adjusted from the
+# server's own signals: 429 + Retry-After halves it and pauses the bucket,
+# X-Ratelimit-Remaining / X-Ratelimit-Reset cap it to the budget that is left,
+# and each clean response nudges it back up (AIMD, like TCP congestion control).
+
+def _header_float(headers, name):
+    if not headers:
+        return None
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    def __init__(self, rate, capacity=1.0, min_rate=None, max_rate=None, increase=0.05,
+                 backoff_seconds=10.0, name="api", clock=time.monotonic, sleep=time.sleep):
+        self.rate = float(rate)                     # tokens per second
+        self.capacity = float(capacity)
+        self.min_rate = min_rate if min_rate is not None else self.rate / 8
+        self.max_rate = max_rate if max_rate is not None else self.rate
+        self.increase = increase                    # additive step per clean response
+        self.backoff_seconds = backoff_seconds      # pause on 429 without Retry-After
+        self.name = name
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._last = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self.stats = {"acquired": 0, "waited_s": 0.0, "throttled": 0, "adjustments": 0}
+
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def acquire(self, tokens=1.0):
+        """Blocks until `tokens` are available. Returns seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._tokens >= tokens:
+                    self._tokens -= tokens
+                    self.stats["acquired"] += 1
+                    self.stats["waited_s"] += waited
+                    return waited
+                else:
+                    wait = (tokens - self._tokens) / self.rate
+            self._sleep(wait)
+            waited += wait
+
+    def observe(self, status_code, headers=None):
+        """Feeds a response back into the limiter. Returns True if the caller was throttled."""
+        remaining = _header_float(headers, "X-Ratelimit-Remaining")
+        reset = _header_float(headers, "X-Ratelimit-Reset")
+        with self._lock:
+            now = self._clock()
+            if status_code == 429:
+                self.stats["throttled"] += 1
+                retry_after = _header_float(headers, "Retry-After")
+                pause = retry_after if retry_after is not None else (reset or self.backoff_seconds)
+                self._paused_until = max(self._paused_until, now + pause)
+                self._set_rate(self.rate / 2)
+                self._tokens = 0.0
+                return True
+
+            if remaining is not None and reset:
+                if remaining < 1:
+                    self._paused_until = max(self._paused_until, now + reset)
+                else:
+                    # Spread what's left of the window evenly over the time to reset
+                    budget = remaining / reset
+                    if budget < self.rate:
+                        self._set_rate(budget)
+                        return False
+            if status_code < 400:
+                self._set_rate(self.rate + self.increase)
+            return False
+
+    def _set_rate(self, rate):
+        rate = min(self.max_rate, max(self.min_rate, rate))
+        if rate != self.rate:
+            self.rate = rate
+            self.stats["adjustments"] += 1
+
+    def summary(self):
+        return (f"{self.name}: {self.stats['acquired']} calls, {self.stats['throttled']} throttled, "
+                f"{self.stats['waited_s']:.1f}s waiting, rate {self.rate:.2f}/s")
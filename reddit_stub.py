@@ -0,0 +1,91 @@
+import re
+import json
+import time
+import threading
+from urllib.parse import urlsplit, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import bench_fixtures
+
+# --- REDDIT STAND-IN ---
+# Local fake of Reddit's public JSON endpoints for offline tests and benchmarks.
+# /r/<sub>/search.json?q=$TICKER answers with the recorded search listing for
+# that ticker; /r/<sub>/<listing>.json answers with the same posts for a set
+# of tickers, as a harvest would see them. Rate-limit headers are included so
+# the adaptive limiter has something to read.
+
+PATH_RE = re.compile(r"^/r/([^/]+)/([a-z]+)\.json$")
+
+
+class RedditStub:
+    def __init__(self, port=0, latency=0.0, tickers=(), remaining=600):
+        self.latency = latency
+        self.tickers = list(tickers)   # Symbols mentioned in /new and /hot listings
+        self.remaining = remaining
+        self.requests = 0
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                status, body = stub.handle(self.path)
+                raw = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                self.send_header("X-Ratelimit-Remaining", str(stub.remaining))
+                self.send_header("X-Ratelimit-Reset", "600")
+                self.end_headers()
+                self.wfile.write(raw)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def handle(self, raw_path):
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.requests += 1
+        parts = urlsplit(raw_path)
+        m = PATH_RE.match(parts.path)
+        if not m:
+            return 404, {"message": "Not Found", "error": 404}
+        sub, listing = m.groups()
+        if listing == "search":
+            query = parse_qs(parts.query).get("q", [""])[0]
+            listing_json = bench_fixtures.reddit_listing(query.lstrip("$"))
+        else:
+            children = []
+            for ticker in self.tickers:
+                children.extend(bench_fixtures.reddit_listing(ticker)["data"]["children"])
+            listing_json = {"kind": "Listing", "data": {"after": None, "children": children}}
+        for child in listing_json["data"]["children"]:
+            child["data"]["subreddit"] = sub
+        return 200, listing_json
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,185 @@
+import sys
+import json
+import time
+import socket
+import argparse
+import threading
+import traceback
+import socketserver
+
+# --- RESIDENT SCOUT DAEMON ---
+# run_scout.bat starts two fresh Pythons per session: both import pandas,
+# yfinance and alpaca, re-read every JSON cache, and the Ollama model unloads
+# between runs. The daemon imports once and keeps everything warm between
+# runs: bar store, indicator state, earnings calendar, verdict cache, HTTP
+# pools, primed LLM contexts, and the model itself (keep_alive -1).
+#
+#   python scout_daemon.py serve                 # start it (e.g. at logon)
+#   python scout_daemon.py trigger session       # dragnet then scout, like run_scout.bat
+#   python scout_daemon.py trigger scout|dragnet|status|shutdown
+#
+# Triggers are one JSON line over a localhost TCP socket; the reply comes
+# back when the run has finished. Runs are serialized.
+
+DAEMON_HOST = "127.0.0.1"
+DAEMON_PORT = 8765
+COMMANDS = ("dragnet", "scout", "session", "status", "shutdown")
+TRIGGER_TIMEOUT = 4 * 3600   # A scout over a big dragnet list can take a while
+
+
+class ScoutDaemon:
+    """
+    Owns the resident resources and runs one job at a time.
+    `runners` maps job name -> callable(daemon) and is injectable for tests;
+    by default the real modules are imported lazily on first use.
+    """
+
+    def __init__(self, host=DAEMON_HOST, port=DAEMON_PORT, runners=None, warm=True):
+        self.runners = runners or {"dragnet": run_dragnet_job, "scout": run_scout_job}
+        self.warm = warm
+        self.started = time.time()
+        self.runs = {name: 0 for name in self.runners}
+        self.last = None             # {"job", "ok", "seconds", ...} of the latest run
+        self.resources = {}          # Dragnet objects kept between runs
+        self._run_lock = threading.Lock()
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                line = self.rfile.readline()
+                try:
+                    request = json.loads(line or b"{}")
+                    reply = daemon.dispatch(request.get("cmd"))
+                except ValueError:
+                    reply = {"ok": False, "error": "bad request"}
+                self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+
+        self.server = socketserver.ThreadingTCPServer((host, port), Handler, bind_and_activate=False)
+        self.server.allow_reuse_address = True
+        self.server.daemon_threads = True
+        self.server.server_bind()
+        self.server.server_activate()
+
+    @property
+    def address(self):
+        return self.server.server_address[:2]
+
+    def dispatch(self, cmd):
+        if cmd == "status":
+            return {"ok": True, "uptime_s": round(time.time() - self.started, 1), "runs": dict(self.runs),
+                    "busy": self._run_lock.locked(), "last": self.last}
+        if cmd == "shutdown":
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+            return {"ok": True}
+        if cmd == "session":
+            replies = [self.run("dragnet"), self.run("scout")]
+            return {"ok": all(r["ok"] for r in replies), "runs": replies}
+        if cmd in self.runners:
+            return self.run(cmd)
+        return {"ok": False, "error": f"unknown command {cmd!r}"}
+
+    def run(self, job):
+        with self._run_lock:
+            t0 = time.perf_counter()
+            reply = {"job": job, "ok": True}
+            try:
+                result = self.runners[job](self)
+                if result is False:
+                    reply["skipped"] = "gatekeeper"
+            except Exception as e:
+                traceback.print_exc()
+                reply.update(ok=False, error=f"{type(e).__name__}: {e}")
+            self.runs[job] += 1
+            reply["seconds"] = round(time.perf_counter() - t0, 2)
+            self.last = reply
+            print(f"[Daemon] {job} finished in {reply['seconds']}s ({'ok' if reply['ok'] else reply['error']})")
+            sys.stdout.flush()
+            return reply
+
+    def serve_forever(self):
+        if self.warm and "scout" in self.runners:
+            warm_scout()
+        host, port = self.address
+        print(f"--- 🛰️ SCOUT DAEMON listening on {host}:{port} ---")
+        sys.stdout.flush()
+        try:
+            self.server.serve_forever()
+        finally:
+            self.server.server_close()
+
+    def start(self):
+        """Serves on a background thread (tests)."""
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+# --- Jobs ---
+def warm_scout():
+    # The entry points import their heavy modules lazily; the daemon pays for them once, up front
+    import pandas, yfinance, requests, alpaca.trading.client  # noqa: F401
+    import market_scanner
+    import sector_scout_3
+    sector_scout_3.RESIDENT = True
+    sector_scout_3.LLM_KEEP_ALIVE = -1       # Never unload while the daemon is up
+    if sector_scout_3.warm_model(keep_alive=-1):
+        print(f"   ✅ {sector_scout_3.MODEL_NAME} loaded and pinned.")
+
+def run_dragnet_job(daemon):
+    import market_scanner
+    res = daemon.resources
+    if not res.get("client"):
+        res["client"] = market_scanner.get_alpaca_client()   # Retried each run until keys.json works
+        if not res["client"]:
+            raise RuntimeError("no Alpaca client (check keys.json)")
+    if "store" not in res:
+        res["store"] = market_scanner.BarStore() if market_scanner.USE_BAR_CACHE else None
+        res["state"] = market_scanner.IndicatorState() if (
+            res["store"] is not None and market_scanner.USE_INDICATOR_STATE) else None
+        res["calendar"] = market_scanner.EarningsCalendar(skip=market_scanner.is_etf)
+    return market_scanner.run_dragnet(client=res["client"], store=res["store"],
+                                      state=res["state"], calendar=res["calendar"])
+
+def run_scout_job(daemon):
+    import sector_scout_3
+    sector_scout_3.RESIDENT = True
+    sector_scout_3.run_scout()
+
+
+# --- Client ---
+def trigger(cmd, host=DAEMON_HOST, port=DAEMON_PORT, timeout=TRIGGER_TIMEOUT):
+    """Sends one command and waits for the reply dict."""
+    with socket.create_connection((host, port), timeout=timeout) as sock:
+        sock.sendall(json.dumps({"cmd": cmd}).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as f:
+            line = f.readline()
+    if not line:
+        raise ConnectionError("daemon closed the connection without replying")
+    return json.loads(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Resident dragnet/scout service")
+    sub = parser.add_subparsers(dest="action", required=True)
+    serve = sub.add_parser("serve", help="Run the daemon in the foreground")
+    serve.add_argument("--no-warm", action="store_true", help="Don't preload the Ollama model")
+    send = sub.add_parser("trigger", help="Ask a running daemon to do something")
+    send.add_argument("cmd", choices=COMMANDS)
+    for p in (serve, send):
+        p.add_argument("--host", default=DAEMON_HOST)
+        p.add_argument("--port", type=int, default=DAEMON_PORT)
+    args = parser.parse_args()
+
+    if args.action == "serve":
+        ScoutDaemon(args.host, args.port, warm=not args.no_warm).serve_forever()
+    else:
+        try:
+            reply = trigger(args.cmd, args.host, args.port)
+        except OSError as e:
+            print(f"[!] Scout daemon not reachable on {args.host}:{args.port}: {e}")
+            sys.exit(2)
+        print(json.dumps(reply, indent=2))
+        sys.exit(0 if reply.get("ok") else 1)
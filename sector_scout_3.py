@@ -1,13 +1,29 @@
 # --- IMPORTS ---
-import requests
 import json
 import os
 import time
 import datetime
-import yfinance as yf
 import subprocess
 import sys
-import config
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from lazy_imports import lazy_import
+from llm_cache import VerdictCache, verdict_key
+from news_index import PublisherTiers, HeadlineIndex, title_key
+from delivery import Deliverer, SshTransport, atomic_write_json
+from news_store import NewsStore, parse_news_item, NEWS_FETCH_WORKERS
+from http_pool import HttpClient, host_key
+from rate_limiter import TokenBucket
+from llm_scheduler import LlmScheduler, OLLAMA_NUM_PARALLEL, job_weight
+from llm_stream import StreamMeter, stream_generate, first_json_object
+import telemetry
+from telemetry import instrument
+
+# yfinance and config load on first use: a run that only reads the cached
+# candidate list shouldn't pay for them up front
+yf = lazy_import("yfinance")
+config = lazy_import("config")
 
 # Force UTF-8 Output for Windows Console
 import builtins
@@ -37,11 +53,84 @@ OUTPUT_FILE = "active_targets.json"
 BEELINK_IP = "192.168.5.87"
 BEELINK_USER = "trader"
 BEELINK_PATH = "~/bots/repo/active_targets.json"
-WEBHOOK_OVERSEER = getattr(config, 'WEBHOOK_OVERSEER') 
+_FROM_CONFIG = object()
+WEBHOOK_OVERSEER = _FROM_CONFIG   # Read from config.py by run_scout; set a URL or None to override
+
+def overseer_webhook():
+    """config.WEBHOOK_OVERSEER, imported on first call; a missing config.py or setting raises."""
+    global WEBHOOK_OVERSEER
+    if WEBHOOK_OVERSEER is _FROM_CONFIG:
+        WEBHOOK_OVERSEER = config.WEBHOOK_OVERSEER
+    return WEBHOOK_OVERSEER
+
+# --- DELIVERY ---
+# "background": delivery.Deliverer pushes over a persistent SSH channel and skips
+# unchanged files | "scp": the blocking beam_to_beelink
+DELIVERY_MODE = "background"
+DELIVERY_WAIT_S = 120     # How long the CLI lingers for an in-flight push before exiting
+delivery = None           # Deliverer, created on first use
+
+# --- HTTP ---
+# One keep-alive pool per host (Ollama, Reddit, Discord); see http_pool.HOST_POLICIES
+HTTP = HttpClient()
 
 # --- REDDIT CONFIG ---
+REDDIT_BASE = "https://www.reddit.com"
 REDDIT_SUBS = ["wallstreetbets", "stocks", "investing", "options", "thetagang"]
-last_reddit_call = 0 
+REDDIT_SEARCH_SUBS = ["wallstreetbets", "stocks", "investing"]  # 3 most relevant
+REDDIT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+REDDIT_MAX_RETRIES = 2        # Re-tries of one sub after a 429 (limiter decides how long to wait)
+REDDIT_BATCH_TICKERS = 10     # Tickers OR-ed into one search query in batch mode
+REDDIT_HARVEST_PAGES = 3      # Pages of 100 posts per listing in harvest mode
+# "per_ticker": 3 searches per ticker | "batch": one OR-ed search per ticker group per sub
+# "harvest": crawl new/hot of every REDDIT_SUBS once and index mentions by ticker
+REDDIT_MODE = "per_ticker"
+# Shared across pipeline workers: starts at the old 1.5s spacing and adapts
+# to Reddit's X-Ratelimit-* / Retry-After headers from there.
+REDDIT_LIMITER = TokenBucket(rate=1 / 1.5, min_rate=1 / 20, max_rate=1.0, name="Reddit")
+reddit_index = None           # {ticker: [mention, ...]} when prefetched for the run
+
+# --- PIPELINE CONFIG ---
+INTEL_WORKERS = 4   # Concurrent news/Reddit gathers
+LLM_WORKERS = 1     # Concurrent tickers in LLM scoring (Ollama serves one at a time by default)
+# "single": one prompt per tier | "batch": ask_llama_batch per ticker group
+# "consolidated": ask_llama_consolidated, one prompt per ticker covering every tier
+SCORING_MODE = "single"
+LLM_BATCH_SIZE = 4       # Tickers packed into one batch prompt
+
+# --- CONSOLIDATED MODE ---
+# The persona prompt is evaluated once per strategy and its Ollama `context`
+# reused for every ticker. Every request sends keep_alive: Ollama resets the
+# unload timer to whatever the latest request asked for (scout_daemon uses -1).
+LLM_KEEP_ALIVE = "30m"
+primed_contexts = {}          # strategy -> Ollama context tokens
+_prime_lock = threading.Lock()
+
+# --- LLM SCHEDULER (single mode) ---
+# Weighted priority queue in front of ask_llama (llm_scheduler.py)
+USE_LLM_SCHEDULER = True
+LLM_PARALLEL = OLLAMA_NUM_PARALLEL   # Match the Ollama server's OLLAMA_NUM_PARALLEL
+LLM_DEADLINE_S = None    # Seconds into scoring after which light jobs are skipped (None = never)
+
+# --- LLM STREAMING ---
+# Streams tokens and hangs up as soon as the JSON verdict closes (llm_stream.py)
+OLLAMA_STREAM = False
+LLM_TOKEN_BUDGET = 256   # num_predict cap per streamed verdict; None = model default
+LLM_TIMEOUT = 30
+STREAM_METER = StreamMeter()
+
+# --- RESIDENT MODE ---
+# Set by scout_daemon.py: verdict cache and primed contexts stay in memory between runs
+RESIDENT = False
+
+# --- LLM VERDICT CACHE ---
+USE_VERDICT_CACHE = True
+verdict_cache = None     # Opened by run_scout (llm_cache.VerdictCache)
+
+# --- TELEMETRY (telemetry.py; summarize with `python telemetry.py`) ---
+RUN_METRICS_FILE = telemetry.METRICS_FILE
 
 # --- CORE BACKUP (Unchanged) ---
 CORE_WATCHLIST = {
@@ -89,34 +178,104 @@ TIER_4_INDUSTRY = [
 # Combined set for fast lookup
 ALL_TRUSTED_SOURCES = set(TIER_1_ELITE + TIER_2_MAINSTREAM + TIER_3_SPECIALTY + TIER_4_INDUSTRY)
 
+# Compiled tier1/tier2 matcher (aliases in news_index.PUBLISHER_ALIASES); anything else is tier3
+PUBLISHER_TIERS = PublisherTiers([TIER_1_ELITE, TIER_2_MAINSTREAM])
+TIER_BUCKETS = ("tier1", "tier2", "tier3")
+headline_index = None         # news_index.HeadlineIndex shared by a run's tickers
+
+# --- NEWS STORE ---
+# Every candidate's feed is fetched up front, concurrently, into one
+# news_store.NewsStore; shared articles are parsed once.
+USE_NEWS_STORE = True
+NEWS_WORKERS = NEWS_FETCH_WORKERS
+NEWS_INCLUDE_MENTIONS = False  # Also use other feeds' articles whose relatedTickers name the ticker
+news_store = None
+
+def reddit_get(url, params):
+    """
+    Rate-limited Reddit GET. A 429 is fed back into REDDIT_LIMITER (which pauses
+    and slows down) and the request is retried instead of losing the sub.
+    Returns parsed JSON or None.
+    """
+    for attempt in range(REDDIT_MAX_RETRIES + 1):
+        REDDIT_LIMITER.acquire()
+        resp = HTTP.get(url, headers=REDDIT_HEADERS, params=params, timeout=10)
+        throttled = REDDIT_LIMITER.observe(resp.status_code, resp.headers)
+        if throttled:
+            if attempt < REDDIT_MAX_RETRIES:
+                telemetry.count("get_reddit_sentiment", retries=1)
+                print(f"   [!] Reddit Rate Limit. Backing off ({REDDIT_LIMITER.rate:.2f} req/s)...")
+                continue
+            print(f"   [!] Reddit Rate Limit. Giving up on {url}")
+            return None
+        if resp.status_code != 200:
+            return None
+        return resp.json()
+    return None
+
+def extract_mentions(data, sub):
+    mentions = []
+    children = data.get("data", {}).get("children", [])
+
+    for post in children:
+        p_data = post.get("data", {})
+        title = p_data.get("title", "")
+        score = p_data.get("score", 0)
+        url_link = p_data.get("permalink", "")
+
+        # Score Filter (Noise Reduction)
+        if score < 5: continue
+
+        mentions.append({
+            "title": title,
+            "text": p_data.get("selftext", ""),
+            "score": score,
+            "sub": sub,
+            "url": f"https://reddit.com{url_link}"
+        })
+    return mentions
+
+def summarize_mentions(mentions):
+    """Top 3 unique titles by score as the prompt snippet, or None."""
+    if not mentions: return None
+
+    # Sort by Score
+    mentions = sorted(mentions, key=lambda x: x['score'], reverse=True)
+
+    # Take Top 3 Uniques
+    seen_titles = set()
+    summary_lines = []
+    count = 0
+
+    for m in mentions:
+        if m['title'] in seen_titles: continue
+        seen_titles.add(m['title'])
+
+        summary_lines.append(f"- [r/{m['sub']}] {m['title']} ({m['score']} pts)")
+        count += 1
+        if count >= 3: break
+
+    return "\n".join(summary_lines)
+
+@instrument()
 def get_reddit_sentiment(ticker):
     """
     Scrapes recent Reddit posts using Reddit's public JSON API.
     Returns a summary string or None.
     NO AUTH REQUIRED (Rate Limited).
     """
-    global last_reddit_call
-    
+    if reddit_index is not None:
+        return summarize_mentions(reddit_index.get(ticker, []))
+
     mentions = []
     
     # We must treat the ticker carefully. $TICKER is safer.
     query = f"${ticker}"
-    
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    }
 
     try:
         # Scan Top Subreddits (limit to 3 most relevant to save time/requests)
-        for sub in ["wallstreetbets", "stocks", "investing"]:
-            
-            # Rate Limit (1.5s per request to be safe)
-            elapsed = time.time() - last_reddit_call
-            if elapsed < 1.5:
-                time.sleep(1.5 - elapsed)
-            last_reddit_call = time.time()
-            
-            url = f"https://www.reddit.com/r/{sub}/search.json"
+        for sub in REDDIT_SEARCH_SUBS:
+            url = f"{REDDIT_BASE}/r/{sub}/search.json"
             params = {
                 "q": query,
                 "restrict_sr": 1,
@@ -125,132 +284,166 @@ def get_reddit_sentiment(ticker):
             }
             
             try:
-                resp = requests.get(url, headers=headers, params=params, timeout=10)
-                
-                if resp.status_code == 429:
-                    print(f"   [!] Reddit Rate Limit. Skipping {sub}...")
-                    continue
-                if resp.status_code != 200:
-                    continue
-                    
-                data = resp.json()
-                children = data.get("data", {}).get("children", [])
-                
-                for post in children:
-                    p_data = post.get("data", {})
-                    title = p_data.get("title", "")
-                    score = p_data.get("score", 0)
-                    url_link = p_data.get("permalink", "")
-                    
-                    # Score Filter (Noise Reduction)
-                    if score < 5: continue
-                    
-                    mentions.append({
-                        "title": title,
-                        "score": score,
-                        "sub": sub,
-                        "url": f"https://reddit.com{url_link}"
-                    })
+                data = reddit_get(url, params)
+                if data:
+                    mentions.extend(extract_mentions(data, sub))
             except Exception:
                 continue # Skip sub on error
-            
-        if not mentions: return None
-        
-        # Sort by Score
-        mentions.sort(key=lambda x: x['score'], reverse=True)
-        
-        # Take Top 3 Uniques
-        seen_titles = set()
-        summary_lines = []
-        count = 0
-        
-        for m in mentions:
-            if m['title'] in seen_titles: continue
-            seen_titles.add(m['title'])
-            
-            summary_lines.append(f"- [r/{m['sub']}] {m['title']} ({m['score']} pts)")
-            count += 1
-            if count >= 3: break
-            
-        return "\n".join(summary_lines)
+
+        return summarize_mentions(mentions)
 
     except Exception as e:
         print(f"   [!] Reddit Error ({ticker}): {e}")
         return None
-    except Exception as e:
-        print(f"   [!] Error in get_tiered_news({ticker}): {e}")
-        return {"tier1": [], "tier2": [], "tier3": []}
 
+# Uppercase words that collide with real tickers; only $-prefixed mentions count for these
+AMBIGUOUS_TICKERS = {
+    "A", "I", "AI", "ALL", "AN", "ANY", "ARE", "AT", "BE", "BIG", "CAN", "CEO", "DD", "EPS",
+    "FOR", "GO", "HAS", "IMO", "IT", "NOW", "ON", "ONE", "OPEN", "OR", "OUT", "PM", "RH",
+    "SO", "TD", "TV", "UK", "US", "USA", "YOLO",
+}
+
+def ticker_matcher(tickers, bare_min_len=1, ambiguous=()):
+    """
+    Compiled case-sensitive matcher: $TICKER for every ticker, bare TICKER only
+    for tickers at least `bare_min_len` long and not in `ambiguous`.
+    Use with find_tickers().
+    """
+    ordered = sorted(set(tickers), key=len, reverse=True)
+    bare = [t for t in ordered if len(t) >= bare_min_len and t not in ambiguous]
+    edge = r"(?![A-Za-z0-9])"
+    pattern = rf"(?<![A-Za-z0-9$])\$({'|'.join(map(re.escape, ordered))}){edge}"
+    if bare:
+        pattern += rf"|(?<![A-Za-z0-9$])({'|'.join(map(re.escape, bare))}){edge}"
+    return re.compile(pattern)
+
+def find_tickers(matcher, text):
+    return {m.group(1) or m.group(2) for m in matcher.finditer(text)}
+
+def get_reddit_sentiment_batch(tickers, subs=None):
+    """
+    One OR-ed search per group of REDDIT_BATCH_TICKERS tickers per sub, fanned
+    back out to tickers by matching titles/bodies. Returns {ticker: [mention, ...]}.
+    """
+    subs = subs or REDDIT_SEARCH_SUBS
+    index = {t: [] for t in tickers}
+    for i in range(0, len(tickers), REDDIT_BATCH_TICKERS):
+        group = tickers[i:i + REDDIT_BATCH_TICKERS]
+        matcher = ticker_matcher(group, bare_min_len=2, ambiguous=AMBIGUOUS_TICKERS)
+        query = " OR ".join(f"${t}" for t in group)
+        for sub in subs:
+            url = f"{REDDIT_BASE}/r/{sub}/search.json"
+            params = {"q": query, "restrict_sr": 1, "sort": "new", "limit": 100}
+            try:
+                data = reddit_get(url, params)
+            except Exception as e:
+                print(f"   [!] Reddit Batch Error ({sub}): {e}")
+                continue
+            if not data: continue
+            for m in extract_mentions(data, sub):
+                for sym in find_tickers(matcher, m['title'] + "\n" + m['text']):
+                    index[sym].append(m)
+    return index
+
+def harvest_reddit(tickers, subs=None, listings=("new", "hot"), pages=None):
+    """
+    Bulk mode: crawls each sub's listings once (paginated), then fans posts out
+    to every candidate they mention. Request count is subs x listings x pages,
+    independent of how many tickers are being scouted.
+    Returns {ticker: [mention, ...]}.
+    """
+    subs = subs or REDDIT_SUBS
+    pages = pages or REDDIT_HARVEST_PAGES
+    matcher = ticker_matcher(tickers, bare_min_len=2, ambiguous=AMBIGUOUS_TICKERS)
+    index = {t: [] for t in tickers}
+    requests_made = 0
+    posts_seen = 0
+    for sub in subs:
+        seen_urls = set()
+        for listing in listings:
+            after = None
+            for _ in range(pages):
+                params = {"limit": 100, "raw_json": 1}
+                if after: params["after"] = after
+                try:
+                    data = reddit_get(f"{REDDIT_BASE}/r/{sub}/{listing}.json", params)
+                except Exception as e:
+                    print(f"   [!] Reddit Harvest Error (r/{sub}/{listing}): {e}")
+                    data = None
+                requests_made += 1
+                if not data: break
+                for m in extract_mentions(data, sub):
+                    if m['url'] in seen_urls: continue
+                    seen_urls.add(m['url'])
+                    posts_seen += 1
+                    for sym in find_tickers(matcher, m['title'] + "\n" + m['text']):
+                        index[sym].append(m)
+                after = data.get("data", {}).get("after")
+                if not after: break
+    hits = sum(1 for v in index.values() if v)
+    print(f"   -> Harvested {posts_seen} posts in {requests_made} requests; {hits}/{len(tickers)} tickers mentioned.")
+    return index
+
+def tier_articles(articles):
+    """
+    Buckets parsed articles (news_store.parse_news_item) into tier1/2/3 items.
+    Syndicated copies of one headline collapse into the best-tier copy.
+    """
+    tiered_news = {
+        "tier1": [],
+        "tier2": [],
+        "tier3": [] # Using Tier 3 bucket for Specialty + Industry + Unknowns
+    }
+    picked = {}   # headline key -> [tier index, item]; syndicated copies collapse
+    duplicates = 0
+    for article in articles:
+        publisher, title = article['publisher'], article['title']
+        item = f"- [{publisher}] {title}"
+
+        # Bucketing (everyone not Tier 1/2 goes to Tier 3: Specialty/Industry/Other)
+        tier = PUBLISHER_TIERS.tier_of(publisher)
+        key = title_key(title) or item
+        if key in picked:
+            # Same story again: keep the copy from the best tier
+            duplicates += 1
+            if tier < picked[key][0]:
+                picked[key] = [tier, item]
+            continue
+        picked[key] = [tier, item]
+
+    for key, (tier, item) in picked.items():
+        bucket = TIER_BUCKETS[tier]
+        if headline_index is not None:
+            # Per bucket, so a copy never inherits another tier's publisher label
+            item = headline_index.canonical((key, bucket), item)
+        tiered_news[bucket].append(item)
+    if headline_index is not None:
+        headline_index.count_dropped(duplicates)
+    return tiered_news
+
+@instrument()
 def get_tiered_news(ticker):
     """
-    Fetches news from Yahoo and organizes into Tiers.
+    Fetches news from Yahoo (or the run's news_store) and organizes into Tiers.
     Returns dict: {'tier1': [], 'tier2': [], 'tier3': []}
     """
     try:
+        if news_store is not None:
+            if not news_store.has(ticker) and not news_store.fetch_one(ticker):
+                return {"tier1": [], "tier2": [], "tier3": []}
+            articles = news_store.articles_for(ticker, include_mentions=NEWS_INCLUDE_MENTIONS)
+            if not articles:
+                print(f"   [!] No news found for {ticker} from yfinance.")
+            return tier_articles(articles)
+
         stock = yf.Ticker(ticker)
         news = stock.news
-        
-        tiered_news = {
-            "tier1": [],
-            "tier2": [],
-            "tier3": [] # Using Tier 3 bucket for Specialty + Industry + Unknowns
-        }
-        
-        now = time.time()
-        
         if not news:
             print(f"   [!] No news found for {ticker} from yfinance.")
-            return tiered_news
+            return {"tier1": [], "tier2": [], "tier3": []}
 
-        for n in news:
-            if not n: continue
-            
-            # Handle new vs old structure
-            info = n.get('content', n)
-            if not info: continue
-            
-            # 1. Get Time
-            pub_time = info.get('providerPublishTime', 0)
-            if not pub_time and 'pubDate' in info:
-                try:
-                    # Parse ISO: 2026-02-18T14:43:06Z
-                    dt = datetime.datetime.strptime(info['pubDate'], "%Y-%m-%dT%H:%M:%SZ")
-                    # Convert to epoch
-                    pub_time = dt.replace(tzinfo=datetime.timezone.utc).timestamp()
-                except Exception as e:
-                    pass
-
-            # Recency Check (7 days)
-            age_hours = (now - pub_time) / 3600
-            
-            if (now - pub_time) > (168 * 3600): continue
-            
-            # 2. Get Publisher
-            publisher = info.get('publisher', '')
-            if not publisher:
-                # Safe get for nested provider
-                provider = info.get('provider') or {}
-                publisher = provider.get('displayName', 'Unknown')
-                
-            title = info.get('title', '')
-            link = info.get('link', '')
-            if not link:
-                 # Safe get for nested clickThroughUrl
-                 ctu = info.get('clickThroughUrl') or {}
-                 link = ctu.get('url', '')
-                 
-            item = f"- [{publisher}] {title}"
-            
-            # Bucketing
-            if any(src in publisher for src in TIER_1_ELITE):
-                tiered_news['tier1'].append(item)
-            elif any(src in publisher for src in TIER_2_MAINSTREAM):
-                tiered_news['tier2'].append(item)
-            else:
-                # Everyone else goes to Tier 3 (Specialty/Industry/Other)
-                tiered_news['tier3'].append(item)
-                
-        return tiered_news
+        now = time.time()
+        return tier_articles(a for a in (parse_news_item(n, now) for n in news) if a)
     except Exception as e:
         print(f"   [!] Error getting news for {ticker}: {e}")
         return {"tier1": [], "tier2": [], "tier3": []}
@@ -270,12 +463,8 @@ def validate_llm_response(score, reason, ticker):
     
     return score, reason
 
-def ask_llama(ticker, strategy, content_text, source_type="news"):
-    """
-    source_type: 'tier1_news', 'tier2_news', 'social'
-    """
-    if not content_text: return 0.5, "Insufficient Data"
-
+def get_persona(strategy):
+    """Returns (role, goal, scoring) for a strategy's LLM prompt."""
     if strategy == "short_targets":
         role = "short seller"
         goal = "identifying weakness, bad earnings, or regulatory trouble"
@@ -292,7 +481,10 @@ def ask_llama(ticker, strategy, content_text, source_type="news"):
         role = "growth investor"
         goal = "identifying breakouts, strong earnings, and momentum"
         scoring = "High score (1.0) means RALLY LIKELY. Low score (0.0) means WEAKNESS."
+    return role, goal, scoring
 
+def get_source_context(source_type):
+    """Returns (context, instruction) for a source type."""
     # Adjust perspective based on Source Type
     if source_type == "social":
         context = "Reddit/Social Media Sentiment"
@@ -300,6 +492,25 @@ def ask_llama(ticker, strategy, content_text, source_type="news"):
     else:
         context = "Financial News"
         instruction = "Analyze the fundamental and headline risks."
+    return context, instruction
+
+@instrument()
+def ask_llama(ticker, strategy, content_text, source_type="news"):
+    """
+    source_type: 'tier1_news', 'tier2_news', 'social'
+    """
+    if not content_text: return 0.5, "Insufficient Data"
+
+    cache_key = None
+    if verdict_cache is not None:
+        cache_key = verdict_key(MODEL_NAME, strategy, source_type, content_text)
+        cached = verdict_cache.get(cache_key)
+        if cached is not None:
+            telemetry.count("ask_llama", cache_hits=1)
+            return cached
+
+    role, goal, scoring = get_persona(strategy)
+    context, instruction = get_source_context(source_type)
 
     system_prompt = (
         f"You are a hedge fund {role}. Analyze {ticker} based on this {context}.\n"
@@ -313,27 +524,289 @@ def ask_llama(ticker, strategy, content_text, source_type="news"):
 
     try:
         payload = {
-            "model": MODEL_NAME, "prompt": system_prompt, "stream": False, "format": "json" 
+            "model": MODEL_NAME, "prompt": system_prompt, "stream": False, "format": "json",
+            "keep_alive": LLM_KEEP_ALIVE,
         }
-        response = requests.post(OLLAMA_URL, json=payload, timeout=30)
-        response_json = response.json()
-        
-        raw_text = response_json['response']
+        if OLLAMA_STREAM:
+            raw_text, stats = stream_generate(HTTP, OLLAMA_URL, payload, LLM_TOKEN_BUDGET, timeout=LLM_TIMEOUT)
+            STREAM_METER.record(stats)
+            telemetry.count("ask_llama", tokens=stats["tokens"], early_stops=int(stats["early_stop"]),
+                            ttft_ms=round((stats["ttft_s"] or 0.0) * 1000))
+        else:
+            # No cap here: a reason cut off mid-string would fail the format=json parse
+            response = HTTP.post(OLLAMA_URL, json=payload, timeout=LLM_TIMEOUT)
+            raw_text = response.json()['response']
+
         try:
             analysis = json.loads(raw_text)
         except json.JSONDecodeError:
-            import re
-            match = re.search(r'\{.*\}', raw_text, re.DOTALL)
+            match = first_json_object(raw_text)
             if match:
-                analysis = json.loads(match.group(0))
+                analysis = json.loads(match)
             else:
                 return 0.0, "JSON Parse Failed"
 
-        return validate_llm_response(analysis.get('score', 0.0), analysis.get('reason', 'N/A'), ticker)
+        score, reason = validate_llm_response(analysis.get('score', 0.0), analysis.get('reason', 'N/A'), ticker)
+        if cache_key is not None:
+            verdict_cache.put(cache_key, score, reason)
+        return score, reason
     except Exception as e:
         print(f"   [!] AI Error on {ticker}: {e}")
         return 0.0, "AI Failed"
 
+def _parse_batch_response(raw_text):
+    """Pulls the result list out of a batch reply ({"results": [...]} or a bare array)."""
+    try:
+        parsed = json.loads(raw_text)
+    except json.JSONDecodeError:
+        match = re.search(r'\[.*\]', raw_text, re.DOTALL)
+        if not match:
+            return None
+        try:
+            parsed = json.loads(match.group(0))
+        except json.JSONDecodeError:
+            return None
+    if isinstance(parsed, dict):
+        parsed = parsed.get('results')
+    return parsed if isinstance(parsed, list) else None
+
+@instrument()
+def ask_llama_batch(jobs, strategy):
+    """
+    Scores several tickers' snippets for one strategy in a single Ollama call.
+    jobs: list of {"symbol", "tier", "content"} where tier is the source_type
+    ('tier1_news', 'tier2_news', 'tier3_news', 'social').
+    Returns a list of (score, reason) aligned with `jobs`. Items missing or
+    malformed in the batch reply are re-asked one at a time via ask_llama.
+    """
+    results = [None] * len(jobs)
+    pending = []
+    for i, job in enumerate(jobs):
+        if not job['content']:
+            results[i] = (0.5, "Insufficient Data")
+            continue
+        if verdict_cache is not None:
+            cached = verdict_cache.get(verdict_key(MODEL_NAME, strategy, job['tier'], job['content']))
+            if cached is not None:
+                telemetry.count("ask_llama_batch", cache_hits=1)
+                results[i] = cached
+                continue
+        pending.append(i)
+    if not pending:
+        return results
+
+    role, goal, scoring = get_persona(strategy)
+    blocks = []
+    for n, i in enumerate(pending, 1):
+        job = jobs[i]
+        context, instruction = get_source_context(job['tier'])
+        blocks.append(
+            f"[{n}] SYMBOL: {job['symbol']} | TIER: {job['tier']} | SOURCE: {context}\n"
+            f"Focus: {instruction}\n"
+            f"DATA:\n{job['content']}"
+        )
+    system_prompt = (
+        f"You are a hedge fund {role}. Score each ITEM below independently.\n"
+        f"Goal: {goal}\n\n"
+        "ITEMS:\n" + "\n\n".join(blocks) + "\n\n"
+        "Instructions:\n"
+        "1. Judge each item only on its own DATA, using its Focus.\n"
+        f"2. {scoring}\n"
+        "3. Return JSON: {\"results\": [{\"symbol\": \"XYZ\", \"tier\": \"tier1_news\", "
+        "\"score\": 0.85, \"reason\": \"Analysis...\"}]} with exactly one element per item."
+    )
+
+    items = None
+    try:
+        payload = {
+            "model": MODEL_NAME, "prompt": system_prompt, "stream": False, "format": "json",
+            "keep_alive": LLM_KEEP_ALIVE,
+        }
+        response = HTTP.post(OLLAMA_URL, json=payload, timeout=30 + 10 * len(pending))
+        items = _parse_batch_response(response.json()['response'])
+        if items is None:
+            print(f"   [!] Batch JSON Parse Failed ({len(pending)} items). Retrying singly...")
+    except Exception as e:
+        print(f"   [!] AI Batch Error ({len(pending)} items): {e}")
+
+    answered = {}
+    for el in items or []:
+        if not isinstance(el, dict): continue
+        key = (str(el.get('symbol', '')).upper(), el.get('tier'))
+        if key in answered: continue
+        try:
+            answered[key] = (float(el['score']), str(el.get('reason', 'N/A')))
+        except (KeyError, TypeError, ValueError):
+            continue
+
+    for i in pending:
+        job = jobs[i]
+        verdict = answered.get((job['symbol'].upper(), job['tier']))
+        if verdict is not None:
+            results[i] = validate_llm_response(verdict[0], verdict[1], job['symbol'])
+            if verdict_cache is not None:
+                verdict_cache.put(verdict_key(MODEL_NAME, strategy, job['tier'], job['content']), *results[i])
+        else:
+            results[i] = ask_llama(job['symbol'], strategy, job['content'], job['tier'])
+    return results
+
+def warm_model(keep_alive=-1):
+    """Loads MODEL_NAME into Ollama (empty prompt) and pins it for `keep_alive`. Returns True on success."""
+    try:
+        response = HTTP.post(OLLAMA_URL, json={"model": MODEL_NAME, "keep_alive": keep_alive}, timeout=120)
+        response.raise_for_status()
+        return True
+    except Exception as e:
+        print(f"   [!] Could not warm {MODEL_NAME}: {e}")
+        return False
+
+def _persona_prompt(strategy):
+    role, goal, scoring = get_persona(strategy)
+    news_context, news_instruction = get_source_context("tier1_news")
+    social_context, social_instruction = get_source_context("social")
+    return (
+        f"You are a hedge fund {role}.\n"
+        f"Goal: {goal}\n\n"
+        "You will be sent one ticker at a time with labeled DATA sections.\n"
+        "Instructions:\n"
+        f"1. *_NEWS sections are {news_context}: {news_instruction}\n"
+        f"2. SOCIAL sections are {social_context}: {social_instruction}\n"
+        "3. Score every section independently, only on its own DATA.\n"
+        f"4. {scoring}\n"
+        "5. Return JSON: {\"sections\": {\"tier1_news\": {\"score\": 0.85, \"reason\": \"Analysis...\"}}} "
+        "with exactly one entry per section sent."
+    )
+
+def primed_context(strategy):
+    """
+    Ollama context tokens with the strategy's persona already evaluated, or
+    None if priming failed (callers then send the persona inline).
+    """
+    with _prime_lock:
+        if strategy in primed_contexts:
+            return primed_contexts[strategy]
+        ctx = None
+        try:
+            payload = {
+                "model": MODEL_NAME, "stream": False, "keep_alive": LLM_KEEP_ALIVE,
+                "prompt": _persona_prompt(strategy) + "\nReply OK.", "options": {"num_predict": 1},
+            }
+            ctx = HTTP.post(OLLAMA_URL, json=payload, timeout=LLM_TIMEOUT).json().get('context')
+        except Exception as e:
+            print(f"   [!] Could not prime {strategy} context: {e}")
+        primed_contexts[strategy] = ctx
+        return ctx
+
+def _parse_sections(raw_text):
+    """{source_type: {"score", "reason"}} out of a consolidated reply, or None."""
+    try:
+        parsed = json.loads(raw_text)
+    except json.JSONDecodeError:
+        match = first_json_object(raw_text)
+        if not match:
+            return None
+        try:
+            parsed = json.loads(match)
+        except json.JSONDecodeError:
+            return None
+    if isinstance(parsed, dict) and isinstance(parsed.get('sections'), dict):
+        parsed = parsed['sections']
+    if not isinstance(parsed, dict):
+        return None
+    return {str(k).lower(): v for k, v in parsed.items() if isinstance(v, dict)}
+
+@instrument()
+def ask_llama_consolidated(ticker, strategy, jobs):
+    """
+    Scores all of one ticker's sections in a single Ollama call.
+    jobs: [(source_type, content_text), ...] as from build_llm_jobs.
+    Returns {source_type: (score, reason)}. Sections missing or malformed in
+    the reply are re-asked one at a time via ask_llama.
+    """
+    verdicts = {}
+    pending = []
+    for source_type, txt in jobs:
+        if not txt:
+            verdicts[source_type] = (0.5, "Insufficient Data")
+            continue
+        if verdict_cache is not None:
+            cached = verdict_cache.get(verdict_key(MODEL_NAME, strategy, source_type, txt))
+            if cached is not None:
+                telemetry.count("ask_llama_consolidated", cache_hits=1)
+                verdicts[source_type] = cached
+                continue
+        pending.append((source_type, txt))
+    if not pending:
+        return verdicts
+
+    sections = "\n\n".join(f"### {source_type.upper()}\n{txt}" for source_type, txt in pending)
+    ctx = primed_context(strategy)
+    prompt = f"TICKER: {ticker}\n\n{sections}"
+    if ctx is None:
+        prompt = _persona_prompt(strategy) + "\n\n" + prompt
+
+    answered = {}
+    try:
+        payload = {
+            "model": MODEL_NAME, "prompt": prompt, "stream": False, "format": "json",
+            "keep_alive": LLM_KEEP_ALIVE,
+        }
+        if ctx is not None:
+            payload["context"] = ctx
+        response = HTTP.post(OLLAMA_URL, json=payload, timeout=LLM_TIMEOUT + 5 * len(pending))
+        answered = _parse_sections(response.json()['response'])
+        if answered is None:
+            print(f"   [!] {ticker}: Consolidated JSON Parse Failed. Retrying singly...")
+            answered = {}
+    except Exception as e:
+        print(f"   [!] AI Consolidated Error on {ticker}: {e}")
+
+    for source_type, txt in pending:
+        el = answered.get(source_type)
+        try:
+            score, reason = float(el['score']), str(el.get('reason', 'N/A'))
+        except (KeyError, TypeError, ValueError):
+            verdicts[source_type] = ask_llama(ticker, strategy, txt, source_type)
+            continue
+        verdicts[source_type] = validate_llm_response(score, reason, ticker)
+        if verdict_cache is not None:
+            verdict_cache.put(verdict_key(MODEL_NAME, strategy, source_type, txt), *verdicts[source_type])
+    return verdicts
+
+def alert_transfer_failed(*_):
+    """Overseer alert when the targets couldn't be delivered (bots keep the old file)."""
+    try:
+        webhook = overseer_webhook()
+        if webhook:
+            HTTP.post(webhook, json={
+                "content": "🚨 **SCP TRANSFER FAILED**\n"
+                           "Targets not updated on Beelink.\n"
+                           "Check 5080 network connection.",
+                "username": "Sector Scout"
+            })
+    except: pass
+
+def record_delivery(name, result):
+    """
+    Follow-up "delivery" metrics row written by the delivery worker: the scout's
+    own row is already out by the time a background push finishes.
+    """
+    row = telemetry.Telemetry("delivery")
+    row.record("beam_to_beelink", result["start"], result["end"], error=not result["ok"])
+    row.count("beam_to_beelink", bytes_out=result["bytes_out"], retries=result["retries"])
+    try:
+        row.write(RUN_METRICS_FILE, file=name, ok=result["ok"])
+    except OSError as e:
+        print(f"   [!] Could not write delivery metrics: {e}")
+
+def get_deliverer():
+    global delivery
+    if delivery is None:
+        delivery = Deliverer(SshTransport(BEELINK_USER, BEELINK_IP, BEELINK_PATH),
+                             on_failure=alert_transfer_failed, on_complete=record_delivery)
+    return delivery
+
+@instrument()
 def beam_to_beelink(retries=3):
     print(f"\n4. Beaming {OUTPUT_FILE} to Beelink...")
     
@@ -342,160 +815,296 @@ def beam_to_beelink(retries=3):
             cmd = f"scp {OUTPUT_FILE} {BEELINK_USER}@{BEELINK_IP}:{BEELINK_PATH}"
             subprocess.run(cmd, shell=True, check=True, timeout=30,  stderr=subprocess.PIPE, stdout=subprocess.PIPE)
             print(f"   ✅ Transfer Complete (Attempt {attempt+1}).")
+            telemetry.count("beam_to_beelink", bytes_out=os.path.getsize(OUTPUT_FILE) if os.path.exists(OUTPUT_FILE) else 0)
             return True
         except subprocess.TimeoutExpired:
              print(f"   ⚠️ SCP Timeout (Attempt {attempt+1})...")
         except Exception as e:
              print(f"   ⚠️ SCP Failed (Attempt {attempt+1}): {e}")
+        telemetry.count("beam_to_beelink", retries=1)
         time.sleep(5) 
 
     print(f"   🚨 ALL SCP ATTEMPTS FAILED. Using Fallback.")
-    
-    try:
-        if WEBHOOK_OVERSEER:
-            requests.post(WEBHOOK_OVERSEER, json={
-                "content": "🚨 **SCP TRANSFER FAILED**\n"
-                           "Targets not updated on Beelink.\n"
-                           "Check 5080 network connection.",
-                "username": "Sector Scout"
-            })
-    except: pass
+    alert_transfer_failed()
     return False
 
+def normalize_tech_score(tech_score, category):
+    """Strategy-aware scaling of the dragnet tech score to 0-1."""
+    # Default scaling (0-100)
+    tech_norm = min(max(tech_score / 100.0, 0.0), 1.0)
+
+    if category == "condor_targets":
+        # Condor scores are 0-20 (Low ADX). 20 is perfect.
+        # Score 15 -> 1.0
+        tech_norm = min(max(tech_score / 15.0, 0.0), 1.0)
+
+    elif category == "wheel_targets":
+        # Wheel scores are -5 to 10 (RSI 40-55). 10 is perfect.
+        # Score 8 -> 0.8
+        tech_norm = min(max(tech_score / 10.0, 0.0), 1.0)
+
+    elif category == "survivor_targets":
+        # Survivor scores are 10-50 (50-RSI). 30 (RSI 20) is perfect.
+        # Score 30 -> 1.0
+        tech_norm = min(max(tech_score / 30.0, 0.0), 1.0)
+
+    return tech_norm
+
+def queue_llm_job(scheduler, ticker, strategy, source_type, txt):
+    """
+    Future for one ask_llama verdict. Cache hits resolve at once instead of
+    queueing behind GPU work (or being skipped past the deadline).
+    """
+    if verdict_cache is not None and txt:
+        cached = verdict_cache.get(verdict_key(MODEL_NAME, strategy, source_type, txt))
+        if cached is not None:
+            telemetry.count("ask_llama", cache_hits=1)
+            done = Future()
+            done.set_result(cached)
+            return done
+    return scheduler.submit(job_weight(strategy, source_type), ask_llama, ticker, strategy, txt, source_type)
+
+def gather_intel(ticker):
+    """Stage 1 (network bound): news tiers + Reddit summary for one ticker."""
+    news_map = get_tiered_news(ticker)
+    reddit_text = get_reddit_sentiment(ticker)
+    return news_map, reddit_text
+
+def build_llm_jobs(news_map, reddit_text):
+    """The (source_type, content_text) prompts score_candidate would send, in order."""
+    jobs = []
+    for tier in ("tier1", "tier2", "tier3"):
+        if news_map[tier]:
+            jobs.append((f"{tier}_news", "\n".join(news_map[tier][:3])))
+    if reddit_text:
+        jobs.append(("social", reddit_text))
+    return jobs
+
+def score_candidate(ticker, category, tech_score, news_map, reddit_text, verdicts=None):
+    """
+    Stage 2 (GPU bound): multi-factor scoring for one ticker.
+    verdicts: optional {source_type: (score, reason)} already fetched (batch and
+    consolidated modes, scheduler); anything not in it is asked via ask_llama. A None verdict means
+    the job was skipped and its weight goes to technicals.
+    Returns (log_line, target_dict or None).
+    """
+    def verdict(source_type, txt):
+        if verdicts is not None and source_type in verdicts:
+            return verdicts[source_type]
+        return ask_llama(ticker, category, txt, source_type)
+
+    # 1. Normalize Technical Score (Strategy-Aware)
+    tech_norm = normalize_tech_score(tech_score, category)
+
+    # 3. Multi-Factor Scoring
+    scores = []
+    weights = []
+    reasons = []
+    found = {}
+
+    def weigh(label, source_type, txt, weight):
+        if not txt:
+            # Reallocate weight to Tech
+            weights[0] += weight
+            reasons.append(f"{label}: N/A")
+            return
+        v = verdict(source_type, txt)
+        if v is None:
+            # Dropped by the LLM scheduler's deadline: same reallocation as missing data
+            weights[0] += weight
+            reasons.append(f"{label}: Skip")
+            return
+        s, r = v
+        found[source_type] = s
+        scores.append(s)
+        weights.append(weight)
+        reasons.append(f"{label}: {s:.2f}")
+
+    # --- A. Technicals (30%) ---
+    scores.append(tech_norm)
+    weights.append(0.30)
+    reasons.append(f"Tech: {tech_norm:.2f}")
+
+    # --- B. Elite News (30%) ---
+    weigh("T1", "tier1_news", "\n".join(news_map['tier1'][:3]), 0.30)
+
+    # --- C. Mainstream News (20%) ---
+    weigh("T2", "tier2_news", "\n".join(news_map['tier2'][:3]), 0.20)
+
+    # --- D. Specialty/Industry News (10%) ---
+    weigh("T3", "tier3_news", "\n".join(news_map['tier3'][:3]), 0.10)
+
+    # --- E. Social/Reddit (10%) ---
+    weigh("Soc", "social", reddit_text, 0.10)
+
+    # 4. Calculate Weighted Final Score
+    final_confidence = 0.0
+    total_weight = sum(weights)
+
+    if total_weight > 0:
+        for i in range(len(scores)):
+            final_confidence += scores[i] * weights[i]
+
+        # Normalize if re-allocation messed up sums (shouldn't, but safety)
+        if abs(total_weight - 1.0) > 0.01:
+            final_confidence = final_confidence / total_weight
+
+    is_approved = False
+    # Threshold Check
+    if final_confidence > 0.50: is_approved = True
+
+    emoji = "✅" if is_approved else "❌"
+    breakdown = " | ".join(reasons)
+    log_line = f"      {emoji} {ticker:<4} | Conf: {final_confidence:>4.2f} [{breakdown}]"
+
+    if not is_approved:
+        return log_line, None
+
+    # Synthesize a master reason from available data
+    master_reason = f"Tech Score: {tech_score} -> {tech_norm:.2f}. "
+    if "social" in found: master_reason += f"Social: {found['social']:.2f}. "
+
+    return log_line, {
+        "symbol": ticker,
+        "confidence": round(final_confidence, 2),
+        "reason": master_reason
+    }
+
 def run_scout():
+    global verdict_cache, reddit_index, headline_index, news_store, STREAM_METER
     print("--- 🔬 SECTOR SCOUT 4.1 (Segregated Targets) ---")
+    telemetry.start_run("scout")
+    STREAM_METER = StreamMeter()
+    if not RESIDENT:
+        primed_contexts.clear()   # Re-prime each run; the server may have restarted
+    else:
+        for strategy in [k for k, ctx in primed_contexts.items() if ctx is None]:
+            del primed_contexts[strategy]   # Retry strategies whose priming failed last run
+    headline_index = HeadlineIndex()
+    if USE_VERDICT_CACHE and not (RESIDENT and verdict_cache is not None):
+        verdict_cache = VerdictCache()
     candidates = get_candidates()
+    overseer_webhook()   # Past the fast path, but a bad config.py still fails before any work
     final_targets = {
         "condor_targets": [], "wheel_targets": [],
         "trend_targets": [], "survivor_targets": [],
         "short_targets": [], "updated": str(datetime.datetime.now())
     }
 
-    print("\n2. Deep Diving Candidates...")
-
+    symbols = []
     for category, tickers in candidates.items():
         if category == "updated" or not tickers: continue
-        
-        print(f"   👉 Analyzing {category}...")
         for item in tickers:
-            if isinstance(item, dict):
-                ticker = item.get('symbol')
-                tech_score = item.get('tech_score', 50.0)
-            else:
-                ticker = item
-                tech_score = 50.0 
+            sym = item.get('symbol') if isinstance(item, dict) else item
+            if sym and "/" not in sym and sym not in symbols:
+                symbols.append(sym)
 
-            if "/" in ticker: continue
-            
-            # 1. Normalize Technical Score (Strategy-Aware)
-            # Default scaling (0-100)
-            tech_norm = min(max(tech_score / 100.0, 0.0), 1.0)
-            
-            if category == "condor_targets":
-                # Condor scores are 0-20 (Low ADX). 20 is perfect.
-                # Score 15 -> 1.0
-                tech_norm = min(max(tech_score / 15.0, 0.0), 1.0)
-                
-            elif category == "wheel_targets":
-                # Wheel scores are -5 to 10 (RSI 40-55). 10 is perfect.
-                # Score 8 -> 0.8
-                tech_norm = min(max(tech_score / 10.0, 0.0), 1.0)
-                
-            elif category == "survivor_targets":
-                # Survivor scores are 10-50 (50-RSI). 30 (RSI 20) is perfect.
-                # Score 30 -> 1.0
-                tech_norm = min(max(tech_score / 30.0, 0.0), 1.0)
-
-            # 2. Gather Intelligence
-            news_map = get_tiered_news(ticker)
-            reddit_text = get_reddit_sentiment(ticker)
-            
-            # 3. Multi-Factor Scoring
-            scores = []
-            weights = []
-            reasons = []
-
-            # --- A. Technicals (30%) ---
-            scores.append(tech_norm)
-            weights.append(0.30)
-            reasons.append(f"Tech: {tech_norm:.2f}")
-
-            # --- B. Elite News (30%) ---
-            if news_map['tier1']:
-                txt = "\n".join(news_map['tier1'][:3])
-                s, r = ask_llama(ticker, category, txt, "tier1_news")
-                scores.append(s)
-                weights.append(0.30)
-                reasons.append(f"T1: {s:.2f}")
-            else:
-                # Reallocate weight to Tech
-                weights[0] += 0.30 
-                reasons.append("T1: N/A")
-
-            # --- C. Mainstream News (20%) ---
-            if news_map['tier2']:
-                txt = "\n".join(news_map['tier2'][:3])
-                s, r = ask_llama(ticker, category, txt, "tier2_news")
-                scores.append(s)
-                weights.append(0.20)
-                reasons.append(f"T2: {s:.2f}")
-            else:
-                # Reallocate to Tech (or T1/T3 if we had complex logic, but simplifying)
-                weights[0] += 0.20
-                reasons.append("T2: N/A")
-
-            # --- D. Specialty/Industry News (10%) ---
-            if news_map['tier3']:
-                txt = "\n".join(news_map['tier3'][:3])
-                s, r = ask_llama(ticker, category, txt, "tier3_news")
-                scores.append(s)
-                weights.append(0.10)
-                reasons.append(f"T3: {s:.2f}")
-            else:
-                weights[0] += 0.10
-                reasons.append("T3: N/A")
-
-            # --- E. Social/Reddit (10%) ---
-            if reddit_text:
-                s, r = ask_llama(ticker, category, reddit_text, "social")
-                scores.append(s)
-                weights.append(0.10)
-                reasons.append(f"Soc: {s:.2f}")
-            else:
-                weights[0] += 0.10
-                reasons.append("Soc: N/A")
+    news_store = None
+    if USE_NEWS_STORE:
+        print(f"\n1. Fetching news feeds for {len(symbols)} tickers...")
+        news_store = NewsStore(ticker_factory=lambda t: yf.Ticker(t))
+        with telemetry.stage("news_fetch"):
+            news_store.fetch(symbols, NEWS_WORKERS)
 
-            # 4. Calculate Weighted Final Score
-            final_confidence = 0.0
-            total_weight = sum(weights)
-            
-            if total_weight > 0:
-                for i in range(len(scores)):
-                    final_confidence += scores[i] * weights[i]
-                
-                # Normalize if re-allocation messed up sums (shouldn't, but safety)
-                if abs(total_weight - 1.0) > 0.01:
-                    final_confidence = final_confidence / total_weight
-            
-            is_approved = False
-            # Threshold Check
-            if final_confidence > 0.50: is_approved = True
-            
-            emoji = "✅" if is_approved else "❌"
-            breakdown = " | ".join(reasons)
-            print(f"      {emoji} {ticker:<4} | Conf: {final_confidence:>4.2f} [{breakdown}]")
-            
-            if is_approved:
-                # Synthesize a master reason from available data
-                master_reason = f"Tech Score: {tech_score} -> {tech_norm:.2f}. "
-                if reddit_text: master_reason += f"Social: {s:.2f}. "
-                
-                final_targets[category].append({
-                    "symbol": ticker,
-                    "confidence": round(final_confidence, 2),
-                    "reason": master_reason
-                })
+    reddit_index = None
+    if REDDIT_MODE in ("batch", "harvest"):
+        if REDDIT_MODE == "harvest":
+            print(f"\n1. Harvesting Reddit ({len(REDDIT_SUBS)} subs) for {len(symbols)} tickers...")
+            reddit_index = harvest_reddit(symbols)
+        else:
+            print(f"\n1. Batch Reddit search for {len(symbols)} tickers...")
+            reddit_index = get_reddit_sentiment_batch(symbols)
 
+    print("\n2. Deep Diving Candidates...")
+
+    # Staged pipeline: intel for upcoming tickers is fetched while the
+    # current ones are being scored. Results are drained in input order so
+    # active_targets.json comes out exactly as the sequential loop wrote it.
+    # With the scheduler, each ticker's prompts are queued the moment its intel
+    # lands and the GPU always takes the heaviest waiting one; score_stage
+    # then only assembles verdicts.
+    intel_pool = ThreadPoolExecutor(max_workers=INTEL_WORKERS, thread_name_prefix="intel")
+    llm_pool = ThreadPoolExecutor(max_workers=LLM_WORKERS, thread_name_prefix="llm")
+    scheduler = None
+    if USE_LLM_SCHEDULER and SCORING_MODE == "single":
+        scheduler = LlmScheduler(LLM_PARALLEL, LLM_DEADLINE_S)
+
+    def gather_and_queue(ticker, category):
+        news_map, reddit_text = gather_intel(ticker)
+        pending = {
+            source_type: queue_llm_job(scheduler, ticker, category, source_type, txt)
+            for source_type, txt in build_llm_jobs(news_map, reddit_text)
+        }
+        return news_map, reddit_text, pending
+
+    def score_stage(group, category):
+        if scheduler is not None:
+            results = []
+            for ticker, tech_score, future in group:
+                news_map, reddit_text, pending = future.result()
+                verdicts = {source_type: f.result() for source_type, f in pending.items()}
+                results.append(score_candidate(ticker, category, tech_score, news_map, reddit_text, verdicts=verdicts))
+            return results
+        intel = [(ticker, tech_score, future.result()) for ticker, tech_score, future in group]
+        verdict_maps = [None] * len(intel)
+        if SCORING_MODE == "batch":
+            jobs, owners = [], []
+            for i, (ticker, _, (news_map, reddit_text)) in enumerate(intel):
+                for source_type, txt in build_llm_jobs(news_map, reddit_text):
+                    jobs.append({"symbol": ticker, "tier": source_type, "content": txt})
+                    owners.append(i)
+            verdict_maps = [{} for _ in intel]
+            if jobs:
+                for job, owner, res in zip(jobs, owners, ask_llama_batch(jobs, category)):
+                    verdict_maps[owner][job['tier']] = res
+        elif SCORING_MODE == "consolidated":
+            verdict_maps = [
+                ask_llama_consolidated(ticker, category, build_llm_jobs(news_map, reddit_text))
+                for ticker, _, (news_map, reddit_text) in intel
+            ]
+        return [
+            score_candidate(ticker, category, tech_score, news_map, reddit_text, verdicts=vm)
+            for (ticker, tech_score, (news_map, reddit_text)), vm in zip(intel, verdict_maps)
+        ]
+
+    group_size = LLM_BATCH_SIZE if SCORING_MODE == "batch" else 1
+    plan = []
+    try:
+        for category, tickers in candidates.items():
+            if category == "updated" or not tickers: continue
+            queued = []
+            for item in tickers:
+                if isinstance(item, dict):
+                    ticker = item.get('symbol')
+                    tech_score = item.get('tech_score', 50.0)
+                else:
+                    ticker = item
+                    tech_score = 50.0
+
+                if "/" in ticker: continue
+
+                if scheduler is not None:
+                    queued.append((ticker, tech_score, intel_pool.submit(gather_and_queue, ticker, category)))
+                else:
+                    queued.append((ticker, tech_score, intel_pool.submit(gather_intel, ticker)))
+            jobs = [
+                llm_pool.submit(score_stage, queued[i:i + group_size], category)
+                for i in range(0, len(queued), group_size)
+            ]
+            plan.append((category, jobs))
+
+        for category, jobs in plan:
+            print(f"   👉 Analyzing {category}...")
+            for job in jobs:
+                for log_line, target in job.result():
+                    print(log_line)
+                    if target:
+                        final_targets[category].append(target)
+    finally:
+        intel_pool.shutdown(wait=False, cancel_futures=True)
+        llm_pool.shutdown(wait=False, cancel_futures=True)
+        if scheduler is not None:
+            scheduler.shutdown(wait=False, cancel_futures=True)
 
     total_analyzed = sum(len(v) for k, v in candidates.items() if k != "updated")
     total_approved = sum(len(v) for k, v in final_targets.items() if k != "updated")
@@ -514,11 +1123,28 @@ def run_scout():
     print(f"   Analyzed: {total_analyzed}")
     print(f"   Approved: {total_approved} ({approval_rate*100:.0f}%)")
     print(f"   Avg Confidence: {avg_confidence:.2f}")
+    print(f"   HTTP: {HTTP.summary()}")
+    print(f"   {REDDIT_LIMITER.summary()}")
+    print(f"   News: {headline_index.summary()}")
+    if news_store is not None:
+        print(f"   News Store: {news_store.summary()}")
+    if scheduler is not None:
+        print(f"   LLM Scheduler: {scheduler.summary()}")
+        telemetry.count("ask_llama", skipped=scheduler.skipped)
+    if OLLAMA_STREAM:
+        print(f"   LLM Stream: {STREAM_METER.summary()}")
+    if verdict_cache is not None:
+        print(f"   LLM Cache: {verdict_cache.summary()}")
+        try:
+            verdict_cache.save()
+        except OSError as e:
+            print(f"   [!] Could not save verdict cache: {e}")
 
-    if WEBHOOK_OVERSEER:
+    webhook = overseer_webhook()
+    if webhook:
         try:
             if total_approved == 0:
-                 requests.post(WEBHOOK_OVERSEER, json={
+                 HTTP.post(webhook, json={
                     "content": (
                         f"⚠️ **SCOUT ALERT: 0 TARGETS**\n"
                         f"Analysis complete but nothing approved.\n"
@@ -528,7 +1154,7 @@ def run_scout():
                     "username": "Sector Scout"
                 })
             else:
-                requests.post(WEBHOOK_OVERSEER, json={
+                HTTP.post(webhook, json={
                     "content": (
                         f"📊 **SCOUT COMPLETE**\n"
                         f"Analyzed: {total_analyzed}\n"
@@ -544,10 +1170,25 @@ def run_scout():
     # [PHASE 2.5] Add Success Flag
     final_targets["status"] = "success"
     
-    with open(OUTPUT_FILE, 'w') as f:
-        json.dump(final_targets, f, indent=4)
-        
-    beam_to_beelink()
+    digest = atomic_write_json(OUTPUT_FILE, final_targets)
+
+    if DELIVERY_MODE == "background":
+        print(f"\n4. Queued {OUTPUT_FILE} ({digest[:12]}) for delivery to Beelink.")
+        get_deliverer().submit(OUTPUT_FILE)
+    else:
+        beam_to_beelink()
+
+    telemetry.add_http_stats(HTTP.stats(), {
+        host_key(REDDIT_BASE): "get_reddit_sentiment",
+        host_key(OLLAMA_URL): {"batch": "ask_llama_batch",
+                               "consolidated": "ask_llama_consolidated"}.get(SCORING_MODE, "ask_llama"),
+    })
+    telemetry.finish_run(RUN_METRICS_FILE, analyzed=total_analyzed, approved=total_approved,
+                         avg_confidence=round(avg_confidence, 4))
 
 if __name__ == "__main__":
-    run_scout()
\ No newline at end of file
+    run_scout()
+    if delivery is not None:
+        if not delivery.wait(DELIVERY_WAIT_S):
+            print(f"   ⚠️ Delivery still in flight after {DELIVERY_WAIT_S}s; exiting anyway.")
+        print(f"   Delivery: {delivery.summary()}")
\ No newline at end of file
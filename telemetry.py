@@ -0,0 +1,228 @@
+import os
+import json
+import time
+import datetime
+import functools
+import threading
+import statistics
+
+# --- RUN TELEMETRY ---
+# Per-stage counters for one dragnet or scout run, appended as one JSON line
+# to run_metrics.jsonl. Stages are recorded through the @instrument decorator
+# or `with stage(...)`; both are cheap enough to leave on permanently.
+#
+# wall_s is the span from a stage's first entry to its last exit, busy_s is
+# the summed time of every call. With the threaded pipelines busy_s can be
+# larger than wall_s; a widening gap means the pool is doing its job.
+
+METRICS_FILE = "run_metrics.jsonl"
+REGRESSION_RATIO = 1.5   # Latest run slower than this x the trailing median gets flagged
+TREND_RUNS = 10          # Trailing runs the median is taken over
+
+COUNTERS = ("calls", "errors", "retries", "cache_hits", "bytes_in", "bytes_out")
+# Only present on stages that actually measured them: yfinance's own session
+# (filter_by_volume, the bar store, the earnings calendar) can't report bytes,
+# and a 0 there would read as "no traffic"
+MEASURED_COUNTERS = ("bytes_in", "bytes_out")
+
+
+class Telemetry:
+    def __init__(self, run="run"):
+        self.run = run
+        self.started = time.time()
+        self._t0 = time.perf_counter()
+        self._lock = threading.Lock()
+        self.stages = {}
+
+    def _stage(self, name):
+        st = self.stages.get(name)
+        if st is None:
+            st = self.stages[name] = {"busy_s": 0.0, "first": None, "last": None,
+                                      **{c: 0 for c in COUNTERS if c not in MEASURED_COUNTERS}}
+        return st
+
+    def record(self, name, start, end, error=False):
+        """One finished call of `name` (perf_counter timestamps)."""
+        with self._lock:
+            st = self._stage(name)
+            st["calls"] += 1
+            st["errors"] += int(error)
+            st["busy_s"] += end - start
+            st["first"] = start if st["first"] is None else min(st["first"], start)
+            st["last"] = end if st["last"] is None else max(st["last"], end)
+
+    def count(self, name, **counters):
+        """Adds to a stage's counters (retries, cache_hits, bytes_in, ...)."""
+        with self._lock:
+            st = self._stage(name)
+            for key, value in counters.items():
+                st[key] = st.get(key, 0) + value
+
+    def snapshot(self):
+        with self._lock:
+            stages = {}
+            for name, st in self.stages.items():
+                out = {k: v for k, v in st.items() if k not in ("first", "last")}
+                out["busy_s"] = round(out["busy_s"], 4)
+                out["wall_s"] = round(st["last"] - st["first"], 4) if st["first"] is not None else 0.0
+                stages[name] = out
+        return {
+            "run": self.run,
+            "started": datetime.datetime.fromtimestamp(self.started).isoformat(timespec="seconds"),
+            "duration_s": round(time.perf_counter() - self._t0, 4),
+            "stages": stages,
+        }
+
+    def write(self, path=METRICS_FILE, **extra):
+        """Appends this run as one JSON line. Returns the record."""
+        record = {**self.snapshot(), **extra}
+        if path:
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record) + "\n")
+        return record
+
+
+# --- CURRENT RUN ---
+_current = Telemetry()
+
+def start_run(run):
+    """Begins a fresh metrics record; instrumented calls land in it from now on."""
+    global _current
+    _current = Telemetry(run)
+    return _current
+
+def current():
+    return _current
+
+def count(name, **counters):
+    _current.count(name, **counters)
+
+def add_http_stats(host_stats, host_stages):
+    """Folds HttpClient.stats() bytes/retries into the stages that own each host."""
+    for host, name in host_stages.items():
+        s = host_stats.get(host)
+        if s:
+            _current.count(name, bytes_in=s["bytes_in"], bytes_out=s["bytes_out"], retries=s["retries"])
+
+def finish_run(path=METRICS_FILE, **extra):
+    try:
+        return _current.write(path, **extra)
+    except OSError as e:
+        print(f"   [!] Could not write run metrics: {e}")
+        return None
+
+
+class stage:
+    """`with stage("earnings_guard"):` times a block as one call of that stage."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _current.record(self.name, self._start, time.perf_counter(), error=exc_type is not None)
+        return False
+
+def instrument(name=None):
+    """Decorator: every call of the function is timed and counted under `name`."""
+    def wrap(fn):
+        stage_name = name or fn.__name__
+
+        @functools.wraps(fn)
+        def inner(*args, **kwargs):
+            start = time.perf_counter()
+            error = False
+            try:
+                return fn(*args, **kwargs)
+            except BaseException:
+                error = True
+                raise
+            finally:
+                _current.record(stage_name, start, time.perf_counter(), error)
+        return inner
+    return wrap
+
+
+# --- SUMMARY CLI ---
+def load_runs(path=METRICS_FILE, run=None):
+    runs = []
+    if not os.path.exists(path):
+        return runs
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue   # Torn line from an interrupted write
+            if run is None or record.get("run") == run:
+                runs.append(record)
+    return runs
+
+def regressions(runs, ratio=REGRESSION_RATIO, window=TREND_RUNS):
+    """[(stage, latest wall_s, trailing median)] for stages that got markedly slower in the latest run."""
+    if len(runs) < 2:
+        return []
+    latest, history = runs[-1], runs[-1 - window:-1]
+    flagged = []
+    for name, st in latest["stages"].items():
+        past = [r["stages"][name]["wall_s"] for r in history if name in r["stages"]]
+        if not past:
+            continue
+        median = statistics.median(past)
+        if median > 0 and st["wall_s"] > ratio * median:
+            flagged.append((name, st["wall_s"], median))
+    return flagged
+
+def summarize(runs, last=TREND_RUNS):
+    """Text table: one row per run, one column per stage (wall seconds)."""
+    runs = runs[-last:]
+    if not runs:
+        return "No runs recorded."
+    names = []
+    for r in runs:
+        for name in r["stages"]:
+            if name not in names:
+                names.append(name)
+    width = max(10, *(len(n) for n in names)) if names else 10
+    lines = [f"{'stage':<{width}} " + " ".join(f"{r['started'][5:16]:>12}" for r in runs)]
+    lines.append(f"{'TOTAL':<{width}} " + " ".join(f"{r['duration_s']:>11.1f}s" for r in runs))
+    for name in names:
+        cells = []
+        for r in runs:
+            st = r["stages"].get(name)
+            cells.append(f"{st['wall_s']:>11.1f}s" if st else f"{'-':>12}")
+        lines.append(f"{name:<{width}} " + " ".join(cells))
+
+    latest = runs[-1]["stages"]
+    lines.append("")
+    lines.append(f"Latest run counters:")
+    for name in names:
+        st = latest.get(name)
+        if not st:
+            continue
+        extras = ", ".join(f"{c} {st[c]}" for c in COUNTERS[1:] if st.get(c))
+        lines.append(f"  {name:<{width}} {st['calls']:>6} calls, busy {st['busy_s']:.1f}s"
+                     + (f", {extras}" if extras else ""))
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Summarize dragnet/scout run metrics")
+    parser.add_argument("--file", default=METRICS_FILE)
+    parser.add_argument("--run", help="Only runs of this kind (dragnet, scout)")
+    parser.add_argument("--last", type=int, default=TREND_RUNS)
+    args = parser.parse_args()
+
+    runs = load_runs(args.file, args.run)
+    kinds = [args.run] if args.run else sorted({r["run"] for r in runs})
+    for kind in kinds:
+        subset = [r for r in runs if r["run"] == kind]
+        print(f"--- 📈 {kind.upper()} ({len(subset)} runs) ---")
+        print(summarize(subset, args.last))
+        for name, latest, median in regressions(subset):
+            print(f"   🚨 REGRESSION: {name} took {latest:.1f}s vs {median:.1f}s median")
+        print()
@@ -0,0 +1,96 @@
+import unittest
+import numpy as np
+import pandas as pd
+import backtest
+import indicator_engine
+import market_scanner
+import sector_scout_3
+from test_indicator_engine_logic import make_universe
+
+class TestBacktest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.data = make_universe(n_symbols=24, days=300, seed=11)
+        cls.symbols = list(cls.data.columns.levels[0])
+        cls.syms, cls.dates, cls.series = indicator_engine.compute_indicator_series(
+            cls.data, cls.symbols, horizons=(1, 5))
+
+    def test_series_last_row_matches_compute_indicators(self):
+        latest = indicator_engine.compute_indicators(self.data, self.symbols)
+        for col in ["price", "rsi", "adx", "atr", "sma200"]:
+            np.testing.assert_allclose(self.series[col][-1], latest[col].to_numpy(), rtol=1e-9, err_msg=col)
+        # Missing sessions stay missing on the date grid
+        self.assertTrue(np.isnan(self.series["price"][101, self.syms.index("S02")]))
+
+    def test_series_midway_matches_truncated_history(self):
+        t = 240
+        latest = indicator_engine.compute_indicators(self.data.iloc[:t + 1], self.symbols)
+        np.testing.assert_allclose(self.series["rsi"][t], latest["rsi"].to_numpy(), rtol=1e-9)
+        np.testing.assert_allclose(self.series["adx"][t], latest["adx"].to_numpy(), rtol=1e-9)
+
+    def test_classify_panel_matches_classify_technicals(self):
+        s = self.series
+        category, score = backtest.classify_panel(s["price"], s["rsi"], s["adx"], s["sma200"])
+        for t in range(200, len(self.dates), 7):
+            for j, sym in enumerate(self.syms):
+                item = market_scanner.classify_technicals(sym, s["price"][t, j], s["rsi"][t, j],
+                                                          s["adx"][t, j], s["sma200"][t, j])
+                if item is None:
+                    self.assertEqual(category[t, j], -1)
+                else:
+                    self.assertEqual(backtest.CATEGORIES[category[t, j]], item["type"])
+                    self.assertAlmostEqual(score[t, j], item["score"])
+
+    def test_top_picks_match_dragnet_output(self):
+        s = self.series
+        category, score = backtest.classify_panel(s["price"], s["rsi"], s["adx"], s["sma200"])
+        d, j, cat, sc = backtest.top_picks(category, score, top_n=3)
+        t = len(self.dates) - 1
+        results = [market_scanner.classify_technicals(sym, s["price"][t, k], s["rsi"][t, k],
+                                                      s["adx"][t, k], s["sma200"][t, k])
+                   for k, sym in enumerate(self.syms)]
+        expected = market_scanner.build_dragnet_output([r for r in results if r], per_category=3)
+        for code, name in enumerate(backtest.CATEGORIES):
+            mine = [self.syms[k] for k in j[(d == t) & (cat == code)]]
+            self.assertEqual(mine, [e["symbol"] for e in expected[name]])
+
+    def test_confidence_matches_score_candidate(self):
+        cases = [
+            ("trend_targets", 40.0, {"tier1_news": 0.9, "tier2_news": np.nan, "tier3_news": np.nan, "social": 0.2}),
+            ("condor_targets", 12.0, {"tier1_news": np.nan, "tier2_news": 0.3, "tier3_news": 0.7, "social": np.nan}),
+            ("survivor_targets", 25.0, {k: np.nan for k in backtest.SOURCE_WEIGHTS}),
+        ]
+        for category, tech_score, verdicts in cases:
+            news_map = {f"tier{i}": (["headline"] if not np.isnan(verdicts[f"tier{i}_news"]) else [])
+                        for i in (1, 2, 3)}
+            reddit = "chatter" if not np.isnan(verdicts["social"]) else ""
+            given = {k: (v, "mock") for k, v in verdicts.items() if not np.isnan(v)}
+            _, target = sector_scout_3.score_candidate("TEST", category, tech_score, news_map, reddit, given)
+            code = np.array([backtest.CATEGORIES.index(category)])
+            tech_norm = backtest.normalize_tech_scores(np.array([tech_score]), code)
+            conf = backtest.score_confidence(tech_norm, {k: np.array([v]) for k, v in verdicts.items()})[0]
+            if target is None:
+                self.assertLessEqual(conf, backtest.APPROVAL_THRESHOLD)
+            else:
+                self.assertAlmostEqual(round(conf, 2), target["confidence"])
+
+    def test_replay_report(self):
+        picks, table = backtest.replay(self.data, self.symbols, horizons=(1, 5),
+                                       verdicts=backtest.MockVerdicts(skill=1.0, horizon=5))
+        self.assertEqual(len(table), len(backtest.CATEGORIES) * 2)
+        self.assertLessEqual(picks.groupby(["date", "category"]).size().max(), backtest.TOP_N)
+        # Forward return is really the close h bars later
+        row = picks.dropna(subset=["fwd_5"]).iloc[0]
+        closes = self.data[row["symbol"]]["Close"].dropna()
+        pos = closes.index.get_loc(row["date"])
+        self.assertAlmostEqual(row["fwd_5"], closes.iloc[pos + 5] / closes.iloc[pos] - 1)
+        # A perfect-foresight LLM can only improve the approved hit rate
+        h5 = table[(table["horizon"] == 5) & (table["approved"] > 0)]
+        self.assertTrue((h5["approved_hit_rate"] >= h5["hit_rate"]).all())
+
+    def test_replay_window(self):
+        picks, _ = backtest.replay(self.data, self.symbols, start="2025-05-01", end="2025-06-30")
+        self.assertTrue((picks["date"] >= "2025-05-01").all() and (picks["date"] <= "2025-06-30").all())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+
+import unittest
+import shutil
+import tempfile
+import datetime
+import numpy as np
+import pandas as pd
+from bar_store import BarStore
+
+def make_bars(start, days, base=100.0):
+    # Business-day fixture bars with a deterministic drift
+    idx = pd.bdate_range(start, periods=days)
+    close = base + np.arange(days, dtype=float)
+    return pd.DataFrame({
+        "Open": close - 0.5, "High": close + 1.0, "Low": close - 1.0,
+        "Close": close, "Volume": np.full(days, 2_000_000.0)
+    }, index=idx)
+
+class FixtureFetcher:
+    """Offline fetcher: serves slices of fixture frames and records every call."""
+    def __init__(self, frames):
+        self.frames = frames
+        self.calls = []
+
+    def __call__(self, symbols, start):
+        self.calls.append((tuple(symbols), start))
+        out = {}
+        for sym in symbols:
+            df = self.frames.get(sym)
+            if df is None: continue
+            sub = df[df.index >= pd.Timestamp(start)]
+            if not sub.empty: out[sym] = sub
+        return out
+
+class TestBarStore(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.today = datetime.date(2026, 3, 2)
+        self.history = make_bars("2025-01-01", 300)
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_full_then_delta(self):
+        frames = {"AAA": self.history.iloc[:-5], "BBB": self.history.iloc[:-5] * 2}
+        fetcher = FixtureFetcher(frames)
+        store = BarStore(root=self.root, fetcher=fetcher)
+
+        stats = store.update(["AAA", "BBB"], history_days=730, today=self.today)
+        self.assertEqual(stats["full"], 2)
+        self.assertEqual(len(fetcher.calls), 1)
+        self.assertEqual(len(store.frame("AAA")), 295)
+
+        # Next day: five new bars appear; only the delta is requested
+        fetcher.frames = {"AAA": self.history, "BBB": self.history * 2}
+        stats = store.update(["AAA", "BBB"], history_days=730, today=self.today)
+        self.assertEqual(stats["delta"], 2)
+        self.assertEqual(fetcher.calls[-1][1], self.history.index[-6].date())
+
+        df = store.frame("AAA")
+        self.assertEqual(len(df), 300)
+        self.assertEqual(df["Close"].iloc[-1], self.history["Close"].iloc[-1])
+        self.assertTrue(df.index.is_monotonic_increasing)
+
+    def test_partial_bar_is_replaced(self):
+        partial = self.history.copy()
+        partial.iloc[-1, partial.columns.get_loc("Close")] = 1.0
+        fetcher = FixtureFetcher({"AAA": partial})
+        store = BarStore(root=self.root, fetcher=fetcher)
+        store.update(["AAA"], history_days=730, today=self.today)
+
+        fetcher.frames = {"AAA": self.history}
+        store.update(["AAA"], history_days=730, today=self.today)
+        df = store.frame("AAA")
+        self.assertEqual(len(df), 300)
+        self.assertEqual(df["Close"].iloc[-1], self.history["Close"].iloc[-1])
+
+    def test_split_readjustment_triggers_full_refetch(self):
+        fetcher = FixtureFetcher({"AAA": self.history.iloc[:-5]})
+        store = BarStore(root=self.root, fetcher=fetcher)
+        store.update(["AAA"], history_days=730, today=self.today)
+
+        # 4:1 split on the next bar: Yahoo re-serves the whole history divided by 4
+        adjusted = self.history.copy()
+        adjusted.iloc[:, :4] = adjusted.iloc[:, :4] / 4
+        fetcher.frames = {"AAA": adjusted}
+        stats = store.update(["AAA"], history_days=730, today=self.today)
+
+        self.assertEqual(stats["rescaled"], ["AAA"])
+        self.assertTrue(fetcher.calls[-1][1] < self.history.index[0].date())   # Full refetch
+        df = store.frame("AAA")
+        self.assertEqual(len(df), 300)
+        np.testing.assert_allclose(df["Close"].to_numpy(), adjusted["Close"].to_numpy())
+
+        # Settled again: the next run is a plain delta
+        stats = store.update(["AAA"], history_days=730, today=self.today)
+        self.assertEqual((stats["delta"], stats["rescaled"]), (1, []))
+
+    def test_intraday_close_move_is_not_a_rescale(self):
+        partial = self.history.copy()
+        partial.iloc[-1, partial.columns.get_loc("Close")] *= 1.05
+        fetcher = FixtureFetcher({"AAA": partial})
+        store = BarStore(root=self.root, fetcher=fetcher)
+        store.update(["AAA"], history_days=730, today=self.today)
+        fetcher.frames = {"AAA": self.history}
+        stats = store.update(["AAA"], history_days=730, today=self.today)
+        self.assertEqual(stats["rescaled"], [])
+
+    def test_shallow_history_is_deepened(self):
+        fetcher = FixtureFetcher({"AAA": self.history})
+        store = BarStore(root=self.root, fetcher=fetcher)
+        store.update(["AAA"], history_days=7, today=self.today)
+        plan = store.plan(["AAA"], history_days=730, today=self.today)
+        self.assertEqual(list(plan.values()), [["AAA"]])
+        self.assertTrue(list(plan.keys())[0][1])
+
+    def test_symbols_by_depth_and_progress(self):
+        fetcher = FixtureFetcher({"AAA": self.history, "BBB": self.history})
+        store = BarStore(root=self.root, fetcher=fetcher, chunk_size=1)
+        seen = []
+        store.update(["AAA"], history_days=730, today=self.today, progress=lambda d, t: seen.append((d, t)))
+        store.update(["BBB"], history_days=7, today=self.today)
+        self.assertEqual(seen, [(1, 1)])
+        self.assertEqual(store.symbols(), ["AAA", "BBB"])
+        self.assertEqual(store.symbols(min_history_days=730), ["AAA"])
+
+    def test_panel_shape(self):
+        fetcher = FixtureFetcher({"AAA": self.history, "BBB": self.history})
+        store = BarStore(root=self.root, fetcher=fetcher)
+        store.update(["AAA", "BBB", "MISSING"], history_days=730, today=self.today)
+        panel = store.panel(["AAA", "BBB", "MISSING"])
+        self.assertIsInstance(panel.columns, pd.MultiIndex)
+        self.assertEqual(sorted(panel.columns.levels[0]), ["AAA", "BBB"])
+        self.assertIn("Close", panel["AAA"].columns)
+
+if __name__ == '__main__':
+    unittest.main()
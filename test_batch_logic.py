@@ -0,0 +1,70 @@
+
+import unittest
+from unittest.mock import patch, MagicMock
+import json
+import sector_scout_3
+from ollama_stub import OllamaStub
+
+REASON = "Guidance raised and analysts lifted targets after the quarter."
+
+def reply(text):
+    mock_response = MagicMock()
+    mock_response.json.return_value = {'response': text}
+    return mock_response
+
+JOBS = [
+    {"symbol": "AAPL", "tier": "tier1_news", "content": "- [Reuters] Apple beats"},
+    {"symbol": "AAPL", "tier": "social", "content": "- [r/stocks] AAPL calls (40 pts)"},
+    {"symbol": "MSFT", "tier": "tier2_news", "content": "- [Forbes] Microsoft cloud grows"},
+]
+
+class TestBatchScoring(unittest.TestCase):
+    @patch('sector_scout_3.HTTP.post')
+    def test_batch_single_call(self, mock_post):
+        mock_post.return_value = reply(json.dumps({"results": [
+            {"symbol": "AAPL", "tier": "tier1_news", "score": 0.9, "reason": REASON},
+            {"symbol": "AAPL", "tier": "social", "score": 0.4, "reason": REASON},
+            {"symbol": "MSFT", "tier": "tier2_news", "score": 1.7, "reason": REASON},
+        ]}))
+        results = sector_scout_3.ask_llama_batch(JOBS, "trend_targets")
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertEqual(results[0], (0.9, REASON))
+        self.assertEqual(results[1], (0.4, REASON))
+        self.assertEqual(results[2], (1.0, REASON))  # Clamped by validate_llm_response
+        prompt = mock_post.call_args.kwargs['json']['prompt']
+        self.assertIn("[3] SYMBOL: MSFT | TIER: tier2_news", prompt)
+
+    @patch('sector_scout_3.HTTP.post')
+    def test_missing_item_retried_alone(self, mock_post):
+        mock_post.side_effect = [
+            reply(json.dumps([
+                {"symbol": "AAPL", "tier": "tier1_news", "score": 0.9, "reason": REASON},
+                {"symbol": "AAPL", "tier": "social", "score": "n/a", "reason": REASON},
+            ])),
+            reply(json.dumps({"score": 0.3, "reason": REASON})),
+            reply(json.dumps({"score": 0.6, "reason": REASON})),
+        ]
+        results = sector_scout_3.ask_llama_batch(JOBS, "trend_targets")
+        self.assertEqual(mock_post.call_count, 3)
+        self.assertEqual(results, [(0.9, REASON), (0.3, REASON), (0.6, REASON)])
+        retried = mock_post.call_args_list[1].kwargs['json']['prompt']
+        self.assertIn("Analyze AAPL based on this Reddit/Social Media Sentiment", retried)
+
+    @patch('sector_scout_3.HTTP.post')
+    def test_unparseable_batch_falls_back(self, mock_post):
+        mock_post.side_effect = [reply("I cannot do that.")] + [
+            reply(json.dumps({"score": 0.5, "reason": REASON})) for _ in JOBS
+        ]
+        results = sector_scout_3.ask_llama_batch(JOBS, "short_targets")
+        self.assertEqual(mock_post.call_count, 1 + len(JOBS))
+        self.assertEqual(results, [(0.5, REASON)] * len(JOBS))
+
+    def test_against_stub_server(self):
+        with OllamaStub() as stub, patch.object(sector_scout_3, "OLLAMA_URL", stub.url):
+            results = sector_scout_3.ask_llama_batch(JOBS, "wheel_targets")
+            self.assertEqual(stub.calls, 1)
+            self.assertEqual(stub.items, len(JOBS))
+        self.assertTrue(all(0.0 <= s <= 1.0 for s, _ in results))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import io
+from unittest.mock import patch
+import bench_fixtures
+import bench_suite
+import sector_scout_3
+from rate_limiter import TokenBucket
+from ollama_stub import OllamaStub, canned_responder
+from reddit_stub import RedditStub
+
+class FixedTicker(bench_fixtures.FakeTicker):
+    shape = "old"
+
+    @property
+    def news(self):
+        return bench_fixtures.news_payload(self.ticker, self.shape)
+
+class TestFixtures(unittest.TestCase):
+    def parse(self, shape):
+        FixedTicker.shape = shape
+        with patch.object(sector_scout_3.yf, "Ticker", FixedTicker):
+            return sector_scout_3.get_tiered_news("ACME")
+
+    def test_news_shapes_parse_the_same_way(self):
+        old = self.parse("old")
+        new = self.parse("content")
+        # The items older than 7 days are dropped in both shapes
+        self.assertEqual([len(old[t]) for t in ("tier1", "tier2", "tier3")], [3, 2, 4])
+        self.assertEqual([len(new[t]) for t in ("tier1", "tier2", "tier3")], [2, 3, 4])
+        self.assertEqual(old["tier1"][0], "- [Reuters] ACME beats quarterly estimates as demand holds up")
+        self.assertTrue(all("ACME" in item for items in new.values() for item in items))
+
+    def test_reddit_stub_serves_search(self):
+        with RedditStub() as reddit, \
+             patch.object(sector_scout_3, "REDDIT_BASE", reddit.url), \
+             patch.object(sector_scout_3, "REDDIT_LIMITER", TokenBucket(rate=1000, max_rate=1000)):
+            summary = sector_scout_3.get_reddit_sentiment("ACME")
+        self.assertEqual(reddit.requests, len(sector_scout_3.REDDIT_SEARCH_SUBS))
+        lines = summary.splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].startswith("- [r/wallstreetbets] $ACME earnings play"))
+
+    def test_canned_ollama_replies(self):
+        canned = bench_fixtures.ollama_responses()
+        with OllamaStub(responder=canned_responder(canned["single"][1:2])) as ollama, \
+             patch.object(sector_scout_3, "OLLAMA_URL", ollama.url), \
+             patch.object(sector_scout_3, "verdict_cache", None):
+            score, reason = sector_scout_3.ask_llama("ACME", "trend_targets", "- [Reuters] ACME news")
+        self.assertEqual(score, 0.35)
+        self.assertTrue(reason.startswith("Guidance risk"))
+
+    def test_ohlcv_is_deterministic(self):
+        a = bench_fixtures.make_ohlcv(3, 50)
+        b = bench_fixtures.make_ohlcv(3, 50)
+        self.assertTrue(a.equals(b))
+        self.assertTrue((a.xs("High", axis=1, level=1) >= a.xs("Low", axis=1, level=1)).all().all())
+
+    def test_suite_smoke(self):
+        out = io.StringIO()
+        rows = bench_suite.run_suite(scales=(5,), out=out)
+        self.assertEqual(len(rows), 6)
+        self.assertIn("run_scout", out.getvalue())
+        self.assertIn("20 LLM calls", rows[-1][3])
+
+if __name__ == '__main__':
+    unittest.main()
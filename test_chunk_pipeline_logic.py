@@ -0,0 +1,82 @@
+
+import unittest
+import threading
+import time
+import pandas as pd
+from chunk_pipeline import run_chunked
+import market_scanner
+
+def frame(volume, close):
+    idx = pd.bdate_range("2026-02-23", periods=5)
+    return pd.DataFrame({"Close": [close] * 5, "Volume": [volume] * 5}, index=idx)
+
+class FakeDownloader:
+    """Fails any chunk containing a poisoned symbol; tracks concurrency."""
+    def __init__(self, poisoned=(), delay=0.01):
+        self.poisoned = set(poisoned)
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, chunk):
+        with self.lock:
+            self.calls.append(list(chunk))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if self.poisoned & set(chunk):
+                raise ValueError("bad symbol in chunk")
+            return {s: frame(3_000_000 if s.startswith("L") else 10_000, 50.0) for s in chunk}
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+class TestChunkPipeline(unittest.TestCase):
+    def test_bisection_isolates_bad_symbol(self):
+        symbols = [f"S{i:02d}" for i in range(16)]
+        fetch = FakeDownloader(poisoned={"S05"})
+        seen = []
+        stats = run_chunked(symbols, fetch, lambda c, r: seen.extend(r), chunk_size=8, workers=2)
+        self.assertEqual(sorted(seen), sorted(s for s in symbols if s != "S05"))
+        self.assertEqual(stats.failed_symbols, ["S05"])
+        self.assertEqual(stats.bisections, 3)     # 8 -> 4 -> 2 -> 1
+        self.assertEqual(stats.chunks, len(stats.latencies))
+
+    def test_concurrency_limit(self):
+        fetch = FakeDownloader(delay=0.03)
+        run_chunked([f"S{i}" for i in range(40)], fetch, lambda c, r: None, chunk_size=5, workers=3)
+        self.assertLessEqual(fetch.max_in_flight, 3)
+        self.assertGreater(fetch.max_in_flight, 1)
+
+    def test_empty_chunk_counts_as_failure(self):
+        stats = run_chunked(["A", "B"], lambda c: {}, lambda c, r: None, chunk_size=2, workers=1)
+        self.assertEqual(sorted(stats.failed_symbols), ["A", "B"])
+
+    def test_empty_chunk_is_not_bisected(self):
+        calls = []
+        def fetch(chunk):
+            calls.append(list(chunk))
+            return {}
+        stats = run_chunked([f"S{i}" for i in range(8)], fetch, lambda c, r: None, chunk_size=8, workers=1)
+        self.assertEqual((len(calls), stats.bisections), (1, 0))
+        self.assertEqual(len(stats.failed_symbols), 8)
+
+    def test_bisection_stops_when_most_chunks_fail(self):
+        def fetch(chunk):
+            raise ConnectionError("429 Too Many Requests")
+        symbols = [f"S{i:03d}" for i in range(200)]
+        stats = run_chunked(symbols, fetch, lambda c, r: None, chunk_size=20, workers=2)
+        self.assertLess(stats.chunks, 30)              # Full bisection would be ~390 requests
+        self.assertEqual(sorted(stats.failed_symbols), symbols)
+
+    def test_filter_by_volume_keeps_order_and_survives_bad_chunk(self):
+        tickers = ["L1", "Q1", "L2", "BAD", "L3", "Q2", "L4", "L5"]
+        fetch = FakeDownloader(poisoned={"BAD"})
+        liquid = market_scanner.filter_by_volume(tickers, chunk_size=4, download_fn=fetch)
+        self.assertEqual(liquid, ["L1", "L2", "L3", "L4", "L5"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+from unittest.mock import patch
+import json
+import sector_scout_3
+from ollama_stub import OllamaStub, default_responder
+
+REASON = "Guidance raised and analysts lifted targets after the quarter."
+JOBS = [
+    ("tier1_news", "- [Reuters] Apple beats"),
+    ("tier2_news", "- [Forbes] Apple cloud grows"),
+    ("social", "- [r/stocks] AAPL calls (40 pts)"),
+]
+
+class TestConsolidatedScoring(unittest.TestCase):
+    def setUp(self):
+        sector_scout_3.primed_contexts.clear()
+
+    def ask(self, stub, ticker="AAPL", strategy="trend_targets", jobs=JOBS):
+        with patch.object(sector_scout_3, "OLLAMA_URL", stub.url), \
+             patch.object(sector_scout_3, "verdict_cache", None):
+            return sector_scout_3.ask_llama_consolidated(ticker, strategy, jobs)
+
+    def test_one_call_per_ticker_with_primed_context(self):
+        with OllamaStub() as stub:
+            first = self.ask(stub)
+            self.assertEqual(stub.calls, 2)          # Priming + AAPL
+            self.ask(stub, ticker="MSFT")
+            self.assertEqual(stub.calls, 3)          # Context reused: no second priming
+            self.assertEqual(stub.contexts_seen, 2)
+        self.assertEqual(set(first), {"tier1_news", "tier2_news", "social"})
+        self.assertTrue(all(0.0 <= s <= 1.0 for s, _ in first.values()))
+
+    def test_missing_section_retried_singly(self):
+        def responder(prompt):
+            if "### " not in prompt:
+                return default_responder(prompt)
+            return json.dumps({"sections": {"tier1_news": {"score": 0.9, "reason": REASON}}}), 1
+        with OllamaStub(responder=responder) as stub:
+            with patch.object(sector_scout_3, "ask_llama", return_value=(0.4, REASON)) as single:
+                verdicts = self.ask(stub)
+        self.assertEqual(verdicts["tier1_news"], (0.9, REASON))
+        self.assertEqual(verdicts["tier2_news"], (0.4, REASON))
+        self.assertEqual(single.call_count, 2)
+
+    def test_inline_persona_when_priming_fails(self):
+        prompts = []
+        def responder(prompt):
+            prompts.append(prompt)
+            return default_responder(prompt)
+        with OllamaStub(responder=responder) as stub:
+            with patch.object(sector_scout_3, "primed_context", return_value=None):
+                self.ask(stub, strategy="short_targets")
+        self.assertEqual(len(prompts), 1)
+        self.assertIn("short seller", prompts[0])
+        self.assertIn("### SOCIAL", prompts[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
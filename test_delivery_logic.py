@@ -0,0 +1,154 @@
+import unittest
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+import threading
+import subprocess
+from unittest.mock import MagicMock, patch
+from delivery import Deliverer, LocalDirTransport, SshTransport, atomic_write_json, sha256_file
+
+class FakeSsh:
+    """Stand-in for ssh/scp: runs sha256sum/mv/copy against a local 'remote' dir."""
+
+    def __init__(self, remote_dir):
+        self.remote_dir = remote_dir
+        self.commands = []
+
+    def local(self, remote_path):
+        return os.path.join(self.remote_dir, os.path.basename(remote_path))
+
+    def __call__(self, argv, **kwargs):
+        self.commands.append(argv[0])
+        if argv[0] == "scp":
+            src, dest = argv[-2], argv[-1].split(":", 1)[1]
+            shutil.copyfile(src, self.local(dest))
+            return MagicMock(stdout=b"")
+        command = argv[-1]
+        if command.startswith("sha256sum"):
+            path = self.local(command.split()[1])
+            out = f"{sha256_file(path)}  {path}\n".encode() if os.path.exists(path) else b""
+            return MagicMock(stdout=out)
+        if command.startswith("mv -f"):
+            _, _, part, final = command.split()
+            os.replace(self.local(part), self.local(final))
+            return MagicMock(stdout=b"")
+        raise AssertionError(command)
+
+
+class TestDelivery(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.remote = os.path.join(self.tmp, "remote")
+        os.makedirs(self.remote)
+        self.path = os.path.join(self.tmp, "active_targets.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_atomic_write_returns_content_hash(self):
+        digest = atomic_write_json(self.path, {"trend_targets": []})
+        with open(self.path, 'rb') as f:
+            self.assertEqual(hashlib.sha256(f.read()).hexdigest(), digest)
+        self.assertFalse([n for n in os.listdir(self.tmp) if n.endswith(".tmp")])
+
+    def test_unchanged_file_skipped(self):
+        d = Deliverer(LocalDirTransport(self.remote), sleep=lambda s: None)
+        atomic_write_json(self.path, {"v": 1})
+        d.submit(self.path)
+        self.assertTrue(d.wait(5))
+        d.submit(self.path)
+        self.assertTrue(d.wait(5))
+        atomic_write_json(self.path, {"v": 2})
+        d.submit(self.path)
+        self.assertTrue(d.wait(5))
+        self.assertEqual((d.pushed, d.skipped, d.failed), (2, 1, 0))
+        with open(os.path.join(self.remote, "active_targets.json")) as f:
+            self.assertEqual(json.load(f), {"v": 2})
+
+    def test_remote_copy_already_current(self):
+        atomic_write_json(self.path, {"v": 1})
+        shutil.copyfile(self.path, os.path.join(self.remote, "active_targets.json"))
+        d = Deliverer(LocalDirTransport(self.remote))
+        d.submit(self.path)
+        self.assertTrue(d.wait(5))
+        self.assertEqual((d.pushed, d.skipped), (0, 1))
+
+    def test_ssh_transport_against_stand_in(self):
+        fake = FakeSsh(self.remote)
+        ssh = SshTransport("trader", "beelink", "~/bots/repo/active_targets.json", control_dir=self.tmp, run=fake,
+                           multiplex=True)
+        d = Deliverer(ssh)
+        atomic_write_json(self.path, {"v": 1})
+        d.submit(self.path)
+        self.assertTrue(d.wait(5))
+        d.submit(self.path)
+        self.assertTrue(d.wait(5))
+        self.assertEqual(fake.commands, ["ssh", "scp", "ssh"])   # hash, copy, mv; second submit is free
+        self.assertEqual(sha256_file(os.path.join(self.remote, "active_targets.json")), sha256_file(self.path))
+        self.assertIn("ControlMaster=auto", ssh.options)
+        self.assertFalse(any(":" in os.path.basename(o) for o in ssh.options if o.startswith("ControlPath=")))
+
+    def test_ssh_without_multiplexing_is_one_scp(self):
+        fake = FakeSsh(self.remote)
+        ssh = SshTransport("trader", "beelink", "~/bots/repo/active_targets.json", run=fake, multiplex=False)
+        d = Deliverer(ssh)
+        atomic_write_json(self.path, {"v": 1})
+        d.submit(self.path)
+        self.assertTrue(d.wait(5))
+        self.assertEqual(fake.commands, ["scp"])
+        self.assertNotIn("ControlMaster=auto", ssh.options)
+        self.assertEqual(sha256_file(os.path.join(self.remote, "active_targets.json")), sha256_file(self.path))
+
+    def test_retries_then_gives_up_without_blocking_submit(self):
+        transport = MagicMock()
+        transport.describe.return_value = "flaky"
+        transport.remote_hash.return_value = None
+        gate = threading.Event()
+        def push(*args):
+            gate.wait(5)
+            raise subprocess.CalledProcessError(1, "scp")
+        transport.push.side_effect = push
+        sleeps, alerts = [], []
+        d = Deliverer(transport, retries=3, backoff=5, sleep=sleeps.append,
+                      on_failure=lambda name, error: alerts.append((name, error)))
+        atomic_write_json(self.path, {"v": 1})
+        d.submit(self.path)                 # Returns while the push is stuck
+        self.assertFalse(d.wait(0.05))
+        gate.set()
+        self.assertTrue(d.wait(5))
+        self.assertEqual((d.pushed, d.failed), (0, 1))
+        self.assertEqual(sleeps, [5, 10])
+        self.assertEqual(d.retried, 3)
+        self.assertEqual(alerts, [("active_targets.json", d.last_error)])
+        self.assertIn("CalledProcessError", d.summary())
+
+    def test_completion_reported_from_worker_as_metrics_row(self):
+        import sector_scout_3
+        import telemetry
+        metrics = os.path.join(self.tmp, "metrics.jsonl")
+        with patch.object(sector_scout_3, "RUN_METRICS_FILE", metrics):
+            d = Deliverer(LocalDirTransport(self.remote), on_complete=sector_scout_3.record_delivery)
+            atomic_write_json(self.path, {"v": 1})
+            d.submit(self.path)
+            self.assertTrue(d.wait(5))
+        runs = telemetry.load_runs(metrics, run="delivery")
+        self.assertEqual(len(runs), 1)
+        self.assertTrue(runs[0]["ok"])
+        stage = runs[0]["stages"]["beam_to_beelink"]
+        self.assertEqual((stage["calls"], stage["bytes_out"], stage["retries"]), (1, os.path.getsize(self.path), 0))
+
+    def test_scout_deliverer_alerts_overseer_on_failure(self):
+        import sector_scout_3
+        with patch.object(sector_scout_3, "delivery", None), \
+             patch.object(sector_scout_3, "WEBHOOK_OVERSEER", "http://overseer.test/hook"), \
+             patch.object(sector_scout_3.HTTP, "post") as post:
+            d = sector_scout_3.get_deliverer()
+            d.on_failure("active_targets.json", "TimeoutExpired: scp")
+        self.assertEqual(post.call_args[0][0], "http://overseer.test/hook")
+        self.assertIn("SCP TRANSFER FAILED", post.call_args[1]["json"]["content"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+
+import unittest
+import os
+import time
+import tempfile
+import datetime
+import threading
+import pandas as pd
+from unittest.mock import patch
+from earnings_guard import EarningsCalendar, extract_next_earnings
+
+NOW = datetime.datetime(2026, 3, 2, 9, 30)
+
+class CountingFetcher:
+    def __init__(self, dates):
+        self.dates = dates
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, symbol):
+        with self.lock:
+            self.calls.append(symbol)
+        value = self.dates.get(symbol)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+class TestEarningsGuard(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), "earnings.json")
+        self.fetcher = CountingFetcher({
+            "SOON": datetime.datetime(2026, 3, 3, 16, 0),
+            "TODAY": datetime.date(2026, 3, 2),
+            "LATER": datetime.date(2026, 4, 20),
+            "NODATA": None,
+            "BROKEN": RuntimeError("404"),
+        })
+
+    def calendar(self, **kw):
+        return EarningsCalendar(self.path, fetcher=self.fetcher, skip=lambda s: s == "XLK", **kw)
+
+    def test_is_safe_semantics(self):
+        cal = self.calendar()
+        cal.refresh(["SOON", "TODAY", "LATER", "NODATA", "BROKEN", "XLK"])
+        self.assertFalse(cal.is_safe("SOON", now=NOW))
+        self.assertFalse(cal.is_safe("TODAY", now=NOW))
+        self.assertTrue(cal.is_safe("LATER", now=NOW))
+        self.assertTrue(cal.is_safe("NODATA", now=NOW))     # missing data -> safe
+        self.assertTrue(cal.is_safe("BROKEN", now=NOW))     # fetch error -> safe
+        self.assertTrue(cal.is_safe("UNSEEN", now=NOW))     # never fetched -> safe
+        self.assertNotIn("XLK", self.fetcher.calls)         # ETFs skipped
+
+    def test_refresh_interval_and_persistence(self):
+        cal = self.calendar()
+        cal.refresh(["SOON", "LATER"])
+        cal.save()
+        reloaded = self.calendar()
+        stats = reloaded.refresh(["SOON", "LATER"])
+        self.assertEqual(stats["fetched"], 0)
+        self.assertEqual(len(self.fetcher.calls), 2)
+        self.assertFalse(reloaded.is_safe("SOON", now=NOW))
+
+        later = time.time() + 73 * 3600
+        with patch('earnings_guard.time.time', return_value=later):
+            self.assertEqual(reloaded.refresh(["SOON"])["fetched"], 1)
+
+    def test_errors_retry_sooner(self):
+        cal = self.calendar()
+        cal.refresh(["BROKEN"])
+        self.assertFalse(cal.is_stale("BROKEN", now=time.time() + 3600))
+        self.assertTrue(cal.is_stale("BROKEN", now=time.time() + 7 * 3600))
+
+    def test_extract_shapes(self):
+        frame = pd.DataFrame({0: [pd.Timestamp("2026-03-03 16:00", tz="US/Eastern")]})
+        self.assertEqual(extract_next_earnings(frame), datetime.datetime(2026, 3, 3, 16, 0))
+        self.assertEqual(extract_next_earnings({"Earnings Date": [datetime.date(2026, 3, 4)]}),
+                         datetime.date(2026, 3, 4))
+        self.assertIsNone(extract_next_earnings({}))
+        self.assertIsNone(extract_next_earnings(None))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+
+import unittest
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from http_pool import HttpClient, host_key
+from ollama_stub import OllamaStub
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    failures_left = 0
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        cls = type(self)
+        status = 503 if cls.failures_left > 0 else 200
+        cls.failures_left -= 1
+        body = b'{"ok": true}'
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+class TestHttpPool(unittest.TestCase):
+    def test_keep_alive_reuse(self):
+        client = HttpClient(policies={})
+        with OllamaStub() as stub:
+            for _ in range(5):
+                resp = client.post(stub.url, json={"model": "m", "prompt": "p"})
+                self.assertEqual(resp.status_code, 200)
+            stats = client.stats()[host_key(stub.url)]
+        client.close()
+        self.assertEqual(stats["requests"], 5)
+        self.assertEqual(stats["connections"], 1)
+        self.assertEqual(stats["reused"], 4)
+        self.assertGreater(stats["bytes_in"], 0)
+        self.assertGreater(stats["bytes_out"], 0)
+
+    def test_per_host_retry_policy(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/x"
+        host = host_key(url)
+        try:
+            FlakyHandler.failures_left = 2
+            client = HttpClient(policies={host: {"retries": 3, "backoff": 0}})
+            resp = client.get(url)
+            self.assertEqual(resp.status_code, 200)
+            self.assertEqual(client.stats()[host]["retries"], 2)
+
+            FlakyHandler.failures_left = 1
+            strict = HttpClient(policies={host: {"retries": 0}})
+            self.assertEqual(strict.get(url).status_code, 503)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_policy_defaults(self):
+        client = HttpClient()
+        self.assertEqual(client.policy("localhost:11434")["retries"], 0)
+        self.assertEqual(client.policy("example.com")["timeout"], (5, 15))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+
+import unittest
+import numpy as np
+import pandas as pd
+import indicator_engine
+from market_scanner import TechnicalMath, analyze_technicals
+
+def make_universe(n_symbols=12, days=320, seed=7):
+    # Multi-symbol frame shaped like yf.download(group_by='ticker'), with the
+    # awkward cases: late listings, interior gaps and flat (zero-range) stretches
+    rng = np.random.default_rng(seed)
+    idx = pd.bdate_range("2024-06-03", periods=days)
+    frames = {}
+    for k in range(n_symbols):
+        close = 50 * np.exp(np.cumsum(rng.normal(0.0005, 0.02, days)))
+        high = close * (1 + rng.uniform(0, 0.02, days))
+        low = close * (1 - rng.uniform(0, 0.02, days))
+        df = pd.DataFrame({"Open": close, "High": high, "Low": low, "Close": close,
+                           "Volume": rng.uniform(1e6, 5e6, days)}, index=idx)
+        if k % 3 == 1:
+            df.iloc[:40] = np.nan                      # listed late
+        if k % 4 == 2:
+            df.iloc[100:103] = np.nan                  # missing sessions
+        if k == 5:
+            df.iloc[150:170, :4] = 30.0                # halted / flat
+        frames[f"S{k:02d}"] = df
+    return pd.concat(frames, axis=1)
+
+def reference(data, sym):
+    # The original per-symbol loop from analyze_technicals
+    df = data[sym].copy().dropna()
+    return {
+        "price": float(df['Close'].iloc[-1]),
+        "rsi": float(TechnicalMath.get_rsi(df['Close']).iloc[-1]),
+        "adx": float(TechnicalMath.get_adx(df['High'], df['Low'], df['Close']).iloc[-1]),
+        "atr": float(TechnicalMath.get_atr(df['High'], df['Low'], df['Close']).iloc[-1]),
+        "sma200": float(TechnicalMath.get_sma(df['Close'], 200).iloc[-1]),
+    }
+
+class TestIndicatorParity(unittest.TestCase):
+    def setUp(self):
+        self.data = make_universe()
+        self.symbols = list(self.data.columns.levels[0])
+
+    def test_latest_values_match_technical_math(self):
+        out = indicator_engine.compute_indicators(self.data, self.symbols)
+        self.assertEqual(list(out.index), self.symbols)
+        for sym in self.symbols:
+            ref = reference(self.data, sym)
+            for col, val in ref.items():
+                np.testing.assert_allclose(out.loc[sym, col], val, rtol=1e-9, atol=1e-9,
+                                           err_msg=f"{sym} {col}")
+
+    def test_full_series_match(self):
+        syms, panel = indicator_engine.build_panel(self.data, self.symbols)
+        rsi = indicator_engine.rsi(panel["Close"])
+        adx = indicator_engine.adx(panel["High"], panel["Low"], panel["Close"])
+        for j, sym in enumerate(syms):
+            df = self.data[sym].dropna()
+            n = len(df)
+            np.testing.assert_allclose(rsi[-n:, j], TechnicalMath.get_rsi(df['Close']).to_numpy(),
+                                       rtol=1e-9, atol=1e-9, equal_nan=True)
+            np.testing.assert_allclose(adx[-n:, j],
+                                       TechnicalMath.get_adx(df['High'], df['Low'], df['Close']).to_numpy(),
+                                       rtol=1e-9, atol=1e-9, equal_nan=True)
+
+    def test_wilder_ewm_interior_nan(self):
+        x = np.array([np.nan, 1.0, 2.0, np.nan, np.nan, 5.0, 5.0, np.nan, 3.0])
+        expected = pd.Series(x).ewm(alpha=1/14, adjust=False).mean().to_numpy()
+        got = indicator_engine.wilder_ewm(x[:, None], 14)[:, 0]
+        np.testing.assert_allclose(got, expected, rtol=1e-12, equal_nan=True)
+
+    def test_short_history_is_skipped(self):
+        out = indicator_engine.compute_indicators(self.data.iloc[:150], self.symbols)
+        self.assertTrue(out.empty)
+
+    def test_analyze_technicals_uses_engine(self):
+        class PanelStore:
+            def __init__(self, data): self.data = data
+            def update(self, symbols, **kw): return {"delta": 0, "full": 0, "bars": 0}
+            def panel(self, symbols): return self.data
+
+        results = analyze_technicals(self.symbols, store=PanelStore(self.data))
+        self.assertTrue(results)
+        for item in results:
+            ref = reference(self.data, item["symbol"])
+            self.assertIn(item["type"], ["trend_targets", "survivor_targets", "wheel_targets",
+                                         "condor_targets", "short_targets"])
+            if item["type"] in ("trend_targets", "short_targets"):
+                self.assertAlmostEqual(item["score"], ref["adx"], places=9)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+from unittest.mock import patch
+import market_scanner
+from indicator_state import IndicatorState, SymbolState, completed_through
+from test_indicator_engine_logic import make_universe, reference
+
+class FakeStore:
+    def __init__(self, data):
+        self.data = data
+
+    def frame(self, sym):
+        return self.data[sym] if sym in self.data.columns.levels[0] else None
+
+    def update(self, symbols, **kwargs):
+        return {"delta": 0, "full": 0, "bars": 0}
+
+    def panel(self, symbols):
+        return self.data
+
+class TestIndicatorState(unittest.TestCase):
+    def setUp(self):
+        self.data = make_universe()
+        self.symbols = list(self.data.columns.levels[0])
+        self.path = os.path.join(tempfile.mkdtemp(), "state.json")
+
+    def assertMatches(self, values, ref, sym):
+        for col, val in ref.items():
+            np.testing.assert_allclose(values[col], val, rtol=1e-9, atol=1e-9, err_msg=f"{sym} {col}")
+
+    def test_rebuild_matches_technical_math(self):
+        for sym in self.symbols:
+            self.assertMatches(SymbolState.rebuild(self.data[sym]).values(), reference(self.data, sym), sym)
+
+    def test_incremental_days_match_rebuild(self):
+        # Build on the first 260 sessions, then feed the rest one day at a time,
+        # persisting in between like separate daily runs
+        dates = self.data.index
+        state = IndicatorState(self.path)
+        state.sync(FakeStore(self.data.iloc[:260]), self.symbols, through="2099-01-01")
+        state.save()
+        for i in range(260, len(dates)):
+            state = IndicatorState(self.path)
+            stats = state.sync(FakeStore(self.data.iloc[:i + 1]), self.symbols, through="2099-01-01")
+            self.assertLessEqual(stats["bars"], len(self.symbols))
+            state.save()
+        out = state.indicators(self.symbols)
+        for sym in self.symbols:
+            self.assertMatches(out.loc[sym], reference(self.data, sym), sym)
+
+    def test_partial_bar_is_previewed_not_committed(self):
+        state = IndicatorState(None)
+        last = self.data.index[-1].strftime("%Y-%m-%d")
+        prev = self.data.index[-2].strftime("%Y-%m-%d")
+        stats = state.sync(FakeStore(self.data), ["S00"], through=prev)
+        self.assertEqual(stats["previewed"], 1)
+        self.assertEqual(state.states["S00"].last_date, prev)
+        self.assertMatches(state.indicators(["S00"]).loc["S00"], reference(self.data, "S00"), "S00")
+
+        # Re-applying after the close commits the same bar exactly once
+        state.sync(FakeStore(self.data), ["S00"], through=last)
+        self.assertEqual(state.states["S00"].last_date, last)
+        self.assertEqual(state.states["S00"].bars, len(self.data["S00"].dropna()))
+
+    def test_rescaled_history_rebuilds_state(self):
+        state = IndicatorState(None)
+        state.sync(FakeStore(self.data.iloc[:-5]), ["S00"], through="2099-01-01")
+
+        # A 4:1 split re-adjusts the whole stored history under the existing carries
+        adjusted = self.data.copy()
+        for field in ("Open", "High", "Low", "Close"):
+            adjusted[("S00", field)] = adjusted[("S00", field)] / 4
+        stats = state.sync(FakeStore(adjusted), ["S00"], through="2099-01-01")
+        self.assertEqual(stats["rebuilt"], 1)
+        self.assertMatches(state.indicators(["S00"]).loc["S00"], reference(adjusted, "S00"), "S00")
+
+        stats = state.sync(FakeStore(adjusted), ["S00"], through="2099-01-01")
+        self.assertEqual((stats["rebuilt"], stats["bars"]), (0, 0))
+
+    def test_analyze_technicals_same_candidates(self):
+        store = FakeStore(self.data)
+        state = IndicatorState(None)
+        with patch('indicator_state.completed_through', return_value="2099-01-01"):
+            via_state = market_scanner.analyze_technicals(self.symbols, store=store, state=state)
+        self.assertEqual(via_state, market_scanner.analyze_technicals(self.symbols, store=store))
+
+    def test_completed_through(self):
+        morning = pd.Timestamp("2025-03-12 10:30").to_pydatetime()
+        evening = pd.Timestamp("2025-03-12 16:05").to_pydatetime()
+        self.assertEqual(completed_through(morning), "2025-03-11")
+        self.assertEqual(completed_through(evening), "2025-03-12")
+
+if __name__ == '__main__':
+    unittest.main()
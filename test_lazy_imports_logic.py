@@ -0,0 +1,89 @@
+import unittest
+import sys
+from unittest.mock import patch
+from lazy_imports import LazyModule, lazy_import
+from bench_imports import probe
+
+class TestLazyModule(unittest.TestCase):
+    def setUp(self):
+        # A throwaway module only importable through the finder below
+        self.name = "_lazy_probe_mod"
+        self.imports = 0
+        test = self
+
+        class Finder:
+            def find_spec(self, fullname, path=None, target=None):
+                if fullname != test.name:
+                    return None
+                import importlib.util
+                return importlib.util.spec_from_loader(fullname, self)
+            def create_module(self, spec):
+                return None
+            def exec_module(self, module):
+                test.imports += 1
+                module.VALUE = 42
+                module.double = lambda x: x * 2
+
+        self.finder = Finder()
+        sys.meta_path.insert(0, self.finder)
+
+    def tearDown(self):
+        sys.meta_path.remove(self.finder)
+        sys.modules.pop(self.name, None)
+
+    def test_import_deferred_until_first_use(self):
+        mod = lazy_import(self.name)
+        self.assertIsInstance(mod, LazyModule)
+        self.assertEqual(self.imports, 0)
+        self.assertNotIn(self.name, sys.modules)
+        self.assertEqual(mod.double(mod.VALUE), 84)
+        self.assertEqual(self.imports, 1)
+        self.assertIn("loaded", repr(mod))
+
+    def test_already_imported_module_returned_as_is(self):
+        self.assertIs(lazy_import("json"), sys.modules["json"])
+
+    def test_patch_through_proxy_reaches_real_module(self):
+        mod = lazy_import(self.name)
+        with patch.object(mod, "VALUE", 7):
+            self.assertEqual(sys.modules[self.name].VALUE, 7)
+            self.assertEqual(mod.VALUE, 7)
+        self.assertEqual(mod.VALUE, 42)
+
+    def test_missing_attribute_raises(self):
+        mod = lazy_import(self.name)
+        with self.assertRaises(AttributeError):
+            mod.nope
+
+class TestEntryPointsStayLight(unittest.TestCase):
+    def test_gatekeeper_runs_without_heavy_imports(self):
+        r = probe("import market_scanner\nmarket_scanner.is_mission_time()")
+        self.assertEqual(r["loaded"], [])
+
+    def test_staleness_check_runs_without_heavy_imports(self):
+        r = probe("import sector_scout_3\nsector_scout_3.get_candidates()")
+        self.assertEqual(r["loaded"], [])
+
+    def test_bad_config_fails_before_any_work(self):
+        import sector_scout_3
+        with patch.object(sector_scout_3, "config", lazy_import("_no_such_config_mod")), \
+             patch.object(sector_scout_3, "WEBHOOK_OVERSEER", sector_scout_3._FROM_CONFIG), \
+             patch.object(sector_scout_3, "USE_VERDICT_CACHE", False), \
+             patch.object(sector_scout_3, "get_candidates", return_value={"trend_targets": [{"symbol": "AAPL", "score": 50}]}), \
+             patch.object(sector_scout_3, "gather_intel") as gather:
+            with self.assertRaises(ModuleNotFoundError):
+                sector_scout_3.run_scout()
+        gather.assert_not_called()
+
+    def test_lazy_exports_still_resolve(self):
+        import market_scanner
+        from bar_store import BarStore
+        from indicator_engine import TECH_THRESHOLDS
+        self.assertIs(market_scanner.BarStore, BarStore)
+        self.assertIs(market_scanner.TECH_THRESHOLDS, TECH_THRESHOLDS)
+        with self.assertRaises(AttributeError):
+            market_scanner.not_a_thing
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+import os
+import json
+import tempfile
+import pandas as pd
+import market_scanner
+from indicator_state import IndicatorState, SymbolState
+from live_scanner import LiveScanner, ReplaySource
+from test_indicator_engine_logic import make_universe
+
+class FakeStore:
+    def __init__(self, data):
+        self.data = data
+
+    def frame(self, sym):
+        return self.data[sym]
+
+def minute_bars(sym, date, high, low, close, n=4):
+    # Splits one daily bar into n minute bars whose aggregate is that bar
+    bars = []
+    for i in range(n):
+        c = close if i == n - 1 else (high + low) / 2
+        bars.append({"symbol": sym, "t": f"{date}T{14 + i}:30:00+00:00", "o": c,
+                     "h": high if i == 1 else c, "l": low if i == 2 else c, "c": c, "v": 1000})
+    return bars
+
+class TestLiveScanner(unittest.TestCase):
+    def setUp(self):
+        self.data = make_universe()
+        self.symbols = list(self.data.columns.levels[0])
+        self.history = self.data.iloc[:-1]
+        self.state = IndicatorState(None)
+        self.state.sync(FakeStore(self.history), self.symbols, through="2099-01-01")
+        self.out = os.path.join(tempfile.mkdtemp(), "dragnet_candidates.json")
+        self.scanner = LiveScanner(self.state, self.symbols, output_file=self.out)
+        self.scanner.seed(FakeStore(self.history), through="2099-01-01")
+        self.scanner.emit(force=True)
+
+    def test_only_streamed_symbols_are_reclassified(self):
+        before = self.scanner.stats["reclassified"]
+        day = self.data.index[-1].strftime("%Y-%m-%d")
+        row = self.data["S00"].iloc[-1]
+        for bar in minute_bars("S00", day, row["High"], row["Low"], row["Close"]):
+            self.scanner.on_bar(bar)
+        self.assertLessEqual(self.scanner.stats["reclassified"] - before, 4)
+        self.assertEqual(set(self.scanner.session), {"S00"})
+
+        # The aggregated session previews exactly like the full daily history
+        expected = SymbolState.rebuild(self.data["S00"]).values()
+        price, rsi, adx, sma200 = self.scanner.inputs["S00"]
+        self.assertAlmostEqual(rsi, expected["rsi"], places=9)
+        self.assertAlmostEqual(adx, expected["adx"], places=9)
+        self.assertEqual(self.scanner.items["S00"],
+                         market_scanner.classify_technicals("S00", price, rsi, adx, sma200))
+
+    def test_unchanged_inputs_skip_reclassification(self):
+        day = self.data.index[-1].strftime("%Y-%m-%d")
+        bar = {"symbol": "S01", "t": f"{day}T15:00:00+00:00", "o": 50, "h": 51, "l": 49, "c": 50, "v": 10}
+        self.assertTrue(self.scanner.on_bar(bar))
+        self.assertFalse(self.scanner.on_bar(dict(bar)))
+        self.assertFalse(self.scanner.on_bar({**bar, "symbol": "NOPE"}))
+
+    def test_emit_only_on_membership_change(self):
+        self.assertFalse(self.scanner.emit())
+        with open(self.out) as f:
+            current = json.load(f)
+        # Push a shortlisted name far below its SMA so it must change lists
+        listed = next(e["symbol"] for c, v in current.items() if c != "short_targets" for e in v)
+        day = self.data.index[-1].strftime("%Y-%m-%d")
+        crash = {"symbol": listed, "t": f"{day}T15:00:00+00:00", "o": 1.0, "h": 1.0, "l": 1.0, "c": 1.0, "v": 1}
+        writes = self.scanner.stats["writes"]
+        self.scanner.run([crash, None, dict(crash)])
+        self.assertEqual(self.scanner.stats["writes"], writes + 1)
+        with open(self.out) as f:
+            after = json.load(f)
+        self.assertNotEqual(after, current)
+
+    def test_new_session_commits_previous(self):
+        day = self.data.index[-1].strftime("%Y-%m-%d")
+        row = self.data["S00"].iloc[-1]
+        path = os.path.join(tempfile.mkdtemp(), "bars.jsonl")
+        with open(path, 'w') as f:
+            for bar in minute_bars("S00", day, row["High"], row["Low"], row["Close"]):
+                f.write(json.dumps(bar) + "\n")
+            f.write(json.dumps({"symbol": "S00", "t": "2099-01-02T15:00:00+00:00",
+                                "o": 10, "h": 10, "l": 10, "c": 10, "v": 1}) + "\n")
+        self.scanner.run(ReplaySource(path))
+        self.assertEqual(self.scanner.stats["committed"], 1)
+        self.assertEqual(self.state.states["S00"].last_date, day)
+        self.assertAlmostEqual(self.state.states["S00"].values()["rsi"],
+                               SymbolState.rebuild(self.data["S00"]).values()["rsi"], places=9)
+
+if __name__ == '__main__':
+    unittest.main()
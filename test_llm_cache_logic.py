@@ -0,0 +1,87 @@
+
+import unittest
+from unittest.mock import patch, MagicMock
+import json
+import os
+import time
+import tempfile
+import sector_scout_3
+from llm_cache import VerdictCache, verdict_key
+
+REASON = "Guidance raised and analysts lifted targets after the quarter."
+
+class TestVerdictCache(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), "cache.json")
+
+    def test_key_normalizes_content(self):
+        a = verdict_key("llama3.1", "trend_targets", "tier1_news", "- [Reuters] NVDA  beats\n")
+        b = verdict_key("llama3.1", "trend_targets", "tier1_news", "- [reuters] nvda beats")
+        c = verdict_key("llama3.1", "short_targets", "tier1_news", "- [Reuters] NVDA beats")
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, c)
+
+    def test_ttl_expiry(self):
+        cache = VerdictCache(self.path, ttl_hours=1)
+        with patch('llm_cache.time.time', return_value=1000.0):
+            cache.put("k", 0.7, REASON)
+        with patch('llm_cache.time.time', return_value=1000.0 + 1800):
+            self.assertEqual(cache.get("k"), (0.7, REASON))
+        with patch('llm_cache.time.time', return_value=1000.0 + 3601):
+            self.assertIsNone(cache.get("k"))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_lru_eviction(self):
+        cache = VerdictCache(self.path, max_entries=2)
+        cache.put("a", 0.1, REASON)
+        cache.put("b", 0.2, REASON)
+        cache.get("a")                  # b is now least recently used
+        cache.put("c", 0.3, REASON)
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertEqual(cache.evictions, 1)
+
+    def test_persistence(self):
+        cache = VerdictCache(self.path)
+        cache.put("k", 0.42, REASON)
+        cache.save()
+        self.assertEqual(VerdictCache(self.path).get("k"), (0.42, REASON))
+
+    def test_malformed_rows_are_skipped(self):
+        now = time.time()
+        with open(self.path, 'w') as f:
+            json.dump({"version": 1, "entries": [
+                ["good", 0.42, REASON, now], ["short", 0.5], ["stamp", 0.5, REASON, "yesterday"],
+                None, ["", "x", REASON, now],
+            ]}, f)
+        cache = VerdictCache(self.path)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get("good"), (0.42, REASON))
+
+        with open(self.path, 'w') as f:
+            json.dump({"version": 1, "entries": 7}, f)
+        self.assertEqual(len(VerdictCache(self.path)), 0)
+
+    @patch('sector_scout_3.HTTP.post')
+    def test_ask_llama_skips_inference_on_hit(self, mock_post):
+        mock_response = MagicMock()
+        mock_response.json.return_value = {'response': json.dumps({"score": 0.8, "reason": REASON})}
+        mock_post.return_value = mock_response
+        with patch.object(sector_scout_3, "verdict_cache", VerdictCache(self.path)):
+            first = sector_scout_3.ask_llama("NVDA", "trend_targets", "- [Reuters] NVDA beats", "tier1_news")
+            second = sector_scout_3.ask_llama("NVDA", "trend_targets", "- [Reuters] NVDA beats", "tier1_news")
+            self.assertEqual(sector_scout_3.verdict_cache.hits, 1)
+        self.assertEqual(first, second)
+        self.assertEqual(mock_post.call_count, 1)
+
+    @patch('sector_scout_3.HTTP.post')
+    def test_failures_are_not_cached(self, mock_post):
+        mock_response = MagicMock()
+        mock_response.json.return_value = {'response': 'I cannot do that.'}
+        mock_post.return_value = mock_response
+        with patch.object(sector_scout_3, "verdict_cache", VerdictCache(self.path)):
+            sector_scout_3.ask_llama("NVDA", "trend_targets", "- [Reuters] NVDA beats", "tier1_news")
+            self.assertEqual(len(sector_scout_3.verdict_cache), 0)
+
+if __name__ == '__main__':
+    unittest.main()
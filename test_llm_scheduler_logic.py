@@ -0,0 +1,78 @@
+import os
+import unittest
+import tempfile
+import threading
+from unittest.mock import patch
+import sector_scout_3
+from llm_cache import VerdictCache, verdict_key
+from llm_scheduler import LlmScheduler, job_weight
+
+REASON = "Guidance raised and analysts lifted targets after the quarter."
+
+class TestLlmScheduler(unittest.TestCase):
+    def test_heaviest_job_runs_first(self):
+        gate = threading.Event()
+        order = []
+        sched = LlmScheduler(parallel=1)
+        blocker = sched.submit(1.0, gate.wait)   # Occupies the only worker while the queue fills
+        futures = [
+            sched.submit(job_weight(cat, tier), order.append, f"{cat}/{tier}")
+            for cat, tier in [("condor_targets", "social"), ("trend_targets", "tier1_news"),
+                              ("wheel_targets", "tier2_news"), ("trend_targets", "social")]
+        ]
+        gate.set()
+        blocker.result(timeout=5)
+        for f in futures:
+            f.result(timeout=5)
+        sched.shutdown()
+        self.assertEqual(order, ["trend_targets/tier1_news", "wheel_targets/tier2_news",
+                                 "trend_targets/social", "condor_targets/social"])
+
+    def test_light_jobs_skipped_after_deadline(self):
+        sched = LlmScheduler(parallel=2, deadline=-1, skip_below=0.08)   # Already past it
+        heavy = sched.submit(job_weight("trend_targets", "tier1_news"), lambda: (0.9, REASON))
+        light = sched.submit(job_weight("condor_targets", "social"), lambda: (0.9, REASON))
+        self.assertEqual(heavy.result(timeout=5), (0.9, REASON))
+        self.assertIsNone(light.result(timeout=5))
+        sched.shutdown()
+        self.assertEqual((sched.ran, sched.skipped), (1, 1))
+
+    def test_errors_land_on_the_future(self):
+        sched = LlmScheduler(parallel=1)
+        f = sched.submit(0.3, lambda: 1 / 0)
+        with self.assertRaises(ZeroDivisionError):
+            f.result(timeout=5)
+        sched.shutdown()
+
+    def test_cached_light_job_bypasses_queue_and_deadline(self):
+        cache = VerdictCache(os.path.join(tempfile.mkdtemp(), "verdicts.json"))
+        cache.put(verdict_key(sector_scout_3.MODEL_NAME, "condor_targets", "social", "- [r/x] ON"), 0.7, REASON)
+        sched = LlmScheduler(parallel=1, deadline=-1, skip_below=0.08)
+        with patch.object(sector_scout_3, "verdict_cache", cache), \
+             patch.object(sector_scout_3, "ask_llama") as ask:
+            hit = sector_scout_3.queue_llm_job(sched, "ON", "condor_targets", "social", "- [r/x] ON")
+            miss = sector_scout_3.queue_llm_job(sched, "ON", "condor_targets", "social", "- [r/x] other")
+            self.assertTrue(hit.done())
+            self.assertEqual(hit.result(), (0.7, REASON))
+            self.assertIsNone(miss.result(timeout=5))   # Uncached and light: still skipped
+        sched.shutdown()
+        ask.assert_not_called()
+        self.assertEqual((sched.ran, sched.skipped), (0, 1))
+
+
+class TestSkippedVerdicts(unittest.TestCase):
+    def test_skipped_weight_goes_to_technicals(self):
+        news_map = {"tier1": ["- [Reuters] Apple beats"], "tier2": [], "tier3": []}
+        scored = sector_scout_3.score_candidate(
+            "AAPL", "trend_targets", 80.0, news_map, "- [r/stocks] AAPL calls (40 pts)",
+            verdicts={"tier1_news": (0.9, REASON), "social": None})
+        missing = sector_scout_3.score_candidate(
+            "AAPL", "trend_targets", 80.0, news_map, None,
+            verdicts={"tier1_news": (0.9, REASON)})
+        self.assertIn("Soc: Skip", scored[0])
+        self.assertIn("Soc: N/A", missing[0])
+        self.assertEqual(scored[1], missing[1])   # Same confidence and reason
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+from unittest.mock import patch
+import json
+import time
+import sector_scout_3
+from http_pool import HttpClient
+from llm_stream import JsonObjectScanner, first_json_object, stream_generate, StreamMeter
+from ollama_stub import OllamaStub
+
+REASON = "Guidance raised and analysts lifted targets after the quarter."
+VERDICT = json.dumps({"score": 0.8, "reason": REASON})
+CHATTY = VERDICT + "\n\nLet me know if you'd like a deeper breakdown of the {risks} involved." * 5
+
+def fixed(text):
+    return lambda prompt: (text, 1)
+
+class TestJsonObjectScanner(unittest.TestCase):
+    def test_closes_on_first_object_fed_in_pieces(self):
+        scanner = JsonObjectScanner()
+        text = 'Sure! ' + VERDICT + ' and {"more": 1}'
+        out = None
+        for i in range(0, len(text), 3):
+            out = scanner.feed(text[i:i + 3])
+            if out is not None:
+                break
+        self.assertEqual(out, VERDICT)
+
+    def test_braces_and_escaped_quotes_inside_strings(self):
+        obj = {"score": 0.4, "reason": 'Said "guidance {cut}" then \\ nothing }'}
+        raw = json.dumps(obj)
+        scanner = JsonObjectScanner()
+        for ch in raw[:-1]:
+            self.assertIsNone(scanner.feed(ch))
+        self.assertEqual(json.loads(scanner.feed(raw[-1])), obj)
+
+    def test_non_greedy_unlike_regex(self):
+        text = VERDICT + " trailing {not json}"
+        self.assertEqual(first_json_object(text), VERDICT)
+        self.assertIsNone(first_json_object("no object {here"))
+
+
+class TestStreamGenerate(unittest.TestCase):
+    def test_early_termination_on_chatty_reply(self):
+        with OllamaStub(responder=fixed(CHATTY), token_latency=0.01) as stub:
+            t0 = time.perf_counter()
+            text, stats = stream_generate(HttpClient(), stub.url, {"model": "m", "prompt": "p"})
+            elapsed = time.perf_counter() - t0
+        self.assertEqual(json.loads(text), {"score": 0.8, "reason": REASON})
+        self.assertTrue(stats["early_stop"])
+        self.assertFalse(stats["budget_stop"])
+        self.assertIsNotNone(stats["ttft_s"])
+        full_tokens = -(-len(CHATTY) // 4)
+        self.assertLess(stats["tokens"], full_tokens)
+        self.assertLess(elapsed, full_tokens * 0.01)   # Did not wait for the whole reply
+
+    def test_token_budget_sent_and_enforced(self):
+        with OllamaStub(responder=fixed('{"score": 0.8, "reason": "' + "x" * 400 + '"}')) as stub:
+            text, stats = stream_generate(HttpClient(), stub.url, {"model": "m", "prompt": "p"},
+                                          token_budget=10)
+        self.assertEqual(stats["tokens"], 10)
+        self.assertIsNone(first_json_object(text))
+
+    def test_meter_summary(self):
+        meter = StreamMeter()
+        self.assertEqual(meter.summary(), "no streamed calls")
+        meter.record({"ttft_s": 0.5, "tokens": 20, "gen_s": 2.0, "early_stop": True, "budget_stop": False})
+        self.assertIn("TTFT avg 0.50s", meter.summary())
+        self.assertIn("10.0 tok/s", meter.summary())
+
+
+class TestAskLlamaStreaming(unittest.TestCase):
+    def test_streamed_verdict_matches_blocking(self):
+        with OllamaStub(responder=fixed(CHATTY)) as stub, \
+             patch.object(sector_scout_3, "OLLAMA_URL", stub.url), \
+             patch.object(sector_scout_3, "verdict_cache", None):
+            with patch.object(sector_scout_3, "OLLAMA_STREAM", False):
+                blocking = sector_scout_3.ask_llama("AAPL", "trend_targets", "- [Reuters] Apple beats")
+            with patch.object(sector_scout_3, "OLLAMA_STREAM", True), \
+                 patch.object(sector_scout_3, "STREAM_METER", StreamMeter()) as meter:
+                streamed = sector_scout_3.ask_llama("AAPL", "trend_targets", "- [Reuters] Apple beats")
+        self.assertEqual(blocking, (0.8, REASON))
+        self.assertEqual(streamed, blocking)
+        self.assertEqual(meter.calls, 1)
+        self.assertEqual(meter.early_stops, 1)
+
+    def test_blocking_path_sends_no_token_budget(self):
+        long_reason = "x" * 2000   # Well past LLM_TOKEN_BUDGET tokens
+        with patch.object(sector_scout_3, "OLLAMA_STREAM", False), \
+             patch.object(sector_scout_3, "verdict_cache", None), \
+             patch.object(sector_scout_3.HTTP, "post") as post:
+            post.return_value.json.return_value = {"response": json.dumps({"score": 0.8, "reason": long_reason})}
+            verdict = sector_scout_3.ask_llama("AAPL", "trend_targets", "- [Reuters] Apple beats")
+        self.assertNotIn("num_predict", post.call_args.kwargs["json"].get("options") or {})
+        self.assertEqual(verdict, (0.8, long_reason))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import time
+import sector_scout_3
+from news_index import PublisherTiers, HeadlineIndex, normalize_title, title_key
+
+PUBLISHERS = [
+    "Reuters", "Thomson Reuters", "Bloomberg", "Bloomberg Opinion", "CNBC", "WSJ", "Financial Times",
+    "MarketWatch", "Barron's", "Yahoo Finance Video", "Forbes", "Fortune", "Reuters via Yahoo Finance",
+    "Benzinga", "Seeking Alpha", "Unknown", "", "reuters", "Zacks",
+]
+
+def old_tier(publisher):
+    if any(src in publisher for src in sector_scout_3.TIER_1_ELITE):
+        return 0
+    if any(src in publisher for src in sector_scout_3.TIER_2_MAINSTREAM):
+        return 1
+    return 2
+
+def ticker_with(items):
+    now = time.time()
+    stock = MagicMock()
+    stock.news = [{"title": t, "publisher": p, "providerPublishTime": now - 3600 * i}
+                  for i, (p, t) in enumerate(items)]
+    return stock
+
+class TestPublisherTiers(unittest.TestCase):
+    def test_matches_substring_scan(self):
+        tiers = PublisherTiers([sector_scout_3.TIER_1_ELITE, sector_scout_3.TIER_2_MAINSTREAM], aliases={})
+        for publisher in PUBLISHERS:
+            self.assertEqual(tiers.tier_of(publisher), old_tier(publisher), publisher)
+
+    def test_aliases(self):
+        tiers = sector_scout_3.PUBLISHER_TIERS
+        self.assertEqual(tiers.tier_of("The Wall Street Journal"), 0)
+        self.assertEqual(tiers.tier_of("Motley Fool"), 1)
+        self.assertEqual(tiers.tier_of("Zacks"), 2)
+
+
+class TestHeadlineDedup(unittest.TestCase):
+    def test_normalized_titles(self):
+        self.assertEqual(normalize_title("Apple beats estimates - Reuters"), "apple beats estimates")
+        self.assertEqual(title_key("Apple Beats Estimates!"), title_key("apple beats estimates - Reuters"))
+        self.assertNotEqual(title_key("Apple beats estimates"), title_key("Apple misses estimates"))
+        self.assertIsNone(title_key("  -- "))
+
+    def test_syndicated_copy_kept_once_in_best_tier(self):
+        stock = ticker_with([
+            ("Yahoo Finance", "Apple beats estimates as iPhone demand holds"),
+            ("Reuters", "Apple beats estimates as iPhone demand holds - Reuters"),
+            ("Benzinga", "Apple unusual options activity"),
+        ])
+        with patch.object(sector_scout_3.yf, "Ticker", return_value=stock), \
+             patch.object(sector_scout_3, "headline_index", HeadlineIndex()) as index:
+            news = sector_scout_3.get_tiered_news("AAPL")
+        self.assertEqual(news["tier1"], ["- [Reuters] Apple beats estimates as iPhone demand holds - Reuters"])
+        self.assertEqual(news["tier2"], [])
+        self.assertEqual(news["tier3"], ["- [Benzinga] Apple unusual options activity"])
+        self.assertEqual(index.dropped, 1)
+
+    def test_copies_across_tickers_share_text(self):
+        story = "Chipmakers rally as export curbs ease"
+        with patch.object(sector_scout_3, "headline_index", HeadlineIndex()) as index:
+            with patch.object(sector_scout_3.yf, "Ticker", return_value=ticker_with([("Reuters", story)])):
+                nvda = sector_scout_3.get_tiered_news("NVDA")
+            with patch.object(sector_scout_3.yf, "Ticker", return_value=ticker_with([("Reuters", story + " - Reuters")])):
+                amd = sector_scout_3.get_tiered_news("AMD")
+        self.assertEqual(nvda["tier1"], amd["tier1"])
+        self.assertEqual(index.rewritten, 1)
+
+    def test_shared_text_never_crosses_tiers(self):
+        story = "Nvidia beats estimates"
+        with patch.object(sector_scout_3, "headline_index", HeadlineIndex()), \
+             patch.object(sector_scout_3, "news_store", None):
+            with patch.object(sector_scout_3.yf, "Ticker", return_value=ticker_with([("Benzinga", story)])):
+                first = sector_scout_3.get_tiered_news("NVDA")
+            with patch.object(sector_scout_3.yf, "Ticker", return_value=ticker_with([("Reuters", story)])):
+                second = sector_scout_3.get_tiered_news("AMD")
+        self.assertEqual(first["tier3"], ["- [Benzinga] Nvidia beats estimates"])
+        self.assertEqual(second["tier1"], ["- [Reuters] Nvidia beats estimates"])
+
+
+if __name__ == '__main__':
+    unittest.main()
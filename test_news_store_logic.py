@@ -0,0 +1,89 @@
+import unittest
+from unittest.mock import patch
+import time
+import bench_fixtures
+import sector_scout_3
+from news_store import NewsStore, parse_news_item, canonical_url
+
+NOW = 1_760_000_000
+
+def item(uuid, title, hours_old, related=(), publisher="Reuters"):
+    return {"uuid": uuid, "title": title, "publisher": publisher, "link": f"https://x.com/{uuid}?src=yf",
+            "providerPublishTime": NOW - hours_old * 3600, "relatedTickers": list(related)}
+
+MACRO = item("macro-1", "Fed holds rates steady", 2, ["SPY", "QQQ", "AAPL"])
+FEEDS = {
+    "AAPL": [MACRO, item("aapl-1", "Apple beats", 5, ["AAPL"])],
+    "MSFT": [MACRO, item("msft-1", "Microsoft cloud grows", 30, ["MSFT"], "Forbes")],
+    "OLD": [item("old-1", "Ancient story", 200, ["OLD"])],
+}
+
+class FeedTicker:
+    calls = []
+    def __init__(self, symbol):
+        self.symbol = symbol
+    @property
+    def news(self):
+        FeedTicker.calls.append(self.symbol)
+        return FEEDS.get(self.symbol, [])
+
+class TestNewsStore(unittest.TestCase):
+    def setUp(self):
+        FeedTicker.calls = []
+
+    def test_parse_both_shapes(self):
+        for shape in ("old", "content"):
+            raw = bench_fixtures.news_payload("ACME", shape)
+            parsed = [parse_news_item(n) for n in raw]
+            self.assertTrue(all(p is None or "ACME" in p["tickers"] for p in parsed))
+            self.assertEqual(len({p["id"] for p in parsed if p}), len([p for p in parsed if p]))
+        self.assertIsNone(parse_news_item(item("x", "Stale", 169), now=NOW))
+        no_id = dict(item("", "No id", 1), uuid=None)
+        self.assertEqual(parse_news_item(no_id, now=NOW)["id"], "https://x.com")
+
+    def test_canonical_url(self):
+        self.assertEqual(canonical_url("HTTPS://Finance.Yahoo.com/news/a.html?.tsrc=rss#top"),
+                         "https://finance.yahoo.com/news/a.html")
+
+    def test_shared_article_parsed_once(self):
+        store = NewsStore(ticker_factory=FeedTicker)
+        for sym in ("AAPL", "MSFT", "OLD"):
+            store.ingest(sym, FEEDS[sym], now=NOW)
+        self.assertEqual(store.parsed, 3)     # macro + two company stories; OLD is past the window
+        self.assertEqual(store.reused, 1)
+        self.assertEqual(store.shared(), 1)
+        self.assertIs(store.articles_for("AAPL", now=NOW)[0], store.articles_for("MSFT", now=NOW)[0])
+        self.assertEqual([a["id"] for a in store.articles_for("QQQ", include_mentions=True, now=NOW)], ["macro-1"])
+        self.assertEqual(store.articles_for("QQQ", now=NOW), [])
+
+    def test_eviction_bounds_memory(self):
+        store = NewsStore(ticker_factory=FeedTicker)
+        store.ingest("MSFT", FEEDS["MSFT"], now=NOW)
+        self.assertEqual(store.evict(now=NOW + 150 * 3600), 1)   # msft-1 crosses 168h first
+        self.assertEqual(list(store.articles), ["macro-1"])
+        self.assertEqual(store.feeds["MSFT"], ["macro-1"])
+        self.assertNotIn("MSFT", store.mentions)
+
+    def test_fetch_is_once_per_ticker(self):
+        store = NewsStore(ticker_factory=FeedTicker)
+        with patch("news_store.time.time", return_value=NOW):
+            self.assertEqual(store.fetch(["AAPL", "MSFT", "AAPL"], workers=4), 2)
+            self.assertEqual(store.fetch(["AAPL", "OLD"]), 1)
+        self.assertEqual(sorted(FeedTicker.calls), ["AAPL", "MSFT", "OLD"])
+
+    def test_tiered_news_same_through_store(self):
+        tickers = ["ACME", "BOLT", "CRUX"]
+        with patch.object(sector_scout_3.yf, "Ticker", bench_fixtures.FakeTicker), \
+             patch.object(sector_scout_3, "headline_index", None):
+            with patch.object(sector_scout_3, "news_store", None):
+                direct = [sector_scout_3.get_tiered_news(t) for t in tickers]
+            store = NewsStore(ticker_factory=bench_fixtures.FakeTicker)
+            store.fetch(tickers)
+            with patch.object(sector_scout_3, "news_store", store):
+                stored = [sector_scout_3.get_tiered_news(t) for t in tickers]
+        self.assertEqual(stored, direct)
+        self.assertTrue(any(n["tier1"] for n in direct))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+import os
+import csv
+import tempfile
+import numpy as np
+import backtest
+import param_sweep
+from indicator_engine import TECH_THRESHOLDS
+from test_indicator_engine_logic import make_universe
+
+BASE = {"min_volume": 1_500_000, "min_price": 15.0, "max_price": 500.0, **TECH_THRESHOLDS}
+
+class TestParamSweep(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.data = make_universe(n_symbols=20, days=300, seed=5)
+
+    def test_grid_and_random_search(self):
+        grid = {**{k: [v] for k, v in BASE.items()}, "trend_rsi_min": [55, 80], "min_price": [15.0, 600.0]}
+        sets = list(param_sweep.grid_search(grid))
+        self.assertEqual(len(sets), 1)          # Inverted bands are skipped
+        self.assertEqual(sets[0], BASE)
+        sampled = list(param_sweep.random_search(param_sweep.DEFAULT_GRID, 25, seed=3))
+        self.assertEqual(len(sampled), 25)
+        self.assertEqual(len({tuple(p.values()) for p in sampled}), 25)
+        self.assertTrue(all(param_sweep.is_valid(p) for p in sampled))
+
+    def test_liquidity_axes_never_looser_than_live(self):
+        grid = {"min_volume": [1_000_000, 1_500_000, 3_000_000], "min_price": [10.0, 15.0, 20.0],
+                "max_price": [500.0, 1000.0], "trend_adx_min": [20, 25]}
+        tight = param_sweep.tighten_liquidity(grid, BASE)
+        self.assertEqual(tight["min_volume"], [1_500_000, 3_000_000])
+        self.assertEqual(tight["min_price"], [15.0, 20.0])
+        self.assertEqual(tight["max_price"], [500.0])
+        self.assertEqual(tight["trend_adx_min"], [20, 25])
+        self.assertEqual(param_sweep.tighten_liquidity(param_sweep.DEFAULT_GRID, BASE), param_sweep.DEFAULT_GRID)
+
+    def test_evaluate_matches_replay(self):
+        (params, metrics), = param_sweep.sweep(self.data, [BASE], horizon=5, workers=1)
+        picks, _ = backtest.replay(self.data, horizons=(5,),
+                                   liquidity=(BASE["min_volume"], BASE["min_price"], BASE["max_price"]))
+        r = picks["fwd_5"].dropna()
+        direction = np.where(picks.loc[r.index, "category"] == "short_targets", -1.0, 1.0)
+        self.assertEqual(metrics["picks"], len(r))
+        self.assertAlmostEqual(metrics["edge"], float((r * direction).mean()))
+        self.assertAlmostEqual(metrics["hit_rate"], float(((r * direction) > 0).mean()))
+
+    def test_process_pool_matches_inline(self):
+        sets = list(param_sweep.random_search(param_sweep.DEFAULT_GRID, 10, seed=1))
+        inline = param_sweep.sweep(self.data, sets, workers=1)
+        pooled = param_sweep.sweep(self.data, sets, workers=2, batch_size=3)
+        self.assertEqual([p for p, _ in pooled], sets)
+        for (_, a), (_, b) in zip(inline, pooled):
+            np.testing.assert_equal(a, b)
+
+    def test_ranked_table(self):
+        sets = list(param_sweep.random_search(param_sweep.DEFAULT_GRID, 6, seed=2)) + [BASE]
+        ranked = param_sweep.rank(param_sweep.sweep(self.data, sets, workers=1), min_picks=1)
+        path = os.path.join(tempfile.mkdtemp(), "sweep.csv")
+        param_sweep.write_results(ranked, path, baseline=BASE)
+        with open(path) as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual([int(r["rank"]) for r in rows], list(range(1, len(sets) + 1)))
+        edges = [float(r["edge"]) for r in rows if int(r["picks"]) >= 1]
+        self.assertEqual(edges, sorted(edges, reverse=True))
+        self.assertEqual(sum(int(r["baseline"]) for r in rows), 1)
+
+if __name__ == '__main__':
+    unittest.main()
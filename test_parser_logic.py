@@ -5,7 +5,7 @@ import json
 import sector_scout_3
 
 class TestParser(unittest.TestCase):
-    @patch('requests.post')
+    @patch('sector_scout_3.HTTP.post')
     def test_clean_json(self, mock_post):
         # Setup: Clean JSON response
         mock_response = MagicMock()
@@ -18,7 +18,7 @@ class TestParser(unittest.TestCase):
         self.assertEqual(score, 0.9)
         self.assertEqual(reason, "Good")
 
-    @patch('requests.post')
+    @patch('sector_scout_3.HTTP.post')
     def test_chatty_json(self, mock_post):
         # Setup: Chatty JSON response (markdown, extra text)
         chatty_text = """
@@ -39,7 +39,7 @@ class TestParser(unittest.TestCase):
         self.assertEqual(score, 0.4)
         self.assertEqual(reason, "Bad")
 
-    @patch('requests.post')
+    @patch('sector_scout_3.HTTP.post')
     def test_broken_json(self, mock_post):
         # Setup: Totally broken
         mock_response = MagicMock()
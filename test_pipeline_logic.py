@@ -0,0 +1,95 @@
+
+import unittest
+from unittest.mock import patch
+import json
+import os
+import random
+import tempfile
+import time
+import sector_scout_3
+
+CANDIDATES = {
+    "trend_targets": [{"symbol": f"TR{i}", "tech_score": 20 + i} for i in range(6)],
+    "condor_targets": [{"symbol": f"CO{i}", "tech_score": 5 + i} for i in range(4)],
+    "wheel_targets": ["F", "PLTR", "BRK/B"],
+    "survivor_targets": [],
+    "short_targets": [{"symbol": "SH0", "tech_score": 40}],
+}
+
+def fake_news(ticker):
+    time.sleep(random.uniform(0, 0.01))  # Shuffle completion order
+    h = sum(map(ord, ticker))
+    return {
+        "tier1": [f"- [Reuters] {ticker} story"] if h % 2 else [],
+        "tier2": [f"- [Forbes] {ticker} story"] if h % 3 else [],
+        "tier3": [f"- [Benzinga] {ticker} story"],
+    }
+
+def fake_reddit(ticker):
+    time.sleep(random.uniform(0, 0.01))
+    return f"- [r/stocks] {ticker} to the moon (50 pts)" if len(ticker) > 2 else None
+
+def fake_llama(ticker, strategy, content_text, source_type="news"):
+    time.sleep(random.uniform(0, 0.005))
+    return (sum(map(ord, content_text + source_type)) % 100) / 100.0, "Deterministic stub reason"
+
+class TestScoutPipeline(unittest.TestCase):
+    def run_scout_with(self, intel_workers, llm_workers):
+        out = os.path.join(self.tmp, f"out_{intel_workers}_{llm_workers}.json")
+        with patch.object(sector_scout_3, "INTEL_WORKERS", intel_workers), \
+             patch.object(sector_scout_3, "LLM_WORKERS", llm_workers), \
+             patch.object(sector_scout_3, "OUTPUT_FILE", out), \
+             patch.object(sector_scout_3, "RUN_METRICS_FILE", os.path.join(self.tmp, "metrics.jsonl")), \
+             patch.object(sector_scout_3, "WEBHOOK_OVERSEER", None), \
+             patch.object(sector_scout_3, "USE_VERDICT_CACHE", False), \
+             patch.object(sector_scout_3, "USE_NEWS_STORE", False), \
+             patch.object(sector_scout_3, "get_candidates", return_value=CANDIDATES), \
+             patch.object(sector_scout_3, "get_tiered_news", side_effect=fake_news), \
+             patch.object(sector_scout_3, "get_reddit_sentiment", side_effect=fake_reddit), \
+             patch.object(sector_scout_3, "ask_llama", side_effect=fake_llama), \
+             patch.object(sector_scout_3, "DELIVERY_MODE", "scp"), \
+             patch.object(sector_scout_3, "beam_to_beelink", return_value=True):
+            sector_scout_3.run_scout()
+        with open(out) as f:
+            data = json.load(f)
+        data.pop("updated")
+        return data
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def test_output_independent_of_concurrency(self):
+        baseline = self.run_scout_with(1, 1)
+        self.assertTrue(any(baseline[k] for k in baseline if k != "status"))
+        for intel, llm in [(4, 1), (8, 3), (2, 4)]:
+            self.assertEqual(self.run_scout_with(intel, llm), baseline)
+
+    def test_batch_mode_matches_single(self):
+        def fake_batch(jobs, strategy):
+            return [fake_llama(j['symbol'], strategy, j['content'], j['tier']) for j in jobs]
+
+        baseline = self.run_scout_with(2, 1)
+        with patch.object(sector_scout_3, "SCORING_MODE", "batch"), \
+             patch.object(sector_scout_3, "ask_llama_batch", side_effect=fake_batch) as batch:
+            self.assertEqual(self.run_scout_with(2, 2), baseline)
+        self.assertLess(batch.call_count, 14)
+
+    def test_consolidated_mode_matches_single(self):
+        def fake_consolidated(ticker, strategy, jobs):
+            return {st: fake_llama(ticker, strategy, txt, st) for st, txt in jobs}
+
+        baseline = self.run_scout_with(2, 1)
+        with patch.object(sector_scout_3, "SCORING_MODE", "consolidated"), \
+             patch.object(sector_scout_3, "ask_llama_consolidated", side_effect=fake_consolidated) as cons:
+            self.assertEqual(self.run_scout_with(2, 2), baseline)
+        self.assertEqual(cons.call_count, 13)   # One per ticker (BRK/B skipped)
+
+    def test_weighting_unchanged(self):
+        # Tech only: every other weight is reallocated to technicals
+        log_line, target = sector_scout_3.score_candidate(
+            "AAA", "trend_targets", 80, {"tier1": [], "tier2": [], "tier3": []}, None)
+        self.assertEqual(target["confidence"], 0.8)
+        self.assertIn("T1: N/A", log_line)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+
+import unittest
+from unittest.mock import patch, MagicMock
+import sector_scout_3
+from rate_limiter import TokenBucket
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+def post(title, score=50, text=""):
+    return {"data": {"title": title, "score": score, "selftext": text, "permalink": "/r/x/1"}}
+
+def response(status, children=(), headers=None):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.headers = headers or {}
+    resp.json.return_value = {"data": {"children": list(children)}}
+    return resp
+
+class TestTokenBucket(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.bucket = TokenBucket(rate=1.0, min_rate=0.1, max_rate=2.0, increase=0.5,
+                                  clock=self.clock, sleep=self.clock.sleep)
+
+    def test_spacing(self):
+        for _ in range(4):
+            self.bucket.acquire()
+        self.assertAlmostEqual(self.clock.now, 3.0)
+
+    def test_retry_after_pauses_and_halves(self):
+        self.bucket.acquire()
+        self.assertTrue(self.bucket.observe(429, {"Retry-After": "7"}))
+        self.assertEqual(self.bucket.rate, 0.5)
+        self.bucket.acquire()
+        self.assertAlmostEqual(self.clock.now, 7.0)
+        self.assertEqual(self.bucket.stats["throttled"], 1)
+
+    def test_remaining_budget_caps_rate(self):
+        self.bucket.observe(200, {"X-Ratelimit-Remaining": "3", "X-Ratelimit-Reset": "30"})
+        self.assertAlmostEqual(self.bucket.rate, 0.1)
+        self.bucket.observe(200, {"X-Ratelimit-Remaining": "0", "X-Ratelimit-Reset": "12"})
+        self.bucket.acquire()
+        self.assertGreaterEqual(self.clock.now, 12.0)
+
+    def test_recovers_after_clean_responses(self):
+        self.bucket.observe(429)
+        self.assertEqual(self.bucket.rate, 0.5)
+        for _ in range(3):
+            self.bucket.observe(200)
+        self.assertEqual(self.bucket.rate, 2.0)
+
+class TestRedditLimiting(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.limiter = TokenBucket(rate=10.0, clock=self.clock, sleep=self.clock.sleep)
+
+    @patch('sector_scout_3.HTTP.get')
+    def test_429_is_retried_not_skipped(self, mock_get):
+        mock_get.side_effect = [
+            response(429, headers={"Retry-After": "5"}),
+            response(200, [post("$AAPL breakout", 120)]),
+            response(200, [post("AAPL earnings thread", 80)]),
+            response(200, []),
+        ]
+        with patch.object(sector_scout_3, "REDDIT_LIMITER", self.limiter):
+            summary = sector_scout_3.get_reddit_sentiment("AAPL")
+        self.assertEqual(mock_get.call_count, 4)
+        self.assertIn("$AAPL breakout (120 pts)", summary)
+        self.assertGreaterEqual(self.clock.now, 5.0)
+
+    @patch('sector_scout_3.HTTP.get')
+    def test_batch_ambiguous_ticker_needs_dollar(self, mock_get):
+        mock_get.return_value = response(200, [
+            post("IT is ALL ON the line for NVDA", 200),
+            post("Loading $ON calls", 80),
+        ])
+        with patch.object(sector_scout_3, "REDDIT_LIMITER", self.limiter):
+            index = sector_scout_3.get_reddit_sentiment_batch(["NVDA", "ON", "IT", "ALL"], subs=["stocks"])
+        self.assertEqual([m['title'] for m in index["NVDA"]], ["IT is ALL ON the line for NVDA"])
+        self.assertEqual([m['title'] for m in index["ON"]], ["Loading $ON calls"])
+        self.assertEqual((index["IT"], index["ALL"]), ([], []))
+
+    @patch('sector_scout_3.HTTP.get')
+    def test_batch_query_fans_out(self, mock_get):
+        mock_get.return_value = response(200, [
+            post("$NVDA and $AMD both ripping", 300),
+            post("Why I sold $F", 40),
+            post("FOMO into nothing", 90),     # 'F' must not match inside FOMO
+            post("Sold F at the open", 60),    # Bare one-letter tickers only count with a $
+            post("low effort", 2, "$NVDA"),      # filtered by score
+        ])
+        with patch.object(sector_scout_3, "REDDIT_LIMITER", self.limiter):
+            index = sector_scout_3.get_reddit_sentiment_batch(["NVDA", "AMD", "F"], subs=["stocks"])
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertIn("$NVDA OR $AMD OR $F", mock_get.call_args.kwargs['params']['q'])
+        self.assertEqual([m['title'] for m in index["NVDA"]], ["$NVDA and $AMD both ripping"])
+        self.assertEqual(len(index["AMD"]), 1)
+        self.assertEqual([m['title'] for m in index["F"]], ["Why I sold $F"])
+
+        with patch.object(sector_scout_3, "reddit_index", index):
+            self.assertEqual(sector_scout_3.get_reddit_sentiment("F"), "- [r/stocks] Why I sold $F (40 pts)")
+            self.assertIsNone(sector_scout_3.get_reddit_sentiment("TSLA"))
+
+if __name__ == '__main__':
+    unittest.main()
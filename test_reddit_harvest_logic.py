@@ -0,0 +1,49 @@
+
+import unittest
+from unittest.mock import patch, MagicMock
+import sector_scout_3
+from rate_limiter import TokenBucket
+
+def listing(posts, after=None):
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.headers = {}
+    resp.json.return_value = {"data": {"after": after, "children": [
+        {"data": {"title": t, "score": s, "selftext": body, "permalink": f"/r/x/{t[:8]}"}}
+        for t, s, body in posts
+    ]}}
+    return resp
+
+class TestRedditHarvest(unittest.TestCase):
+    def setUp(self):
+        self.limiter = TokenBucket(rate=1000.0, sleep=lambda s: None)
+
+    def test_matcher_rules(self):
+        m = sector_scout_3.ticker_matcher(["AAPL", "F", "ON", "AMD"], bare_min_len=2,
+                                          ambiguous=sector_scout_3.AMBIGUOUS_TICKERS)
+        find = lambda text: sector_scout_3.find_tickers(m, text)
+        self.assertEqual(find("$AAPL vs AMD, turn ON the lights"), {"AAPL", "AMD"})
+        self.assertEqual(find("Loaded $F and $ON calls"), {"F", "ON"})
+        self.assertEqual(find("aapl lowercase, AAPLX, XAMD"), set())
+
+    @patch('sector_scout_3.HTTP.get')
+    def test_harvest_paginates_and_indexes(self, mock_get):
+        page1 = listing([("NVDA to the moon", 500, ""), ("Daily thread", 50, "holding $AMD")], after="t3_abc")
+        page2 = listing([("Sold my TSLA", 20, "")])
+        hot = listing([("NVDA to the moon", 500, ""), ("AMD earnings", 3, "")])
+        mock_get.side_effect = [page1, page2, hot]
+        with patch.object(sector_scout_3, "REDDIT_LIMITER", self.limiter):
+            index = sector_scout_3.harvest_reddit(["NVDA", "AMD", "TSLA", "PLTR"], subs=["stocks"], pages=3)
+
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(mock_get.call_args_list[1].kwargs['params']['after'], "t3_abc")
+        self.assertEqual(len(index["NVDA"]), 1)             # hot/new duplicate counted once
+        self.assertEqual([m['title'] for m in index["AMD"]], ["Daily thread"])
+        self.assertEqual(index["PLTR"], [])
+
+        with patch.object(sector_scout_3, "reddit_index", index), \
+             patch('sector_scout_3.HTTP.get', side_effect=AssertionError("network used")):
+            self.assertEqual(sector_scout_3.get_reddit_sentiment("TSLA"), "- [r/stocks] Sold my TSLA (20 pts)")
+
+if __name__ == '__main__':
+    unittest.main()
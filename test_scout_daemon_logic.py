@@ -0,0 +1,75 @@
+import unittest
+from unittest.mock import patch
+import threading
+import market_scanner
+from scout_daemon import ScoutDaemon, trigger
+
+class TestScoutDaemon(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.active = 0
+        self.overlap = False
+        self.lock = threading.Lock()
+
+    def job(self, name, result=None, error=None):
+        def run(daemon):
+            with self.lock:
+                self.active += 1
+                self.overlap |= self.active > 1
+            daemon.resources.setdefault("warm", object())   # Survives between runs
+            self.calls.append((name, id(daemon.resources["warm"])))
+            with self.lock:
+                self.active -= 1
+            if error:
+                raise error
+            return result
+        return run
+
+    def daemon(self, **runners):
+        d = ScoutDaemon(port=0, runners=runners, warm=False).start()
+        self.addCleanup(d.stop)
+        return d
+
+    def test_session_runs_dragnet_then_scout_with_resident_state(self):
+        d = self.daemon(dragnet=self.job("dragnet"), scout=self.job("scout"))
+        host, port = d.address
+        first = trigger("session", host, port)
+        second = trigger("scout", host, port)
+        self.assertTrue(first["ok"])
+        self.assertEqual([r["job"] for r in first["runs"]], ["dragnet", "scout"])
+        self.assertTrue(second["ok"])
+        self.assertEqual([c[0] for c in self.calls], ["dragnet", "scout", "scout"])
+        self.assertEqual(len({c[1] for c in self.calls}), 1)
+        status = trigger("status", host, port)
+        self.assertEqual(status["runs"], {"dragnet": 1, "scout": 2})
+        self.assertFalse(status["busy"])
+
+    def test_runs_are_serialized(self):
+        d = self.daemon(scout=self.job("scout"))
+        host, port = d.address
+        threads = [threading.Thread(target=trigger, args=("scout", host, port)) for _ in range(4)]
+        for t in threads: t.start()
+        for t in threads: t.join(10)
+        self.assertEqual(len(self.calls), 4)
+        self.assertFalse(self.overlap)
+
+    def test_errors_and_gatekeeper_reported(self):
+        d = self.daemon(dragnet=self.job("dragnet", result=False), scout=self.job("scout", error=ValueError("boom")))
+        host, port = d.address
+        with patch("traceback.print_exc"):
+            self.assertEqual(trigger("dragnet", host, port)["skipped"], "gatekeeper")
+            reply = trigger("scout", host, port)
+        self.assertFalse(reply["ok"])
+        self.assertIn("boom", reply["error"])
+        self.assertFalse(trigger("reboot", host, port)["ok"])
+        self.assertTrue(trigger("status", host, port)["ok"])   # Still serving
+
+    def test_run_dragnet_returns_instead_of_exiting(self):
+        with patch.object(market_scanner, "is_mission_time", return_value=False), \
+             patch.object(market_scanner, "get_alpaca_client") as client:
+            self.assertIs(market_scanner.run_dragnet(), False)
+        client.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+import os
+import json
+import time
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+import telemetry
+
+class TestTelemetry(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), "metrics.jsonl")
+        telemetry.start_run("test")
+
+    def test_instrument_counts_calls_errors_and_time(self):
+        @telemetry.instrument("fetch")
+        def fetch(x):
+            time.sleep(0.02)
+            if x < 0:
+                raise ValueError("bad")
+            return x
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            self.assertEqual(list(pool.map(fetch, range(4))), [0, 1, 2, 3])
+        with self.assertRaises(ValueError):
+            fetch(-1)
+        telemetry.count("fetch", retries=2, cache_hits=1, bytes_in=100)
+
+        st = telemetry.current().snapshot()["stages"]["fetch"]
+        self.assertEqual((st["calls"], st["errors"], st["retries"], st["cache_hits"], st["bytes_in"]),
+                         (5, 1, 2, 1, 100))
+        self.assertGreaterEqual(st["busy_s"], 0.1)
+        self.assertLess(st["wall_s"], st["busy_s"])   # Threaded calls overlap
+        self.assertEqual(fetch.__name__, "fetch")
+
+    def test_stage_block_and_http_stats(self):
+        with telemetry.stage("earnings_guard"):
+            pass
+        telemetry.add_http_stats({"www.reddit.com": {"bytes_in": 500, "bytes_out": 20, "retries": 1}},
+                                 {"www.reddit.com": "reddit", "localhost:11434": "llm"})
+        stages = telemetry.current().snapshot()["stages"]
+        self.assertEqual(stages["earnings_guard"]["calls"], 1)
+        self.assertEqual(stages["reddit"]["bytes_in"], 500)
+        self.assertNotIn("llm", stages)
+        self.assertNotIn("bytes_in", stages["earnings_guard"])   # Not measured, so not reported as 0
+
+    def test_jsonl_runs_and_regressions(self):
+        for wall in (1.0, 1.1, 0.9, 1.0):
+            telemetry.start_run("scout")
+            telemetry.current().record("ask_llama", 0.0, wall)
+            telemetry.current().record("get_tiered_news", 0.0, 0.5)
+            telemetry.finish_run(self.path, approved=3)
+        telemetry.start_run("scout")
+        telemetry.current().record("ask_llama", 0.0, 4.0)
+        telemetry.current().record("get_tiered_news", 0.0, 0.5)
+        telemetry.finish_run(self.path)
+        with open(self.path, 'a') as f:
+            f.write('{"run": "scout", "stag')   # Torn line is skipped
+
+        runs = telemetry.load_runs(self.path, "scout")
+        self.assertEqual(len(runs), 5)
+        self.assertEqual(runs[0]["approved"], 3)
+        flagged = telemetry.regressions(runs)
+        self.assertEqual([name for name, _, _ in flagged], ["ask_llama"])
+        table = telemetry.summarize(runs)
+        self.assertIn("ask_llama", table)
+        self.assertIn("TOTAL", table)
+
+    def test_scout_run_writes_metrics(self):
+        import test_pipeline_logic
+        case = test_pipeline_logic.TestScoutPipeline()
+        case.setUp()
+        case.run_scout_with(2, 1)
+        runs = telemetry.load_runs(os.path.join(case.tmp, "metrics.jsonl"))
+        self.assertEqual([r["run"] for r in runs], ["scout"])
+        self.assertIn("analyzed", runs[0])
+    def test_dragnet_without_client_still_writes_a_row(self):
+        import market_scanner
+        with patch.object(market_scanner, "is_mission_time", return_value=True), \
+             patch.object(market_scanner, "get_alpaca_client", return_value=None), \
+             patch.object(market_scanner, "RUN_METRICS_FILE", self.path):
+            self.assertIsNone(market_scanner.run_dragnet())
+        runs = telemetry.load_runs(self.path)
+        self.assertEqual([(r["run"], r["error"]) for r in runs], [("dragnet", "no client")])
+
+
+if __name__ == '__main__':
+    unittest.main()
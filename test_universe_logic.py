@@ -0,0 +1,76 @@
+
+import unittest
+import os
+import tempfile
+from types import SimpleNamespace
+from unittest.mock import patch
+import market_scanner
+from universe_snapshot import (UniverseSnapshot, SCANNER_PROFILES, TRADABLE, SHORTABLE,
+                               EASY_TO_BORROW, CLEAN_SYMBOL)
+
+def asset(symbol, tradable=True, marginable=True, shortable=True, easy_to_borrow=False):
+    return SimpleNamespace(symbol=symbol, tradable=tradable, marginable=marginable,
+                           shortable=shortable, easy_to_borrow=easy_to_borrow, fractionable=True)
+
+class FakeTradingClient:
+    def __init__(self, assets, fail=0):
+        self.assets = assets
+        self.fail = fail
+        self.calls = 0
+
+    def get_all_assets(self, req):
+        self.calls += 1
+        if self.fail:
+            self.fail -= 1
+            raise ConnectionError("alpaca down")
+        return self.assets
+
+ASSETS = [
+    asset("AAPL", easy_to_borrow=True), asset("BRK.B"), asset("GME", marginable=False),
+    asset("OTC", tradable=False), asset("NOSHORT", shortable=False), asset("MSFT"),
+]
+
+class TestUniverseSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), "universe.json")
+
+    def test_profiles_match_original_filter(self):
+        snap = UniverseSnapshot.from_assets(ASSETS)
+        original = sorted(a.symbol for a in ASSETS
+                          if a.tradable and a.marginable and a.shortable and "." not in a.symbol)
+        self.assertEqual(snap.profile("dragnet"), original)
+        self.assertEqual(snap.select(TRADABLE | SHORTABLE | EASY_TO_BORROW | CLEAN_SYMBOL), ["AAPL"])
+        self.assertIn("GME", snap.profile("short_squeeze"))
+        self.assertIn("NOSHORT", snap.profile("long_only"))
+
+    def test_roundtrip_and_diff(self):
+        snap = UniverseSnapshot.from_assets(ASSETS, fetched=1000.0)
+        snap.save(self.path)
+        loaded = UniverseSnapshot.load(self.path)
+        self.assertEqual(list(loaded.symbols), list(snap.symbols))
+        self.assertEqual(list(loaded.flags), list(snap.flags))
+        newer = UniverseSnapshot.from_assets(ASSETS[1:] + [asset("NVDA"), asset("OTC")])
+        self.assertEqual(newer.diff(loaded), (["NVDA"], ["AAPL"], ["OTC"]))
+
+    @patch('market_scanner.time.sleep')
+    def test_get_market_universe_uses_fresh_snapshot(self, _sleep):
+        client = FakeTradingClient(ASSETS)
+        first = market_scanner.get_market_universe(client, snapshot_file=self.path)
+        second = market_scanner.get_market_universe(client, snapshot_file=self.path)
+        self.assertEqual(first, ["AAPL", "MSFT"])
+        self.assertEqual(second, first)
+        self.assertEqual(client.calls, 1)
+
+    @patch('market_scanner.time.sleep')
+    def test_stale_snapshot_is_fallback(self, _sleep):
+        UniverseSnapshot.from_assets(ASSETS, fetched=0.0).save(self.path)
+        client = FakeTradingClient(ASSETS, fail=3)
+        self.assertEqual(market_scanner.get_market_universe(client, snapshot_file=self.path), ["AAPL", "MSFT"])
+        self.assertEqual(client.calls, 3)
+
+        os.remove(self.path)
+        client = FakeTradingClient(ASSETS, fail=3)
+        self.assertEqual(market_scanner.get_market_universe(client, snapshot_file=self.path), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import os
+import json
+import time
+import base64
+import numpy as np
+
+# --- CONFIGURATION ---
+UNIVERSE_FILE = "universe_snapshot.json"
+MAX_AGE_HOURS = 20       # Refresh once per trading day
+
+# --- ASSET FLAGS (one bit each, packed into a uint8 per symbol) ---
+TRADABLE = 1
+MARGINABLE = 2
+SHORTABLE = 4
+EASY_TO_BORROW = 8
+FRACTIONABLE = 16
+CLEAN_SYMBOL = 32        # No '.' or '/' (share classes, warrants, crypto pairs)
+
+# Precomputed predicates for each scanner profile: a symbol passes if it has every required bit
+SCANNER_PROFILES = {
+    "dragnet": TRADABLE | MARGINABLE | SHORTABLE | CLEAN_SYMBOL,   # The original filter
+    "long_only": TRADABLE | CLEAN_SYMBOL,
+    "short_squeeze": TRADABLE | SHORTABLE | CLEAN_SYMBOL,
+    "easy_short": TRADABLE | SHORTABLE | EASY_TO_BORROW | CLEAN_SYMBOL,
+}
+
+
+def asset_flags(asset):
+    flags = 0
+    if getattr(asset, "tradable", False): flags |= TRADABLE
+    if getattr(asset, "marginable", False): flags |= MARGINABLE
+    if getattr(asset, "shortable", False): flags |= SHORTABLE
+    if getattr(asset, "easy_to_borrow", False): flags |= EASY_TO_BORROW
+    if getattr(asset, "fractionable", False): flags |= FRACTIONABLE
+    if "." not in asset.symbol and "/" not in asset.symbol: flags |= CLEAN_SYMBOL
+    return flags
+
+
+class UniverseSnapshot:
+    """
+    Compact on-disk copy of the Alpaca asset list: sorted symbols plus one
+    flag byte each, so any profile is a single vectorized mask.
+    """
+
+    def __init__(self, symbols, flags, fetched=None):
+        order = np.argsort(np.asarray(symbols, dtype=object)) if len(symbols) else []
+        self.symbols = np.asarray(symbols, dtype=object)[order] if len(symbols) else np.array([], dtype=object)
+        self.flags = np.asarray(flags, dtype=np.uint8)[order] if len(symbols) else np.array([], dtype=np.uint8)
+        self.fetched = fetched if fetched is not None else time.time()
+
+    def __len__(self):
+        return len(self.symbols)
+
+    @classmethod
+    def from_assets(cls, assets, fetched=None):
+        symbols, flags = [], []
+        for a in assets:
+            symbols.append(a.symbol)
+            flags.append(asset_flags(a))
+        return cls(symbols, flags, fetched)
+
+    # --- Persistence ---
+    def save(self, path=UNIVERSE_FILE):
+        payload = {
+            "version": 1,
+            "fetched": self.fetched,
+            "symbols": ",".join(self.symbols),
+            "flags": base64.b64encode(self.flags.tobytes()).decode("ascii"),
+        }
+        tmp = path + ".tmp"
+        with open(tmp, 'w') as f:
+            json.dump(payload, f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path=UNIVERSE_FILE):
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r') as f:
+                payload = json.load(f)
+            symbols = payload["symbols"].split(",") if payload["symbols"] else []
+            flags = np.frombuffer(base64.b64decode(payload["flags"]), dtype=np.uint8)
+            if len(flags) != len(symbols):
+                return None
+            return cls(symbols, flags, payload["fetched"])
+        except (OSError, ValueError, KeyError):
+            return None
+
+    # --- Queries ---
+    def age_hours(self, now=None):
+        return ((now or time.time()) - self.fetched) / 3600
+
+    def is_stale(self, max_age_hours=MAX_AGE_HOURS, now=None):
+        return self.age_hours(now) >= max_age_hours
+
+    def mask(self, require, forbid=0):
+        return ((self.flags & require) == require) & ((self.flags & forbid) == 0)
+
+    def select(self, require, forbid=0):
+        """Symbols having every bit in `require` and none in `forbid`."""
+        return list(self.symbols[self.mask(require, forbid)])
+
+    def profile(self, name):
+        return self.select(SCANNER_PROFILES[name])
+
+    def diff(self, older):
+        """(added, removed, changed) symbols relative to an older snapshot."""
+        new = dict(zip(self.symbols, self.flags))
+        old = dict(zip(older.symbols, older.flags))
+        added = sorted(set(new) - set(old))
+        removed = sorted(set(old) - set(new))
+        changed = sorted(s for s in set(new) & set(old) if new[s] != old[s])
+        return added, removed, changed